@@ -1,10 +1,18 @@
 import os
+import sys
 import subprocess
+import traceback
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 import maya.cmds as cmds
 import maya.api.OpenMaya as om2
-import maya.api.OpenMayaUI as omui
-import maya.OpenMayaUI as OpenMayaUI
 import maya.mel as mel
+import maya.utils
+
+import SSCameraSwitcherCore
+import SSCameraSwitcherWorker
+import SSCameraSwitcherPost
+from SSCameraSwitcherCore import *
 
 try:
     from PySide2 import QtWidgets,QtGui,QtCore
@@ -14,575 +22,7 @@ except:
     from PySide6 import QtWidgets,QtGui,QtCore
     qaction = QtGui.QAction
 
-##--------------------------------------------------------
-##--------------------------------------------------------
-
-def saveDictOptionVar(toolName,optionDict):
-    optionString= ""
-
-    for key in optionDict:
-        if optionString != "":
-            optionString += ";"
-    
-        optionString += key + ";" + str(optionDict[key])
-
-    cmds.optionVar(stringValue = [toolName,optionString])
-
-
-def readDictOptionVar(toolName):
-    optionString = ""
-    if cmds.optionVar(exists = toolName):
-        optionString = cmds.optionVar(q = toolName)
-    
-    optionDict = {}
-
-    optionArray = optionString.split(";")
-    if len(optionArray) > 1:
-        for i in range(0,len(optionArray),2):
-            optionDict[optionArray[i]] = optionArray[i+1]
-
-    return optionDict
-
-class ApplyFunc(object):
-    def __init__(self, func, *args, **kwargs):
-        self.__func = func
-        self.__args = args
-        self.__kwargs = kwargs
-                        
-    def __call__(self, *args, **kwargs):
-        error = None        
-        try:
-            cmds.undoInfo(openChunk =True)
-
-            self.__func(*self.__args, **self.__kwargs)			
-                        
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-
-        finally:            
-            cmds.undoInfo(closeChunk =True)
-##--------------------------------------------------------
-## MARK: scene info
-##--------------------------------------------------------
-def getDagNode(target):
-    try:
-        sellist = om.MGlobal.getSelectionListByName(target)
-        return sellist.getDagPath(0)
-    except:
-        return None
-    
-def getFullPathName(target):
-    if type(getDagNode(target)) != om.MDagPath:
-        return target
-
-    return om.MFnDagNode(getDagNode(target).node()).fullPathName()
-
-def getTransformNode(targets,fullpath = False):
-    transfromNodes = []
-    
-    for target in targets:
-        nodeTypes = cmds.nodeType(target,inherited = True)
-        transfromNode = None
-        if "transform" in nodeTypes:
-            transfromNode = target
-        
-        elif "shape" in nodeTypes:
-            parent = cmds.listRelatives(target, p =True,f=fullpath)[0]
-            transfromNode = parent
-
-        if transfromNode not in transfromNodes:
-            transfromNodes.append(transfromNode)
-    
-    return transfromNodes
-
-def getIKJointChain(ikHandle,fullpath):
-    ikHandleDag = getDagNode(ikHandle)    
-    ikHandleDnFn = om.MFnDependencyNode(ikHandleDag.node())
-    
-    if fullpath:
-        startJoint = om.MFnDagNode(ikHandleDnFn.findPlug('startJoint', False).source().node()).fullPathName()
-        effector = om.MFnDagNode(ikHandleDnFn.findPlug('endEffector', False).source().node()).fullPathName()
-
-        effectorDag = getDagNode(effector)
-        effectorDnFn = om.MFnDependencyNode(effectorDag.node())
-        endJoint = om.MFnDagNode(effectorDnFn.findPlug('offsetParentMatrix', False).source().node()).fullPathName()
-    
-    else:
-        startJoint = om.MFnDagNode(ikHandleDnFn.findPlug('startJoint', False).source().node()).name()
-        effector = om.MFnDagNode(ikHandleDnFn.findPlug('endEffector', False).source().node()).name()
-
-        effectorDag = getDagNode(effector)
-        effectorDnFn = om.MFnDependencyNode(effectorDag.node())
-        endJoint = om.MFnDagNode(effectorDnFn.findPlug('offsetParentMatrix', False).source().node()).name()
-
-    jointChain = getCurHierarchy(endJoint,startJoint,fullpath)
-
-    return jointChain
-
-def subIgnorTypeNodes(nodes,ignorNodeTypes,topNode,fullpath):
-        for ignorType in ignorNodeTypes:
-            nodes = list(set(nodes) - set(listTypeNodes(ignorType,topNode,fullpath)))
-
-        return nodes
-
-def listTypeNodes(nodeType,topNode = None, fullpath = False,ignorNodeTypes =[],nameSpace = None):
-    defaultNodes = cmds.ls(defaultNodes =True, l= fullpath)
-
-    if fullpath:
-        topNode = getFullPathName(topNode)
-    
-    nodes = []    
-    if nodeType == "transform":
-        nodes = cmds.ls(type = nodeType, l= fullpath) or []
-
-    elif nodeType == "noShapeTransform":
-        nodes = listTypeNodes("transform",topNode,fullpath)
-        
-        shapes = cmds.ls(shapes =True, l = fullpath)        
-        removeNodes = getTransformNode(shapes,fullpath)
-        nodes = list(set(nodes) - set(removeNodes))
-
-    elif nodeType == "locator":
-        nodes = cmds.ls(type = nodeType, l= fullpath) or []
-        nodes = getTransformNode(nodes,fullpath)
-        
-    elif nodeType == "joint":
-        nodes = cmds.ls(type = nodeType, l= fullpath) or []
-
-    elif nodeType == "IKJoints":
-        ikHandles = cmds.ls(type = "ikHandle", l= fullpath) or []
-        
-        for ikHandle in ikHandles:
-            jointChain = getIKJointChain(ikHandle,fullpath)
-            nodes.extend(jointChain)
-
-    elif nodeType == "constraint":
-        nodes = cmds.ls(type = nodeType, l= fullpath) or []
-
-    elif nodeType == "mesh" or nodeType == "nurbsCurve" or nodeType == "nurbsSurface":
-        nodes = cmds.ls(type = nodeType, l= fullpath) or []
-        nodes = getTransformNode(nodes,fullpath)
-
-    elif nodeType == "camera":
-        nodes = cmds.ls(type = nodeType, l= fullpath) or []
-        nodes = getTransformNode(nodes,fullpath)
-
-    elif nodeType == "light":
-        nodes = cmds.ls(type = nodeType, l= fullpath) or []
-        nodes = getTransformNode(nodes,fullpath)
-
-    else:
-        nodes = cmds.ls(type = nodeType, l= fullpath) or []
-
-    if topNode != None:
-        allHierarchy = cmds.listRelatives(topNode,ad =True,f=fullpath) or []
-        allHierarchy.append(topNode)
-        nodes = list(set(nodes) & set(allHierarchy))
-
-    nodes = subIgnorTypeNodes(nodes,ignorNodeTypes,topNode,fullpath)
-    nodes = list(set(nodes) - set(defaultNodes))
-
-    if nameSpace != None:
-        tempNodes= []
-        for node in nodes:
-            if node.startswith(nameSpace +":"):
-                tempNodes.append(node)
-        nodes = tempNodes
-    return nodes
-
-def getFrameRange(rangeFrom):
-    if rangeFrom == "animation":
-        start = cmds.playbackOptions(q =True, animationStartTime=True)
-        end = cmds.playbackOptions(q =True, animationEndTime=True)
-
-    elif rangeFrom == "timeSlider":
-        start = cmds.playbackOptions(q =True, minTime=True)
-        end = cmds.playbackOptions(q =True, maxTime=True)
-
-    elif rangeFrom == "renderSetting":
-        start = cmds.getAttr("defaultRenderGlobals.startFrame")
-        end = cmds.getAttr("defaultRenderGlobals.endFrame")
-
-    elif rangeFrom == "selection":
-        aPlayBackSliderPython = mel.eval('$tmpVar=$gPlayBackSlider')
-        s_e = cmds.timeControl(aPlayBackSliderPython, q=True, rangeArray=True)
-        start = s_e[0]
-        end = s_e[1]
-
-    return start,end
-
-def getCamAttrDict():
-    start,end = getFrameRange("animation")
-    CAMATTRS = [
-        {"attrName":"startFrame","type":"double","default":start, "min":-10000,"max":10000},
-        {"attrName":"endFrame","type":"double","default":end, "min":-10000,"max":10000},
-        # {"attrName":"resolutionW","type":"long","default":cmds.getAttr("defaultResolution.width"), "min":1,"max":100000},
-        # {"attrName":"resolutionH","type":"long","default":cmds.getAttr("defaultResolution.height"), "min":1,"max":100000},
-        {"attrName":"playblast","type":"bool","default":False},
-    ]
-
-    return CAMATTRS
-
-def setCameraInfo(node,valueDict):
-    for attrDict in getCamAttrDict():
-        attrName = attrDict["attrName"]
-        attrType = attrDict["type"]
-        
-
-        if valueDict == None:
-            value = attrDict["default"]
-
-        elif attrName not in list(valueDict.keys()):
-            continue
-        
-        if valueDict != None and attrName in list(valueDict.keys()):
-            value = valueDict[attrName]
-
-
-        if cmds.objExists(node+ "."+ attrName) == False:
-            if attrDict["type"] == "double":
-                value = float(value)
-
-            elif attrDict["type"] == "long":
-                value = int(value)
-
-            elif attrDict["type"] == "bool":
-                value = bool(value)
-
-            cmds.addAttr(node, at = attrType, ln = attrName,dv = value)
-
-        cmds.setAttr(node + "." + attrName,value)
-
-def createCameraInfoNode(rootsetName,cameraname):
-
-    if cmds.objExists(rootsetName) == False:
-        cmds.sets(name = rootsetName,empty =True)
-
-    if cmds.objExists(cameraname + "_infoSet",) == False:
-        cmds.sets(name = cameraname + "_infoSet",empty=True)
-        cmds.sets(cameraname + "_infoSet",forceElement = rootsetName)
-        setCameraInfo(cameraname + "_infoSet",None)
-
-    return cameraname + "_infoSet"
-
-def findAttrInfo(attrName):
-    for attrDict in getCamAttrDict():
-        if attrDict["attrName"] == attrName:
-            return attrDict
-    
-    return {}
-
-def getCameraInfo(rootsetName,cameraname):
-    node = createCameraInfoNode(rootsetName,cameraname)
-    valueDict = {}
-
-    for attrDict in getCamAttrDict():
-        attrName = attrDict["attrName"]
-
-        if cmds.objExists(node+ "."+ attrName) == False:
-            value = attrDict["default"]
-        else:
-            value = cmds.getAttr(node + "." +attrName)
-
-        valueDict[attrName] = value
-    
-    return valueDict
-
-def getPlayblastCam(rootsetName):
-
-    enabledCameras = []
-
-    if cmds.objExists(rootsetName) == False:
-        return []
-    
-    cameraSets = cmds.sets(rootsetName,q=True)
-
-    for cameraSet in cameraSets:
-        if cmds.objExists(cameraSet + ".playblast"):
-            if cmds.getAttr(cameraSet + ".playblast"):
-                enabledCameras.append(cameraSet.replace("_infoSet",""))
-
-    return enabledCameras
-
-
-def getCurSceneName():
-    fullPath = cmds.file(q=True, sn=True)
-    fileName = os.path.basename(fullPath)
-    filePath = os.path.dirname(fullPath)
-
-    if filePath != "":
-        filePath += "/"
-        
-    fileNameBody, extension = os.path.splitext(fileName)
-    
-    return filePath,fileNameBody,extension
-
-def generateOutputName(camera,fileNameFormat):
-    filePath,fileNameBody,extension = getCurSceneName()
-
-    fileNameParts = {
-                        "scene":fileNameBody,
-                        "camera":camera
-                        # "version":str(version).zfill(4)
-    }
-    fileName = fileNameFormat.format(**fileNameParts)
-    return fileName
-
-def checkNeedSave():
-    fileCheckState = cmds.file(q=True, modified=True)
-    curOpen = cmds.file(q=True, sn=True)
-
-    if curOpen == "":
-        curOpen = "untitled"
-
-    if fileCheckState:
-        mel.eval("checkForUnknownNodes();")
-        saved = mel.eval("saveChanges(\"\");")
-
-        if saved == 0:
-            return False
-
-    return True
-
-##----------------------------------------------------------------------------------
-##MARK:playblast
-##----------------------------------------------------------------------------------
-def createShotNode(cameraname,cutName,timeRange):    
-    shotNode = cmds.shot(cutName, startTime=timeRange[0], endTime = timeRange[1],sequenceStartTime = 1,currentCamera = cameraname)
-
-    if cmds.objExists(cameraname + ".startFrame"):
-        cmds.connectAttr(cameraname + ".startFrame",shotNode + ".startFrame")
-        cmds.connectAttr(cameraname + ".endFrame",shotNode + ".endFrame")
-
-    return shotNode
-
-def getFrames(startFrame,endFrame,byFrame):
-    frames = []
-    for i in range(int(startFrame),int(endFrame) +1,int(byFrame)):
-        frames.append(i)
-
-    return frames
-
-def excutePlayBlast(viewItemOption,camera,outputPath,outputFormat,timeRange,resolution,frameNumberOffset,nodes =None,panel = None):
-    cmds.select(cl = True)
-    window = None
-    
-    if panel == None:
-        window,panel = createTmpView()
-        cmds.modelEditor(panel, edit=True, **viewItemOption)
-
-    cmds.modelEditor(panel, edit=True, camera=camera)
-
-    if nodes != None:
-        setIsolateView(panel,nodes)
-
-    compressionDict = {
-                            "png":["png","image"],
-                            "jpg":["jpg","image"],
-                            "avi":["none","movie"]
-                        }
-    
-    outputPath = outputPath.replace("//","/")
-
-    if frameNumberOffset:
-        cmds.playblast(
-                    filename =          outputPath,
-                    forceOverwrite =    True,
-                    format =            compressionDict[outputFormat][1],
-                    compression =       compressionDict[outputFormat][0],
-                    sequenceTime =      True,
-                    clearCache =        1,
-                    viewer =            False,
-                    showOrnaments =     True,
-                    offScreen =         True,
-                    fp = 4, 
-                    percent = 100,
-                    quality = 100,
-                    startTime =         timeRange[0],
-                    endTime =           timeRange[1],
-                    widthHeight =       resolution,
-                    editorPanelName =   panel,                    
-                )
-    else:
-        cmds.playblast(
-                    filename =          outputPath,
-                    forceOverwrite =    True,
-                    format =            compressionDict[outputFormat][1],
-                    compression =       compressionDict[outputFormat][0],
-                    sequenceTime =      0,
-                    clearCache =        1,
-                    viewer =            False,
-                    showOrnaments =     True,
-                    offScreen =         True,
-                    fp = 4, 
-                    percent = 100,
-                    quality = 100,
-                    startTime =         timeRange[0],
-                    endTime =           timeRange[1],
-                    widthHeight =       resolution,
-                    editorPanelName =   panel,                    
-                )
-
-    cmds.isolateSelect(panel,state = False)
-
-    if window != None:
-        cmds.deleteUI(window)
-
-def playBlastProcess(camera,viewItemOption,showHUDs,outputPath,outputFormat,timeRange,resolution,frameNumberOffset):
-    displayResolution,overscan,curHUDs = getCurViewSetting(camera)
-    prepareViewSetting(camera,showHUDs["resolutionGate"],showHUDs,viewItemOption["headsUpDisplay"])
-
-    if frameNumberOffset:        
-        if cmds.objExists("playblastTmpSeq"):
-            cmds.delete("playblastTmpSeq")
-
-        shotNode = createShotNode(camera,"playblastTmpSeq",timeRange)
-        timeRange[0] = cmds.getAttr(shotNode + ".sequenceStartFrame")
-        timeRange[1] = cmds.getAttr(shotNode + ".sequenceEndFrame")
-
-    try:
-        excutePlayBlast(viewItemOption,camera,outputPath,outputFormat,timeRange,resolution,frameNumberOffset,nodes =None,panel = None)
-    except:
-        pass
-    
-    if cmds.objExists("playblastTmpSeq"):
-        cmds.delete("playblastTmpSeq")
-
-    restoreViewSetting(camera,displayResolution,overscan,curHUDs)
-
-##----------------------------------------------------------------------------------
-##MARK:viewPort
-##----------------------------------------------------------------------------------
-
-def getCurViewPanel():
-    return OpenMayaUI.MQtUtil.fullName(int(omui.M3dView.active3dView().widget())).split("|")[-2]
-
-def changeView(cameraName,viewPort):
-    if cmds.objExists(cameraName) == False:
-        return
-
-    if viewPort == None:
-        viewPort = getCurViewPanel()
-
-    cmds.modelEditor(viewPort, edit=True, camera=cameraName)
-    cmds.refresh()
-
-def getView(panelName):    
-    if cmds.modelPanel(panelName, exists =True) == False:
-        return None
-
-    if panelName not in cmds.getPanel(visiblePanels=True) or []:
-        return None
-    
-    return omui.M3dView.getM3dViewFromModelPanel(panelName)
-                
-def setIsolateView(panelName,nodes):
-    cmds.isolateSelect(panelName,state = False)        
-    cmds.isolateSelect(panelName,state = True)
-    
-    for node in nodes:
-        cmds.isolateSelect(panelName,addDagObject = node)
-
-def createTmpView():
-    if cmds.window('playblastTmp',q=True, ex =True):
-        cmds.deleteUI('playblastTmp')
-
-    window = cmds.window('playblastTmp')
-    mainLayout = cmds.formLayout(window)
-    panel = cmds.modelEditor()
-    cmds.formLayout(mainLayout, e=True,
-                                attachForm=[(panel, "top", 0),(panel, "left", 0), 
-                                    (panel, "bottom", 0), (panel, "right", 0)]) 
-    cmds.showWindow(window)
-    return window,panel
-
-def getCurHUDItems():
-    showItems = []
-    items = cmds.headsUpDisplay(listHeadsUpDisplays =True)
-    for item in items:
-        if cmds.headsUpDisplay(item, q = True, vis = True):
-            showItems.append(item)
-
-    return showItems
-
-def hideAllHUDTtems():
-    items = cmds.headsUpDisplay(listHeadsUpDisplays =True)
-
-    for item in items:
-        cmds.headsUpDisplay(item, e = True, vis = False) 
-
-def setHUDItems(setNames):
-    HUDDict = {
-            "objectDetails":            ["HUDObjDetBackfaces","HUDObjDetSmoothness","HUDObjDetInstance","HUDObjDetDispLayer","HUDObjDetDistFromCm","HUDObjDetNumSelObjs"],
-            "polyCount":                ["HUDPolyCountVerts","HUDPolyCountEdges","HUDPolyCountFaces","HUDPolyCountTriangles","HUDPolyCountUVs"],
-            "particleCount":            ["HUDParticleCount"],
-            "subdDetails":              ["HUDSubdLevel","HUDSubdMode"],
-            "viewportRenderer":         ["HUDViewportRenderer"],
-            "symmetry":                 ["HUDSymmetry"],
-            "capsLock":                 ["HUDCapsLock"],
-            "cameraNames":              ["HUDCameraNames"],
-            "focalLength":              ["HUDFocalLength"],
-            "frameRate":                ["HUDFrameRate"],
-            "materialLoadingDetails":   ["HUDLoadingTextures","HUDLoadingMaterials"],
-            "currentFrame":             ["HUDCurrentFrame"],
-            "sceneTimecode":            ["HUDSceneTimecode"],
-            "currentContainer":         ["HUDCurrentContainer"],
-            "viewAxis":                 ["HUDViewAxis"],
-            "HikDetails":               ["HUDHikKeyingMode"],
-            "selectDetails":            ["HUDSoftSelectState"],
-            "animationDetails":         ["HUDIKSolverState","HUDCurrentCharacter","HUDPlaybackSpeed","HUDSoftSelectState"],
-            "toolMessage":              ["HUDSoftSelectState"],
-            "XGenHUD":                  ["HUDSoftSelectState","HUDXGenSplinesCount","HUDXGenGPUMemory"],
-            "evaluationManagerHUD":     ["HUDGPUOverride","HUDEMState","HUDEvaluation","HUDSoftSelectState"]
-    }
-
-    for key in setNames:
-        if key not in list(HUDDict.keys()):
-            continue
-
-        for item in HUDDict[key]:
-            if cmds.headsUpDisplay(item, exists = True) == False: 
-                continue
-
-            cmds.headsUpDisplay(item, e = True, vis = True) 
-
-def getCurViewSetting(camera):
-    displayResolution = cmds.getAttr(camera + ".displayResolution")
-    overscan = cmds.getAttr(camera + ".overscan")
-    curHUDs = getCurHUDItems()
-    return displayResolution,overscan,curHUDs
-
-def prepareViewSetting(camera,resolutionGate,showHUDs,headsUpDisplay):
-    displayResolution,overscan,curHUDs = getCurViewSetting(camera)
-
-    hideAllHUDTtems()
-
-    showHUDItems = []
-
-    for HUDItem in list(showHUDs.keys()):
-        if showHUDs[HUDItem]:
-            showHUDItems.append(HUDItem)
-
-    if headsUpDisplay ==False:
-        cmds.setAttr(camera + ".displayResolution",False)
-        cmds.setAttr(camera + ".overscan",1.0)
-
-    elif headsUpDisplay == True and resolutionGate == False:
-        cmds.setAttr(camera + ".displayResolution",False)
-        cmds.setAttr(camera + ".overscan",1.0)
-
-    if resolutionGate == True and displayResolution == False:        
-        cmds.setAttr(camera + ".displayResolution",True)
-        cmds.setAttr(camera + ".overscan",1.3)
-
-    setHUDItems(showHUDItems)
-
-def restoreViewSetting(camera,displayResolution,overscan,curHUDs):
-    cmds.setAttr(camera + ".displayResolution",displayResolution)
-    cmds.setAttr(camera + ".overscan",overscan)
-    hideAllHUDTtems()
-    setHUDItems(curHUDs)
+SSCameraSwitcherCore.registerProfiledModule(sys.modules[__name__])
 
 ##----------------------------------------------------------------------------------
 ##MARK:GUI
@@ -610,31 +50,36 @@ class ListView(QtWidgets.QWidget):
 
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.view = QtWidgets.QListView()
-        self.model = QStandardItemModel()
+        self.view.setUniformItemSizes(True)
+        self.model = ListModel()
         self.view.setModel(self.model)
 
         self.layout.addWidget(self.view)
 
     def setData(self,data):
         self.view.selectionModel().blockSignals(True)
-        self.model.clear()        
-        for i in range(0,len(data)):
-            self.model.setItem(i, 0, QtGui.QStandardItem(data[i]))
+        self.model.setItems(data)
+        self.view.selectionModel().blockSignals(False)
 
+    def updateData(self,data):
+        self.view.selectionModel().blockSignals(True)
+        self.model.updateItems(data)
         self.view.selectionModel().blockSignals(False)
 
+    def setCondition(self,conditions):
+        self.model.setCondition(conditions)
+
     def setSelectItem(self,items):
         self.view.selectionModel().blockSignals(True)
         self.view.selectionModel().clearSelection()
 
-        selected = False
+        rows = [self.model.rows[item] for item in items if item in self.model.rows]
+        selected = len(rows) > 0
 
-        for i in range(0,self.model.rowCount()):     
-            if self.model.index(i,0).data() in items:
-                self.view.selectionModel().select(self.model.index(i,0),QtCore.QItemSelectionModel.Select)
-                self.view.selectionModel().setCurrentIndex(self.model.index(i,0),QtCore.QItemSelectionModel.Select)
-                selected = True
-                break
+        if selected:
+            index = self.model.index(min(rows),0)
+            self.view.selectionModel().select(index,QtCore.QItemSelectionModel.Select)
+            self.view.selectionModel().setCurrentIndex(index,QtCore.QItemSelectionModel.Select)
 
         self.view.selectionModel().blockSignals(False)
         return selected
@@ -654,39 +99,101 @@ class ListView(QtWidgets.QWidget):
         return items
 
     def allData(self):
-        items = []
+        return list(self.model.items)
 
-        for i in range(0,self.model.rowCount()):
-            items.append(self.model.index(i,0).data())
-
-        return items
-
-class QStandardItemModel(QtGui.QStandardItemModel):
+class ListModel(QtCore.QAbstractListModel):
     def __init__(self,*args,**kwargs):
-        super(QStandardItemModel,self).__init__(*args,**kwargs)
+        super(ListModel,self).__init__(*args,**kwargs)
+        self.items = []
+        self.rows = {}
         self.conditions = None
+        self.colors = {}
         self.cndColors = {
                             False :QtGui.QColor("#ed4407"),
                             True:QtGui.QColor("#ffffff")                                 
                         }
 
+    def rowCount(self,parent = QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+
+        return len(self.items)
+
+    def data(self,index,role = QtCore.Qt.DisplayRole):
+        if index.isValid() == False or index.row() >= len(self.items):
+            return None
+
+        if role == QtCore.Qt.DisplayRole:
+            return self.items[index.row()]
+
+        if role == QtCore.Qt.ForegroundRole:
+            return self.colors.get(self.items[index.row()])
+
+        return None
+
+    def updateRows(self):
+        self.rows = dict([(self.items[i],i) for i in range(0,len(self.items))])
+
+    def setItems(self,items):
+        self.beginResetModel()
+        self.items = list(items)
+        self.updateRows()
+        self.endResetModel()
+
+    def removeItemRows(self,row,count):
+        self.beginRemoveRows(QtCore.QModelIndex(),row,row + count - 1)
+        del self.items[row:row + count]
+        self.endRemoveRows()
+
+    def insertItems(self,row,items):
+        self.beginInsertRows(QtCore.QModelIndex(),row,row + len(items) - 1)
+        self.items[row:row] = items
+        self.endInsertRows()
+
+    def updateItems(self,items):
+        itemSet = set(items)
+
+        row = len(self.items) - 1
+        while row >= 0:
+            if self.items[row] in itemSet:
+                row -= 1
+                continue
+
+            endRow = row
+            while row >= 0 and self.items[row] not in itemSet:
+                row -= 1
+
+            self.removeItemRows(row + 1,endRow - row)
+
+        curItemSet = set(self.items)
+        if [item for item in items if item in curItemSet] != self.items:
+            self.setItems(items)
+            return
+
+        i = 0
+        while i < len(items):
+            if items[i] in curItemSet:
+                i += 1
+                continue
+
+            startIndex = i
+            while i < len(items) and items[i] not in curItemSet:
+                i += 1
+
+            self.insertItems(startIndex,items[startIndex:i])
+
+        self.updateRows()
+
     def setCondition(self,conditions):        
         self.conditions = conditions
-        self.dataChanged.emit(QtCore.QModelIndex(), QtCore.QModelIndex())
+        self.colors = {}
 
-    def data(self, index, role=QtGui.Qt.DisplayRole,*args,**kwargs):
-        
-        if self.conditions != None and role == QtGui.Qt.TextColorRole:            
-            text = index.data(QtGui.Qt.DisplayRole)
-            
-            for key in list(self.conditions.keys()):
-                if text in self.conditions[key]:
-                    return self.cndColors[key]
-        
-        try:
-            return super(QStandardItemModel, self).data(index, role)
-        except:
-            return None
+        for key in list((conditions or {}).keys()):
+            for item in conditions[key]:
+                self.colors.setdefault(item,self.cndColors[key])
+
+        if len(self.items) > 0:
+            self.dataChanged.emit(self.index(0,0),self.index(len(self.items) - 1,0),[QtCore.Qt.ForegroundRole])
 
 class FilePathField(QtWidgets.QWidget):
     itemChanged = QtCore.Signal(str)
@@ -957,6 +464,12 @@ class PlayblastSettingWidget(QtWidgets.QGroupBox):
         self.outputDirFld.field.editingFinished.connect(self.parentWidget.saveOutputOption)
         outputSetLayout.addRow(QtWidgets.QLabel(""),self.outputDirFld)
 
+        ##write to local scratch first and move to the custom directory in the background
+        self.stageLocalOpt = QtWidgets.QCheckBox("")
+        self.stageLocalOpt.stateChanged.connect(self.parentWidget.saveOutputOption)
+        self.stageLocalOpt.setEnabled(False)
+        outputSetLayout.addRow(QtWidgets.QLabel("stageLocal:"),self.stageLocalOpt)
+
         ##file format (png)
         self.outputfileTypeOpt = ComboBox(["png","jpg","avi"])
         self.outputfileTypeOpt.box.currentIndexChanged.connect(self.parentWidget.saveOutputOption)
@@ -972,19 +485,76 @@ class PlayblastSettingWidget(QtWidgets.QGroupBox):
         outputSetLayout.addRow(QtWidgets.QLabel("filename:"),self.filenameFld)
         self.outputDirFld.setEnabled(False)
 
+        ##batch mode
+        self.batchModeOpt = ComboBox(["sequential","multiCamera","workers"])
+        self.batchModeOpt.box.currentIndexChanged.connect(self.parentWidget.saveOutputOption)
+        outputSetLayout.addRow(QtWidgets.QLabel("batchMode:"),self.batchModeOpt)
+
+        ##worker count
+        self.workerCountFld = QtWidgets.QSpinBox()
+        self.workerCountFld.setRange(1,64)
+        self.workerCountFld.setValue(2)
+        self.workerCountFld.valueChanged.connect(self.parentWidget.saveOutputOption)
+        outputSetLayout.addRow(QtWidgets.QLabel("workers:"),self.workerCountFld)
+
+        ##frames per worker task (0 = whole camera)
+        self.chunkSizeFld = QtWidgets.QSpinBox()
+        self.chunkSizeFld.setRange(0,100000)
+        self.chunkSizeFld.setValue(0)
+        self.chunkSizeFld.valueChanged.connect(self.parentWidget.saveOutputOption)
+        outputSetLayout.addRow(QtWidgets.QLabel("chunkFrames:"),self.chunkSizeFld)
+
+        ##skip cameras whose output is still valid
+        self.skipUnchangedOpt = QtWidgets.QCheckBox("")
+        self.skipUnchangedOpt.stateChanged.connect(self.parentWidget.saveOutputOption)
+        outputSetLayout.addRow(QtWidgets.QLabel("skipUnchanged:"),self.skipUnchangedOpt)
+
+        ##re-blast only frames affected by key changes since the last blast
+        self.incrementalOpt = QtWidgets.QCheckBox("")
+        self.incrementalOpt.stateChanged.connect(self.parentWidget.saveOutputOption)
+        outputSetLayout.addRow(QtWidgets.QLabel("incremental:"),self.incrementalOpt)
+
+        ##post process
+        self.postMovieOpt = QtWidgets.QCheckBox("movie")
+        self.postMovieOpt.stateChanged.connect(self.parentWidget.saveOutputOption)
+        self.postThumbnailOpt = QtWidgets.QCheckBox("thumbnail")
+        self.postThumbnailOpt.stateChanged.connect(self.parentWidget.saveOutputOption)
+
+        postLayout = QtWidgets.QHBoxLayout()
+        postLayout.addWidget(self.postMovieOpt)
+        postLayout.addWidget(self.postThumbnailOpt)
+        postLayout.addStretch()
+        outputSetLayout.addRow(QtWidgets.QLabel("postProcess:"),postLayout)
+
+        self.reviewDirFld = FilePathField( mode = "directory",createBtns = ["set","open","clear"])
+        self.reviewDirFld.field.editingFinished.connect(self.parentWidget.saveOutputOption)
+        self.reviewDirFld.itemChanged.connect(self.parentWidget.saveOutputOption)
+        outputSetLayout.addRow(QtWidgets.QLabel("reviewDirectory:"),self.reviewDirFld)
+
         applyPlayblastBtn = QtWidgets.QPushButton("apply playBlast All")
         applyPlayblastBtn.clicked.connect(ApplyFunc(self.parentWidget.applyPlayblastAll))
         outputSetLayout.addWidget(applyPlayblastBtn)
 
+        resumePlayblastBtn = QtWidgets.QPushButton("resume playBlast All")
+        resumePlayblastBtn.clicked.connect(ApplyFunc(self.parentWidget.resumePlayblastAll))
+        outputSetLayout.addWidget(resumePlayblastBtn)
+
+        self.statusLbl = QtWidgets.QLabel("")
+        outputSetLayout.addWidget(self.statusLbl)
+
     def changeOutputOpt(self):
         curOpt = self.outputOpt.readSelectedText()
         if curOpt == "project":
             self.outputDirFld.setEnabled(False)
+            self.stageLocalOpt.setEnabled(False)
         elif curOpt == "custom":
             self.outputDirFld.setEnabled(True)
+            self.stageLocalOpt.setEnabled(True)
         
         self.parentWidget.saveOutputOption()
 
+CAMERASWITCHDELAY = 150
+
 class CameraWidget(QtWidgets.QGroupBox):
     def __init__(self,parentWidget,*args, **kwargs):
         super(CameraWidget,self).__init__(*args,**kwargs)
@@ -1006,7 +576,7 @@ class CameraWidget(QtWidgets.QGroupBox):
         self.orthographicChk = QtWidgets.QCheckBox("ignor orthographic")
         camBtnLayout.addWidget(self.orthographicChk)
         self.orthographicChk.setChecked(True)
-        self.orthographicChk.stateChanged.connect(self.reloadCameraList)
+        self.orthographicChk.stateChanged.connect(self.refreshCameraList)
 
         camBtnLayout.addStretch()
 
@@ -1016,7 +586,7 @@ class CameraWidget(QtWidgets.QGroupBox):
 
         self.cameraList = ListView()
         self.cameraList.view.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
-        self.cameraList.view.selectionModel().selectionChanged.connect(ApplyFunc(self.changeCamera)) 
+        self.cameraList.view.selectionModel().selectionChanged.connect(self.cameraSelectionChanged) 
         camViewLayout.addWidget(self.cameraList)
 
         ##camera info-----
@@ -1058,12 +628,115 @@ class CameraWidget(QtWidgets.QGroupBox):
         openBtn.clicked.connect(ApplyFunc(self.parentWidget.openOutputDir))
         cameraCmdLayout.addWidget(openBtn)
 
+        self.cameras = []
+        self.cameraShapes = {}
+        self.cameraInfoCache = {}
+        self.pendingRefresh = False
+        self.suspendCount = 0
+        self.pendingResume = False
+        self.callbackIds = []
+
+        self.cameraSwitchTimer = QtCore.QTimer(self)
+        self.cameraSwitchTimer.setSingleShot(True)
+        self.cameraSwitchTimer.setInterval(CAMERASWITCHDELAY)
+        self.cameraSwitchTimer.timeout.connect(ApplyFunc(self.changeCamera))
+
         self.reloadCameraList()
+        self.registerCallbacks()
+        self.destroyed.connect(partial(removeMessageCallbacks,self.callbackIds))
+
+    ##--------------------------------------------------------
+    def registerCallbacks(self):
+        self.callbackIds.append(om2.MDGMessage.addNodeAddedCallback(self.cameraAdded,"camera"))
+        self.callbackIds.append(om2.MDGMessage.addNodeRemovedCallback(self.cameraRemoved,"camera"))
+        self.callbackIds.append(om2.MNodeMessage.addNameChangedCallback(om2.MObject.kNullObj,self.nodeRenamed))
+        self.callbackIds.append(om2.MDagMessage.addAllDagChangesCallback(self.dagChanged))
+
+        for message in [
+                        om2.MSceneMessage.kBeforeOpen,
+                        om2.MSceneMessage.kBeforeNew,
+                        om2.MSceneMessage.kBeforeCreateReference,
+                        om2.MSceneMessage.kBeforeLoadReference,
+                        om2.MSceneMessage.kBeforeUnloadReference,
+                        om2.MSceneMessage.kBeforeRemoveReference
+                        ]:
+            self.callbackIds.append(om2.MSceneMessage.addCallback(message,self.suspendUpdate))
+
+        for message in [
+                        om2.MSceneMessage.kAfterOpen,
+                        om2.MSceneMessage.kAfterNew,
+                        om2.MSceneMessage.kAfterCreateReference,
+                        om2.MSceneMessage.kAfterLoadReference,
+                        om2.MSceneMessage.kAfterUnloadReference,
+                        om2.MSceneMessage.kAfterRemoveReference
+                        ]:
+            self.callbackIds.append(om2.MSceneMessage.addCallback(message,self.resumeUpdate))
+
+    def suspendUpdate(self,*args):
+        self.suspendCount += 1
+
+        if self.pendingResume == False:
+            self.pendingResume = True
+            QtCore.QTimer.singleShot(0,self.resumeIdle)
+
+    def resumeUpdate(self,*args):
+        if self.suspendCount == 0:
+            return
+
+        self.suspendCount -= 1
+        if self.suspendCount == 0:
+            QtCore.QTimer.singleShot(0,self.reloadCameraList)
+
+    ## an open or reference edit cancelled after its before callback never sends the after callback
+    def resumeIdle(self):
+        self.pendingResume = False
+
+        if self.suspendCount > 0:
+            self.suspendCount = 0
+            self.reloadCameraList()
+
+    def cameraAdded(self,node,*args):
+        if self.suspendCount > 0:
+            return
+
+        handle = om2.MObjectHandle(node)
+        self.cameraShapes[handle.hashCode()] = handle
+        self.scheduleRefresh()
+
+    def cameraRemoved(self,node,*args):
+        if self.suspendCount > 0:
+            return
+
+        self.cameraShapes.pop(om2.MObjectHandle(node).hashCode(),None)
+        self.scheduleRefresh()
+
+    def nodeRenamed(self,node,*args):
+        if self.suspendCount > 0:
+            return
+
+        if node.hasFn(om2.MFn.kTransform) or node.hasFn(om2.MFn.kCamera):
+            self.scheduleRefresh()
+
+    def dagChanged(self,changeType,child,*args):
+        if self.suspendCount > 0:
+            return
+
+        if child.hasFn(om2.MFn.kTransform) or child.hasFn(om2.MFn.kCamera):
+            self.scheduleRefresh()
+
+    def scheduleRefresh(self):
+        if self.pendingRefresh:
+            return
+
+        self.pendingRefresh = True
+        QtCore.QTimer.singleShot(0,self.refreshCameraList)
 
     ##--------------------------------------------------------
     def pickTimeRange(self):
         if self.parentWidget.curCamera == "":
             return
+
+        self.flushCameraSwitch()
         
         dialog = GetTimeRangeDialog(self.parentWidget)
         
@@ -1077,7 +750,16 @@ class CameraWidget(QtWidgets.QGroupBox):
 
     def readCameraInfo(self):
         self.parentWidget.curCameraInfo = getCameraInfo("cameraInfoSets",self.parentWidget.curCamera)
+        self.cameraInfoCache[self.parentWidget.curCamera] = dict(self.parentWidget.curCameraInfo)
+        self.showCameraInfo()
+
+    def getCachedCameraInfo(self,camera):
+        if camera in self.cameraInfoCache:
+            return dict(self.cameraInfoCache[camera])
+
+        return getDefaultCameraInfo()
 
+    def showCameraInfo(self):
         ## enable playblast
         self.playblastEnBtn.blockSignals(True)
         self.playblastEnBtn.setChecked(self.parentWidget.curCameraInfo["playblast"])
@@ -1088,6 +770,8 @@ class CameraWidget(QtWidgets.QGroupBox):
         self.endRangeFld.setText(str(self.parentWidget.curCameraInfo["endFrame"]))
 
     def setCameraInfo(self,key):
+        self.flushCameraSwitch()
+
         if key == "playblast":
             self.parentWidget.curCameraInfo["playblast"] = self.playblastEnBtn.isChecked()
             setCameraInfo(self.parentWidget.curCamera + "_infoSet",{"playblast":self.parentWidget.curCameraInfo["playblast"]})
@@ -1101,12 +785,16 @@ class CameraWidget(QtWidgets.QGroupBox):
                             }
                         
                         )
-            
-    def changeCamera(self):
-        self.parentWidget.curCamera = ""
+
+        if self.parentWidget.curCamera != "":
+            self.cameraInfoCache[self.parentWidget.curCamera] = dict(self.parentWidget.curCameraInfo)
+
+    def cameraSelectionChanged(self,*args):
         selects = self.cameraList.selectedItem()
 
         if len(selects) == 0:
+            self.cameraSwitchTimer.stop()
+            self.parentWidget.curCamera = ""
             self.playblastEnBtn.setEnabled(False)
             self.rangeSetBtn.setEnabled(False)
             return
@@ -1115,6 +803,20 @@ class CameraWidget(QtWidgets.QGroupBox):
         self.rangeSetBtn.setEnabled(True)
 
         self.parentWidget.curCamera = selects[-1]
+        self.parentWidget.curCameraInfo = self.getCachedCameraInfo(selects[-1])
+        self.showCameraInfo()
+
+        self.cameraSwitchTimer.start()
+
+    def flushCameraSwitch(self):
+        if self.cameraSwitchTimer.isActive():
+            self.cameraSwitchTimer.stop()
+            self.changeCamera()
+
+    def changeCamera(self):
+        if self.parentWidget.curCamera == "":
+            return
+
         self.readCameraInfo()
 
         changeView(self.parentWidget.curCamera,None)
@@ -1122,21 +824,22 @@ class CameraWidget(QtWidgets.QGroupBox):
         end = cmds.playbackOptions(maxTime=float(self.parentWidget.curCameraInfo["endFrame"]))
 
     def reloadCameraList(self):
-        self.playblastEnBtn.setEnabled(False)
-        self.rangeSetBtn.setEnabled(False)
-    
-        nodes = listTypeNodes("camera")
-        self.cameras = []
-        
-        for node in nodes:
-            if self.orthographicChk.isChecked() == False:
-                self.cameras.append(node)
-
-            elif cmds.getAttr(node + ".orthographic") == False:
-                self.cameras.append(node)
-
-        self.cameras.sort()
-        self.cameraList.setData(self.cameras)
+        self.cameraShapes = getCameraShapeHandles()
+        self.refreshCameraList()
+
+    def refreshCameraList(self):
+        self.pendingRefresh = False
+        self.cameras = listCameraTransforms(self.cameraShapes,self.orthographicChk.isChecked())
+        self.cameraInfoCache = readCameraInfoTable("cameraInfoSets")
+        cameras = set(self.cameras)
+        self.cameraList.updateData(self.cameras)
+
+        if self.parentWidget.curCamera not in cameras:
+            self.cameraSwitchTimer.stop()
+            self.cameraList.clearSelection()
+            self.parentWidget.curCamera = ""
+            self.playblastEnBtn.setEnabled(False)
+            self.rangeSetBtn.setEnabled(False)
 
 class MainGUI(QtWidgets.QMainWindow):
     def __init__(self,parent,objectName,*args, **kwargs):
@@ -1150,69 +853,30 @@ class MainGUI(QtWidgets.QMainWindow):
         self.PBSettingActDict = {}
         self.PBHUDSettingActDict = {}
         self.optionDict = {}
-
-        self.VIEWITEMSETTING = {
-                        "cameras":          False,
-                        "grid":             False,
-                        "handles":          False,
-                        "hairSystems":      False,
-                        "headsUpDisplay":   True,
-                        "ikHandles":        False,
-                        "jointXray":        False,    
-                        "manipulators":     False,
-                        "motionTrails":     False,
-                        "nCloths":          False,
-                        "pivots":           False,
-                        "activeComponentsXray": False,
-                        "activeOnly":           False,
-                        "dimensions":           False,
-                        "displayAppearance":    "smoothShaded",
-                        "displayTextures":      True,
-                        "locators":             False,
-                        "imagePlane":           False,
-                        "joints":               False,
-                        "nParticles":           True,
-                        "polymeshes":           True,
-                        "nurbsCurves":          False,
-                        "nurbsSurfaces":        True,
-                        "lights":               False,
-                        "controlVertices":      False,
-                        "selectionHiliteDisplay":   False
-        }
-
-        self.VIEWITEMSETTING_KEY = [
-                                    "grid",
-                                    "handles",
-                                    "headsUpDisplay",
-                                    "ikHandles",
-                                    "manipulators",
-                                    "motionTrails",
-                                    "nCloths",
-                                    "pivots",
-                                    "activeOnly",
-                                    "dimensions",
-                                    "displayTextures",
-                                    "locators",
-                                    "imagePlane",
-                                    "joints",
-                                    "nParticles",
-                                    "polymeshes",
-                                    "nurbsCurves",
-                                    "nurbsSurfaces",
-                                    "lights",
-                                    "controlVertices",
-                                    "selectionHiliteDisplay"
-                ]
-
-        self.HUDSETTING = {
-                        "resolutionGate":   False,
-                        "cameranames":      True,
-                        "focalLength":      True,
-                        "sceneTimecode":    False,
-                        "frameRate":        False,
-                        "viewAxis":         True,
-                        "currentFrame":     True
-            }
+        self.workerPool = None
+        self.workerJobs = []
+        self.workerCache = None
+        self.workerPost = None
+        self.workerReport = None
+        self.workerOutputDir = ""
+        self.workerEta = None
+        self.postPipeline = None
+        self.fileMover = None
+        self.postExecutor = None
+        self.workerTimer = QtCore.QTimer(self)
+        self.workerTimer.timeout.connect(self.stepWorkerPool)
+
+        self.optionStore = OptionStore(objectName,onChange = self.scheduleOptionWrite)
+        self.optionWriteTimer = QtCore.QTimer(self)
+        self.optionWriteTimer.setSingleShot(True)
+        self.optionWriteTimer.setInterval(OPTIONWRITEDELAY)
+        self.optionWriteTimer.timeout.connect(self.optionStore.flush)
+        self.destroyed.connect(self.optionStore.flush)
+        self.destroyed.connect(removeSceneIndexCallbacks)
+
+        self.VIEWITEMSETTING = dict(VIEWITEMSETTING)
+        self.VIEWITEMSETTING_KEY = list(VIEWITEMSETTING_KEY)
+        self.HUDSETTING = dict(HUDSETTING)
 
         self.setupMenubar()
         self.setupWidgets()
@@ -1250,6 +914,15 @@ class MainGUI(QtWidgets.QMainWindow):
             PBSettingAct.triggered.connect(self.savePBOption)
             self.PBHUDSettingActDict[settingKey] = PBSettingAct
 
+        debugMenu = QtWidgets.QMenu('debug', self.menuBar)
+        self.menuBar.addMenu(debugMenu)
+
+        profileAct = qaction('profile cmds', debugMenu)
+        profileAct.setCheckable(True)
+        profileAct.setChecked(PROFILECMDS)
+        debugMenu.addAction(profileAct)
+        profileAct.toggled.connect(setCmdsProfiling)
+
     def setupWidgets(self):
         self.mainWidget = QtWidgets.QWidget(self)
         self.setCentralWidget(self.mainWidget)
@@ -1277,26 +950,29 @@ class MainGUI(QtWidgets.QMainWindow):
             HUDSettingAct = self.PBHUDSettingActDict[settingKey]
             self.HUDSettingDict[settingKey] = HUDSettingAct.isChecked()
 
+    def scheduleOptionWrite(self):
+        self.optionWriteTimer.start()
+
+    def closeEvent(self,event):
+        self.optionStore.flush()
+        removeSceneIndexCallbacks()
+
+        if self.postExecutor != None:
+            self.postExecutor.shutdown(wait = False)
+            self.postExecutor = None
+
+        super(MainGUI,self).closeEvent(event)
+
     def savePBOption(self):
         self.getPBSettings()
-        saveDictOptionVar(self.objectName() + "_playblastItem",self.PBSettingDict)
-        saveDictOptionVar(self.objectName() + "_playblastHUD",self.HUDSettingDict)
+        self.optionStore.write("playblastItem",self.PBSettingDict)
+        self.optionStore.write("playblastHUD",self.HUDSettingDict)
 
     def loadPBOption(self):
-        self.PBSettingDict = dict(self.VIEWITEMSETTING)
-        loadDict = {}
-        loadDict = readDictOptionVar(self.objectName() + "_playblastItem")
-        self.PBSettingDict.update(**loadDict)
+        self.PBSettingDict = self.optionStore.read("playblastItem",self.VIEWITEMSETTING)
         self.PBSettingDict["displayAppearance"] = "smoothShaded"
 
         for settingKey in list(self.PBSettingDict.keys()):
-        
-            if self.PBSettingDict[settingKey] == "True":
-                self.PBSettingDict[settingKey] = True
-
-            elif self.PBSettingDict[settingKey] == "False":
-                self.PBSettingDict[settingKey] = False
-
             if settingKey in self.VIEWITEMSETTING_KEY:            
                 PBSettingAct = self.PBSettingActDict[settingKey]    
                 PBSettingAct.blockSignals(True)
@@ -1306,22 +982,13 @@ class MainGUI(QtWidgets.QMainWindow):
                             
                 PBSettingAct.blockSignals(False)
         
-        self.HUDSettingDict = dict(self.HUDSETTING)
-        loadDict = {}
-        loadDict = readDictOptionVar(self.objectName() + "_playblastHUD")
-        self.HUDSettingDict.update(**loadDict)
+        self.HUDSettingDict = self.optionStore.read("playblastHUD",self.HUDSETTING)
         
         for settingKey in list(self.PBHUDSettingActDict.keys()):
             PBSettingAct = self.PBHUDSettingActDict[settingKey]
             
             PBSettingAct.blockSignals(True)
-
-            if self.HUDSettingDict[settingKey] == "True" or self.HUDSettingDict[settingKey] == True:
-                self.HUDSettingDict[settingKey] = True
-                PBSettingAct.setChecked(True)
-            else:
-                self.HUDSettingDict[settingKey] = False
-
+            PBSettingAct.setChecked(self.HUDSettingDict[settingKey])
             PBSettingAct.blockSignals(False)
 
     ##------------------------------------------------------------------------      
@@ -1331,23 +998,23 @@ class MainGUI(QtWidgets.QMainWindow):
                         "outputFormat":     self.outputWidget.outputfileTypeOpt.readText(),
                         "outputDir":        self.outputWidget.outputDirFld.read(),
                         "fileNameFormat":   self.outputWidget.filenameFld.text(),
-                        "frameNumberOffset":   self.outputWidget.frameNumberOffsetOpt.isChecked()
+                        "frameNumberOffset":   self.outputWidget.frameNumberOffsetOpt.isChecked(),
+                        "batchMode":        self.outputWidget.batchModeOpt.readText(),
+                        "workerCount":      self.outputWidget.workerCountFld.value(),
+                        "chunkSize":        self.outputWidget.chunkSizeFld.value(),
+                        "skipUnchanged":    self.outputWidget.skipUnchangedOpt.isChecked(),
+                        "incremental":      self.outputWidget.incrementalOpt.isChecked(),
+                        "postMovie":        self.outputWidget.postMovieOpt.isChecked(),
+                        "postThumbnail":    self.outputWidget.postThumbnailOpt.isChecked(),
+                        "reviewDir":        self.outputWidget.reviewDirFld.read(),
+                        "stageLocal":       self.outputWidget.stageLocalOpt.isChecked()
                     }
         
-        saveDictOptionVar(self.objectName() + "_playblastOutput",self.optionDict)
+        self.optionStore.write("playblastOutput",self.optionDict)
 
     def loadOutputOption(self):
 
-        self.optionDict = {
-                        "outputOpt":"project",
-                        "outputDir":"",
-                        "fileNameFormat":"{scene}/{camera}/{scene}_{camera}",
-                        "outputFormat":"png",
-                        "frameNumberOffset":False
-        }
-
-        loadOptionDict = readDictOptionVar(self.objectName() + "_playblastOutput")
-        self.optionDict.update(**loadOptionDict)
+        self.optionDict = self.optionStore.read("playblastOutput",OUTPUTOPTIONDEFAULTS)
         
         self.outputWidget.outputOpt.setSelectText(self.optionDict["outputOpt"])
 
@@ -1355,27 +1022,60 @@ class MainGUI(QtWidgets.QMainWindow):
         self.outputWidget.filenameFld.blockSignals(True)
         self.outputWidget.outputfileTypeOpt.blockSignals(True)
         self.outputWidget.frameNumberOffsetOpt.blockSignals(True)
+        self.outputWidget.batchModeOpt.blockSignals(True)
+        self.outputWidget.workerCountFld.blockSignals(True)
+        self.outputWidget.chunkSizeFld.blockSignals(True)
+        self.outputWidget.skipUnchangedOpt.blockSignals(True)
+        self.outputWidget.incrementalOpt.blockSignals(True)
+        self.outputWidget.postMovieOpt.blockSignals(True)
+        self.outputWidget.postThumbnailOpt.blockSignals(True)
+        self.outputWidget.reviewDirFld.blockSignals(True)
+        self.outputWidget.stageLocalOpt.blockSignals(True)
 
         self.outputWidget.outputDirFld.setItem(self.optionDict["outputDir"])
         self.outputWidget.filenameFld.setText(self.optionDict["fileNameFormat"])
         self.outputWidget.outputfileTypeOpt.selectText(self.optionDict["outputFormat"])        
-        self.outputWidget.frameNumberOffsetOpt.setChecked(eval("bool("+str(self.optionDict["frameNumberOffset"])+")"))
+        self.outputWidget.frameNumberOffsetOpt.setChecked(self.optionDict["frameNumberOffset"])
+        self.outputWidget.batchModeOpt.selectText(self.optionDict["batchMode"])
+        self.outputWidget.workerCountFld.setValue(self.optionDict["workerCount"])
+        self.outputWidget.chunkSizeFld.setValue(self.optionDict["chunkSize"])
+        self.outputWidget.skipUnchangedOpt.setChecked(self.optionDict["skipUnchanged"])
+        self.outputWidget.incrementalOpt.setChecked(self.optionDict["incremental"])
+        self.outputWidget.postMovieOpt.setChecked(self.optionDict["postMovie"])
+        self.outputWidget.postThumbnailOpt.setChecked(self.optionDict["postThumbnail"])
+        self.outputWidget.reviewDirFld.setItem(self.optionDict["reviewDir"])
+        self.outputWidget.stageLocalOpt.setChecked(self.optionDict["stageLocal"])
+        self.outputWidget.stageLocalOpt.setEnabled(self.optionDict["outputOpt"] == "custom")
     
         self.outputWidget.outputDirFld.blockSignals(False)
         self.outputWidget.filenameFld.blockSignals(False)
         self.outputWidget.outputfileTypeOpt.blockSignals(False)
         self.outputWidget.frameNumberOffsetOpt.blockSignals(False)
-
-    def openOutputDir(self):
-        self.saveOutputOption()
-        self.savePBOption()
-
+        self.outputWidget.batchModeOpt.blockSignals(False)
+        self.outputWidget.workerCountFld.blockSignals(False)
+        self.outputWidget.chunkSizeFld.blockSignals(False)
+        self.outputWidget.skipUnchangedOpt.blockSignals(False)
+        self.outputWidget.incrementalOpt.blockSignals(False)
+        self.outputWidget.postMovieOpt.blockSignals(False)
+        self.outputWidget.postThumbnailOpt.blockSignals(False)
+        self.outputWidget.reviewDirFld.blockSignals(False)
+        self.outputWidget.stageLocalOpt.blockSignals(False)
+
+    def getOutputDir(self):
         outputDir = ""
         if self.optionDict["outputOpt"] == "project":
             outputDir = cmds.workspace(q=True,rootDirectory = True) + cmds.workspace(fileRuleEntry = "images") + "/"
         elif self.optionDict["outputOpt"] == "custom":
             outputDir = self.optionDict["outputDir"]
 
+        return outputDir
+
+    def openOutputDir(self):
+        self.saveOutputOption()
+        self.savePBOption()
+
+        outputDir = self.getOutputDir()
+
         if self.curCamera == "":
             return
                         
@@ -1395,11 +1095,7 @@ class MainGUI(QtWidgets.QMainWindow):
         self.saveOutputOption()
         self.savePBOption()
 
-        outputDir = ""
-        if self.optionDict["outputOpt"] == "project":
-            outputDir = cmds.workspace(q=True,rootDirectory = True) + cmds.workspace(fileRuleEntry = "images") + "/"
-        elif self.optionDict["outputOpt"] == "custom":
-            outputDir = self.optionDict["outputDir"]
+        outputDir = self.getOutputDir()
 
         checkNeedSave()
 
@@ -1410,28 +1106,406 @@ class MainGUI(QtWidgets.QMainWindow):
         timeRange = [cameraInfo["startFrame"],cameraInfo["endFrame"]]
         resolution = [cmds.getAttr("defaultResolution.width"),cmds.getAttr("defaultResolution.height")]
         outputFilePath = outputDir + generateOutputName(self.curCamera,self.optionDict["fileNameFormat"])
-        playBlastProcess(self.curCamera,self.PBSettingDict,self.HUDSettingDict,outputFilePath,self.optionDict["outputFormat"],timeRange,resolution,self.optionDict["frameNumberOffset"])
+
+        startPlayblastReport("applyPlayblast")
+        try:
+            playBlastProcess(self.curCamera,self.PBSettingDict,self.HUDSettingDict,outputFilePath,self.optionDict["outputFormat"],timeRange,resolution,self.optionDict["frameNumberOffset"])
+        finally:
+            self.writePlayblastReport(stopPlayblastReport(),outputDir)
 
     def applyPlayblastAll(self):
         self.saveOutputOption()
         self.savePBOption()
 
-        outputDir = ""
-        if self.optionDict["outputOpt"] == "project":
-            outputDir = cmds.workspace(q=True,rootDirectory = True) + cmds.workspace(fileRuleEntry = "images") + "/"
-        elif self.optionDict["outputOpt"] == "custom":
-            outputDir = self.optionDict["outputDir"]
+        outputDir = self.getOutputDir()
+
+        checkNeedSave()
+
+        report = startPlayblastReport("applyPlayblastAll",self.optionDict["batchMode"])
+        try:
+            self.playblastAll(outputDir,report)
+        finally:
+            stopPlayblastReport()
+            if self.workerReport != report:
+                self.writePlayblastReport(report,outputDir)
+
+    def resumePlayblastAll(self):
+        outputDir = self.getOutputDir()
 
         checkNeedSave()
 
-        cameras = getPlayblastCam("cameraInfoSets")
+        report = startPlayblastReport("resumePlayblastAll","sequential")
+        try:
+            jobs = resumePlayblastJobs(outputDir)
+        finally:
+            stopPlayblastReport()
+            self.writePlayblastReport(report,outputDir)
+
+        if jobs == None:
+            cmds.warning("no playblast journal: " + getPlayblastJournalPath(outputDir))
+            return
+
+        self.showPlayblastStatus("resume: {} cameras".format(len(jobs)))
+
+    def writePlayblastReport(self,report,outputDir):
+        if report == None:
+            return
+
+        try:
+            print("playblast report: " + report.write(outputDir))
+        except (IOError,OSError):
+            cmds.warning("failed to write playblast report: " + traceback.format_exc())
+
+        resolution = [cmds.getAttr("defaultResolution.width"),cmds.getAttr("defaultResolution.height")]
+        try:
+            recordPlayblastHistory(report,resolution,self.optionDict["outputFormat"])
+        except (IOError,OSError):
+            cmds.warning("failed to record playblast history: " + traceback.format_exc())
+
+    def showPlayblastStatus(self,text):
+        self.outputWidget.statusLbl.setText(text)
+        self.outputWidget.statusLbl.repaint()
+
+    def createPlayblastEta(self,jobs,resolution):
+        estimates = estimatePlayblastJobs(jobs,resolution,self.optionDict["outputFormat"])
+        return SSCameraSwitcherWorker.PlayblastEta(zip([job["camera"] for job in jobs],estimates))
+
+    def playblastAll(self,outputDir,report = None):
+        with timedPhase("readCameraInfo"):
+            cameraInfoTable = readCameraInfoTable("cameraInfoSets")
+            cameras = getPlayblastCam("cameraInfoSets",cameraInfoTable)
+        resolution = [cmds.getAttr("defaultResolution.width"),cmds.getAttr("defaultResolution.height")]
+
+        jobs = buildPlayblastJobs(cameraInfoTable,cameras,outputDir,self.optionDict["fileNameFormat"])
+
+        playblastCache = None
+        if self.optionDict["skipUnchanged"]:
+            with timedPhase("cacheCheck"):
+                playblastCache = PlayblastCache(os.path.join(outputDir,PLAYBLASTCACHEFILE))
+                jobs = self.filterCachedJobs(playblastCache,jobs,resolution)
+
+        scratchDir = None
+        if self.optionDict["stageLocal"] and self.optionDict["outputOpt"] == "custom" and self.optionDict["incremental"] == False:
+            scratchDir = SSCameraSwitcherPost.getScratchDir(getCurSceneName()[1] or "untitled")
+            for job in jobs:
+                stagePlayblastJob(job,outputDir,scratchDir)
+
+        postPipeline = self.createPostPipeline(outputDir,scratchDir,playblastCache)
+
+        if self.optionDict["batchMode"] == "workers" and self.optionDict["incremental"] == False:
+            self.startWorkerPool(jobs,resolution,playblastCache,postPipeline,report,outputDir)
+            return
+
+        eta = self.createPlayblastEta(jobs,resolution)
+        self.showPlayblastStatus(eta.getStatus("playblast"))
+
+        try:
+            if self.optionDict["incremental"]:
+                self.incrementalPlayblast(jobs,resolution,playblastCache,postPipeline,eta)
+                return
+
+            if self.optionDict["batchMode"] == "multiCamera" and COMPRESSIONDICT[self.optionDict["outputFormat"]][1] == "image":
+                viewState = PlayblastViewState()
+                viewState.snapshot()
+
+                try:
+                    multiCameraPlayBlast(jobs,self.PBSettingDict,self.HUDSettingDict,self.optionDict["outputFormat"],resolution,self.optionDict["frameNumberOffset"],viewState = viewState)
+                finally:
+                    viewState.restore()
+                    self.updatePlayblastCache(playblastCache,jobs)
+
+                for job in jobs:
+                    self.submitPostProcess(postPipeline,job)
+                    eta.setDone(job["camera"])
+                return
+
+            runPlayblastJobs(
+                            jobs,
+                            self.PBSettingDict,
+                            self.HUDSettingDict,
+                            self.optionDict["outputFormat"],
+                            resolution,
+                            self.optionDict["frameNumberOffset"],
+                            onJobDone = partial(self.playblastJobDone,playblastCache,postPipeline,eta),
+                            journalDir = outputDir if scratchDir == None else None
+                        )
+        finally:
+            self.showPlayblastStatus("playblast: {}/{}".format(len(eta.done),len(eta.estimates)))
+            self.finishPostPipeline(postPipeline)
+
+    def playblastJobDone(self,playblastCache,postPipeline,eta,job):
+        self.updatePlayblastCache(playblastCache,[job])
+        self.submitPostProcess(postPipeline,job)
+        self.playblastEtaDone(eta,job)
+
+    def playblastEtaDone(self,eta,job):
+        if eta == None:
+            return
+
+        eta.setDone(job["camera"])
+        self.showPlayblastStatus(eta.getStatus("playblast"))
+
+    def incrementalPlayblast(self,jobs,resolution,playblastCache = None,postPipeline = None,eta = None):
+        outputFormat = self.optionDict["outputFormat"]
+        movie = COMPRESSIONDICT[outputFormat][1] == "movie"
+
+        curveKeys = readAnimCurveKeys()
+        referenceDigest = getDigest(getReferenceVersions())
+
+        playblastPanel = PlayblastPanel(self.PBSettingDict)
+        viewState = PlayblastViewState()
+        viewState.snapshot()
+
+        try:
+            for job in jobs:
+                blastPath = job["outputPath"]
+                blastFormat = outputFormat
+                frameNumberOffset = self.optionDict["frameNumberOffset"]
+
+                if movie:
+                    blastPath = job["outputPath"] + "_seq"
+                    blastFormat = "png"
+                    frameNumberOffset = True
+
+                settingsKey = getPlayblastSettingsKey(job,self.PBSettingDict,self.HUDSettingDict,outputFormat,resolution,frameNumberOffset,referenceDigest)
+                snapshotPath = job["outputPath"].replace("//","/") + ".animSnapshot.json"
+                snapshot = readAnimSnapshot(snapshotPath)
+
+                frames = getFrames(job["timeRange"][0],job["timeRange"][1],1)
+                files = getPlayblastOutputFiles(blastPath,blastFormat,job["timeRange"],frameNumberOffset)
+
+                if snapshot == None or snapshot["key"] != settingsKey:
+                    dirtyFrames = set(frames)
+                else:
+                    dirtyFrames = getDirtyFrames(snapshot["curves"],curveKeys,job["timeRange"])
+                    for i in range(0,len(frames)):
+                        if os.path.isfile(files[i]) == False:
+                            dirtyFrames.add(frames[i])
+
+                for frameRange in groupFrameRanges(dirtyFrames):
+                    print("playblast {} frames {}-{}".format(job["camera"],frameRange[0],frameRange[1]))
+                    playBlastProcess(
+                                    job["camera"],
+                                    self.PBSettingDict,
+                                    self.HUDSettingDict,
+                                    blastPath,
+                                    blastFormat,
+                                    frameRange,
+                                    resolution,
+                                    frameNumberOffset,
+                                    playblastPanel = playblastPanel,
+                                    viewState = viewState,
+                                    sequenceStart = frameRange[0] - frames[0] + 1
+                                )
+
+                if any(os.path.isfile(filePath) == False for filePath in files):
+                    self.playblastEtaDone(eta,job)
+                    continue
+
+                if movie and len(dirtyFrames) > 0:
+                    moviePath = getPlayblastOutputFiles(job["outputPath"],outputFormat,job["timeRange"],True)[0]
+                    frameRate = mel.eval("currentTimeUnitToFPS()")
+                    if SSCameraSwitcherWorker.encodeMovieFromSequence(blastPath.replace("//","/") + ".%04d.png",1,moviePath,frameRate) == False:
+                        cmds.warning("failed to build movie from sequence: " + moviePath)
+                        self.playblastEtaDone(eta,job)
+                        continue
+
+                saveAnimSnapshot(snapshotPath,settingsKey,curveKeys)
+                self.updatePlayblastCache(playblastCache,[job])
+
+                if len(dirtyFrames) > 0:
+                    self.submitPostProcess(postPipeline,job)
+
+                self.playblastEtaDone(eta,job)
+
+        finally:
+            playblastPanel.close()
+            viewState.restore()
+
+    def filterCachedJobs(self,playblastCache,jobs,resolution):
+        return filterCachedJobs(playblastCache,jobs,self.PBSettingDict,self.HUDSettingDict,self.optionDict["outputFormat"],resolution,self.optionDict["frameNumberOffset"])
+
+    def updatePlayblastCache(self,playblastCache,jobs,transferred = False):
+        if playblastCache == None:
+            return
+
+        for job in jobs:
+            if "finalOutputPath" in job and transferred == False:
+                continue
+
+            outputPath = job.get("finalOutputPath",job["outputPath"])
+            files = getPlayblastOutputFiles(outputPath,self.optionDict["outputFormat"],job["timeRange"],self.optionDict["frameNumberOffset"])
+            playblastCache.update(outputPath,job["camera"],job["cacheKey"],files)
+
+        playblastCache.save()
+
+    def createPostPipeline(self,outputDir,scratchDir = None,playblastCache = None):
+        steps = []
+
+        if self.optionDict["postMovie"]:
+            steps.append(SSCameraSwitcherPost.MovieStep(mel.eval("currentTimeUnitToFPS()")))
+
+        if self.optionDict["postThumbnail"]:
+            steps.append(SSCameraSwitcherPost.ThumbnailStep())
+
+        if scratchDir != None:
+            if self.fileMover == None:
+                self.fileMover = SSCameraSwitcherPost.FileMover()
+
+            steps.append(SSCameraSwitcherPost.TransferStep(self.fileMover,scratchDir,outputDir))
+
+        if self.optionDict["reviewDir"] != "":
+            steps.append(SSCameraSwitcherPost.CopyToDirectoryStep(self.optionDict["reviewDir"],outputDir))
+
+        if len(steps) == 0:
+            return None
+
+        if self.postPipeline != None:
+            self.postPipeline.shutdown(wait = False)
+
+        self.postPipeline = SSCameraSwitcherPost.PostProcessPipeline(steps,onComplete = partial(self.postProcessComplete,playblastCache))
+        return self.postPipeline
+
+    ## the pipeline keeps running its queue, then removes the emptied scratch directories
+    def finishPostPipeline(self,postPipeline):
+        if postPipeline != None:
+            postPipeline.shutdown(wait = False)
+
+    def getPostExecutor(self):
+        if self.postExecutor == None:
+            self.postExecutor = ThreadPoolExecutor(max_workers = 1)
+
+        return self.postExecutor
+
+    def submitPostProcess(self,postPipeline,job):
+        if postPipeline == None:
+            return
+
+        outputFormat = self.optionDict["outputFormat"]
+        files = getPlayblastOutputFiles(job["outputPath"],outputFormat,job["timeRange"],self.optionDict["frameNumberOffset"])
+
+        postPipeline.submit({
+                                "camera":       job["camera"],
+                                "outputPath":   job["outputPath"].replace("//","/"),
+                                "outputFormat": outputFormat,
+                                "movie":        COMPRESSIONDICT[outputFormat][1] == "movie",
+                                "files":        [filePath for filePath in files if os.path.isfile(filePath)],
+                                "job":          job
+        })
+
+    def postProcessComplete(self,playblastCache,result):
+        maya.utils.executeDeferred(partial(self.postProcessReport,playblastCache,result))
+
+    def postProcessReport(self,playblastCache,result):
+        print("post process: {} {}".format(result["camera"],result["postStatus"]))
+        if "postError" in result:
+            print(result["postError"])
+
+        elif "finalOutputPath" in result["job"]:
+            self.updatePlayblastCache(playblastCache,[result["job"]],transferred = True)
+
+        if self.postPipeline != None:
+            self.outputWidget.statusLbl.setText("post: {}/{}".format(*self.postPipeline.progress()))
+
+    def startWorkerPool(self,jobs,resolution,playblastCache = None,postPipeline = None,report = None,outputDir = ""):
+        if self.workerPool != None:
+            cmds.warning("playblast workers are still running")
+            return
+
+        scenePath = cmds.file(q=True, sn=True)
+        if scenePath == "":
+            cmds.warning("save the scene before running playblast workers")
+            return
+
+        if cmds.file(q=True, modified=True):
+            cmds.warning("unsaved changes are not seen by playblast workers")
+
+        movieExtension = None
+        if COMPRESSIONDICT[self.optionDict["outputFormat"]][1] == "movie":
+            movieExtension = self.optionDict["outputFormat"]
+
+        tasks = SSCameraSwitcherWorker.chunkPlayblastJobs(jobs,self.optionDict["chunkSize"],movieExtension)
+        estimates = estimatePlayblastJobs(tasks,resolution,self.optionDict["outputFormat"])
+        tasks,estimates = SSCameraSwitcherWorker.orderLongestFirst(tasks,estimates)
+
+        manifest = buildJobManifest(
+                                    scenePath,
+                                    tasks,
+                                    self.PBSettingDict,
+                                    self.HUDSettingDict,
+                                    self.optionDict["outputFormat"],
+                                    resolution,
+                                    self.optionDict["frameNumberOffset"],
+                                    self.optionDict["fileNameFormat"]
+                                )
+        manifestPath = SSCameraSwitcherWorker.saveJobManifest(os.path.join(getWorkerJobDir(scenePath),"manifest.json"),manifest)
+
+        self.workerPool = SSCameraSwitcherWorker.PlayblastWorkerPool(
+                                                                    manifestPath,
+                                                                    maxWorkers = self.optionDict["workerCount"],
+                                                                    onResult = self.workerResult,
+                                                                    executor = self.getPostExecutor()
+                                                                )
+        self.workerJobs = jobs
+        self.workerCache = playblastCache
+        self.workerPost = postPipeline
+        self.workerReport = report
+        self.workerOutputDir = outputDir
+        self.workerEta = SSCameraSwitcherWorker.PlayblastEta(enumerate(estimates),self.optionDict["workerCount"])
+        self.showPlayblastStatus(self.workerEta.getStatus("workers"))
+        self.stepWorkerPool()
+        self.workerTimer.start(500)
+
+    def workerResult(self,taskIndex,result):
+        print("playblast worker: {} {}".format(result["camera"],result["status"]))
+        if "error" in result:
+            print(result["error"])
+
+        self.workerEta.setDone(taskIndex)
+        self.showPlayblastStatus(self.workerEta.getStatus("workers"))
+
+    def stepWorkerPool(self):
+        if self.workerPool == None:
+            self.workerTimer.stop()
+            return
+
+        if self.workerPool.step():
+            return
 
-        for camera in cameras:
-            cameraInfo = getCameraInfo("cameraInfoSets",camera)
-            timeRange = [cameraInfo["startFrame"],cameraInfo["endFrame"]]
-            resolution = [cmds.getAttr("defaultResolution.width"),cmds.getAttr("defaultResolution.height")]
-            outputFilePath = outputDir + generateOutputName(camera,self.optionDict["fileNameFormat"])
-            playBlastProcess(camera,self.PBSettingDict,self.HUDSettingDict,outputFilePath,self.optionDict["outputFormat"],timeRange,resolution,self.optionDict["frameNumberOffset"])
+        self.workerTimer.stop()
+        failed = [result["camera"] for result in self.workerPool.getResults() if result["status"] != "done"]
+
+        if self.workerReport != None:
+            tasks = self.workerPool.manifest["tasks"]
+            for taskIndex in sorted(self.workerPool.results.keys()):
+                result = self.workerPool.results[taskIndex]
+                timeRange = tasks[taskIndex]["timeRange"]
+                self.workerReport.addCameraResult(result["camera"],int(timeRange[1]) - int(timeRange[0]) + 1,result["status"],result.get("phases",{}))
+
+            self.workerReport.seconds = None
+            self.workerReport.stop()
+            self.writePlayblastReport(self.workerReport,self.workerOutputDir)
+
+        for outputPath in self.workerPool.assembled:
+            if self.workerPool.assembled[outputPath] == False:
+                failed.append(outputPath)
+
+        doneJobs = [job for job in self.workerJobs if job["camera"] not in failed and job["outputPath"] not in failed]
+        self.updatePlayblastCache(self.workerCache,doneJobs)
+        for job in doneJobs:
+            self.submitPostProcess(self.workerPost,job)
+        self.finishPostPipeline(self.workerPost)
+
+        self.workerPool = None
+        self.workerJobs = []
+        self.workerCache = None
+        self.workerPost = None
+        self.workerReport = None
+        self.workerOutputDir = ""
+        self.workerEta = None
+
+        if len(failed) > 0:
+            cmds.warning("playblast failed: " + ",".join(failed))
 
 ##main----------------------------------------
 def callCameraSwitcher():
@@ -0,0 +1,156 @@
+## mayapy SSCameraSwitcherBatch.py scene.ma [--outputDir dir] [--format png] [--cameras cam ...] [--savedOptions]
+## playblasts the enabled cameras of a scene without loading the GUI
+import os
+import sys
+import argparse
+from functools import partial
+
+def parseArgs(argv):
+    parser = argparse.ArgumentParser(description = "playblast the enabled cameras of a scene")
+    parser.add_argument("scene")
+    parser.add_argument("--project",default = None,help = "project to set before opening the scene")
+    parser.add_argument("--outputDir",default = None,help = "output directory (default: images of the project)")
+    parser.add_argument("--format",dest = "outputFormat",choices = ["png","jpg","avi"],default = None)
+    parser.add_argument("--fileNameFormat",default = None)
+    parser.add_argument("--frameNumberOffset",action = "store_true",default = None)
+    parser.add_argument("--resolution",type = int,nargs = 2,default = None)
+    parser.add_argument("--cameras",nargs = "+",default = None,help = "limit to these enabled cameras")
+    parser.add_argument("--skipUnchanged",action = "store_true",default = None)
+    parser.add_argument("--savedOptions",action = "store_true",help = "use the options saved by the SSCameraSwitcher window")
+    parser.add_argument("--resume",action = "store_true",help = "re-blast only the cameras and frames missing from the last run")
+    return parser.parse_args(argv)
+
+def getOutputOption(core,args):
+    if args.savedOptions:
+        viewItemOption,showHUDs,outputOption = core.readSavedPlayblastOptions()
+    else:
+        viewItemOption = dict([(settingKey,core.VIEWITEMSETTING[settingKey]) for settingKey in core.VIEWITEMSETTING_KEY])
+        showHUDs = dict(core.HUDSETTING)
+        outputOption = dict(core.OUTPUTOPTIONDEFAULTS)
+
+    for key in ["outputFormat","fileNameFormat","frameNumberOffset","skipUnchanged"]:
+        if getattr(args,key) != None:
+            outputOption[key] = getattr(args,key)
+
+    return viewItemOption,showHUDs,outputOption
+
+def getOutputDir(core,args,outputOption):
+    outputDir = args.outputDir
+
+    if outputDir == None and outputOption["outputOpt"] == "custom":
+        outputDir = outputOption["outputDir"]
+
+    if outputDir == None or outputDir == "":
+        outputDir = core.cmds.workspace(q=True,rootDirectory = True) + core.cmds.workspace(fileRuleEntry = "images")
+
+    outputDir = outputDir.replace("\\","/")
+    if outputDir.endswith("/") == False:
+        outputDir += "/"
+
+    return outputDir
+
+def updateCache(core,playblastCache,outputOption,job):
+    if playblastCache == None:
+        return
+
+    files = core.getPlayblastOutputFiles(job["outputPath"],outputOption["outputFormat"],job["timeRange"],outputOption["frameNumberOffset"])
+    playblastCache.update(job["outputPath"],job["camera"],job["cacheKey"],files)
+    playblastCache.save()
+
+def resume(core,outputDir):
+    report = core.startPlayblastReport("batchResume","sequential")
+    try:
+        jobs = core.resumePlayblastJobs(outputDir)
+    finally:
+        core.stopPlayblastReport()
+
+    if jobs == None:
+        print("no playblast journal: " + core.getPlayblastJournalPath(outputDir))
+        return 1
+
+    print("playblast report: " + report.write(outputDir))
+
+    settings,missingJobs = core.readResumeState(core.getPlayblastJournalPath(outputDir))
+    print("resume: {} cameras, {} still missing".format(len(jobs),len(missingJobs)))
+    if len(missingJobs) > 0:
+        print("missing: " + ",".join([job["camera"] for job in missingJobs]))
+        return 1
+
+    return 0
+
+def run(args):
+    import SSCameraSwitcherCore as core
+    cmds = core.cmds
+
+    if args.project != None:
+        cmds.workspace(args.project,openWorkspace =True)
+
+    cmds.file(args.scene,open =True,force =True)
+
+    viewItemOption,showHUDs,outputOption = getOutputOption(core,args)
+    outputDir = getOutputDir(core,args,outputOption)
+
+    if args.resume:
+        return resume(core,outputDir)
+
+    cameraInfoTable = core.readCameraInfoTable("cameraInfoSets")
+    cameras = core.getPlayblastCam("cameraInfoSets",cameraInfoTable)
+    if args.cameras != None:
+        cameras = [camera for camera in cameras if camera in args.cameras]
+
+    resolution = args.resolution
+    if resolution == None:
+        resolution = [cmds.getAttr("defaultResolution.width"),cmds.getAttr("defaultResolution.height")]
+
+    jobs = core.buildPlayblastJobs(cameraInfoTable,cameras,outputDir,outputOption["fileNameFormat"])
+
+    playblastCache = None
+    if outputOption["skipUnchanged"]:
+        playblastCache = core.PlayblastCache(os.path.join(outputDir,core.PLAYBLASTCACHEFILE))
+        jobs = core.filterCachedJobs(playblastCache,jobs,viewItemOption,showHUDs,outputOption["outputFormat"],resolution,outputOption["frameNumberOffset"])
+
+    report = core.startPlayblastReport("batch","sequential")
+    try:
+        core.runPlayblastJobs(
+                            jobs,
+                            viewItemOption,
+                            showHUDs,
+                            outputOption["outputFormat"],
+                            resolution,
+                            outputOption["frameNumberOffset"],
+                            onJobDone = partial(updateCache,core,playblastCache,outputOption),
+                            journalDir = outputDir
+                        )
+    finally:
+        core.stopPlayblastReport()
+        print("playblast report: " + report.write(outputDir))
+
+    core.recordPlayblastHistory(report,resolution,outputOption["outputFormat"])
+
+    failed = []
+    for job in jobs:
+        files = core.getPlayblastOutputFiles(job["outputPath"],outputOption["outputFormat"],job["timeRange"],outputOption["frameNumberOffset"])
+        if any(os.path.isfile(filePath) == False for filePath in files):
+            failed.append(job["camera"])
+
+    print("playblast: {} cameras, {} failed".format(len(jobs),len(failed)))
+    if len(failed) > 0:
+        print("failed: " + ",".join(failed))
+        return 1
+
+    return 0
+
+def main(argv):
+    args = parseArgs(argv)
+    sys.path.insert(0,os.path.dirname(os.path.abspath(__file__)))
+
+    import maya.standalone
+    maya.standalone.initialize(name = "python")
+
+    try:
+        return run(args)
+    finally:
+        maya.standalone.uninitialize()
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,2436 @@
+import os
+import sys
+import json
+import time
+import hashlib
+import traceback
+import contextlib
+from functools import partial
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+import maya.api.OpenMayaUI as omui
+import maya.OpenMayaUI as OpenMayaUI
+import maya.mel as mel
+import maya.utils
+
+import SSCameraSwitcherWorker
+
+##--------------------------------------------------------
+##--------------------------------------------------------
+
+def readDictOptionVar(toolName):
+    optionString = ""
+    if cmds.optionVar(exists = toolName):
+        optionString = cmds.optionVar(q = toolName)
+    
+    optionDict = {}
+
+    optionArray = optionString.split(";")
+    if len(optionArray) > 1:
+        for i in range(0,len(optionArray),2):
+            optionDict[optionArray[i]] = optionArray[i+1]
+
+    return optionDict
+
+def saveJsonOptionVar(name,values):
+    cmds.optionVar(stringValue = [name,json.dumps(values,sort_keys =True)])
+
+def readJsonOptionVar(name):
+    if cmds.optionVar(exists = name) == False:
+        return {}
+
+    optionString = cmds.optionVar(q = name)
+    if isinstance(optionString,str) == False or optionString.startswith("{") == False:
+        return readDictOptionVar(name)
+
+    try:
+        return json.loads(optionString)
+    except ValueError:
+        return {}
+
+def coerceOptionValue(value,default):
+    if default == None:
+        return value
+
+    if isinstance(default,bool):
+        return value in [True,"True","true","1",1]
+
+    if isinstance(value,type(default)) and isinstance(value,bool) == False:
+        return value
+
+    try:
+        if isinstance(default,int):
+            return int(float(value))
+
+        if isinstance(default,float):
+            return float(value)
+
+    except (TypeError,ValueError):
+        return default
+
+    return str(value)
+
+OPTIONWRITEDELAY = 500
+
+class OptionStore(object):
+    def __init__(self,toolName,onChange = None):
+        self.toolName = toolName
+        self.onChange = onChange
+        self.cache = {}
+        self.dirty = set()
+
+    def getOptionVarName(self,key):
+        return self.toolName + "_" + key
+
+    def read(self,key,defaults = None):
+        if key not in self.cache:
+            self.cache[key] = readJsonOptionVar(self.getOptionVarName(key))
+
+        defaults = defaults or {}
+        values = dict(defaults)
+
+        for name in self.cache[key]:
+            values[name] = coerceOptionValue(self.cache[key][name],defaults.get(name))
+
+        return values
+
+    def write(self,key,values):
+        values = dict(values)
+        if self.cache.get(key) == values:
+            return
+
+        self.cache[key] = values
+        self.dirty.add(key)
+
+        if self.onChange != None:
+            self.onChange()
+        else:
+            self.flush()
+
+    def flush(self):
+        for key in sorted(self.dirty):
+            saveJsonOptionVar(self.getOptionVarName(key),self.cache[key])
+
+        self.dirty = set()
+
+class ApplyFunc(object):
+    def __init__(self, func, *args, **kwargs):
+        self.__func = func
+        self.__args = args
+        self.__kwargs = kwargs
+                        
+    def __call__(self, *args, **kwargs):
+        error = None        
+        profiler = None
+        if PROFILECMDS:
+            profiler = startCmdsProfiler()
+
+        try:
+            cmds.undoInfo(openChunk =True)
+
+            self.__func(*self.__args, **self.__kwargs)			
+                        
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+
+        finally:            
+            cmds.undoInfo(closeChunk =True)
+
+            if profiler != None:
+                stopCmdsProfiler(profiler)
+                print(profiler.report(getattr(self.__func,"__name__",str(self.__func))))
+
+##--------------------------------------------------------
+## MARK: cmds profiler
+##--------------------------------------------------------
+PROFILECMDS = os.environ.get("SSCAMERASWITCHER_PROFILE","") not in ["","0"]
+PROFILETOPCOUNT = 15
+
+class CmdsProfiler(object):
+    def __init__(self,module):
+        self.module = module
+        self.wrappers = {}
+        self.commands = {}
+        self.callSites = {}
+        self.startTime = time.perf_counter()
+        self.seconds = None
+
+    def __getattr__(self,name):
+        attr = getattr(self.module,name)
+        if callable(attr) == False:
+            return attr
+
+        if name not in self.wrappers:
+            self.wrappers[name] = partial(self.call,name,attr)
+
+        return self.wrappers[name]
+
+    def call(self,name,func,*args,**kwargs):
+        caller = sys._getframe(1)
+        startTime = time.perf_counter()
+
+        try:
+            return func(*args,**kwargs)
+        finally:
+            seconds = time.perf_counter() - startTime
+            callSite = (name,os.path.basename(caller.f_code.co_filename),caller.f_lineno,caller.f_code.co_name)
+
+            for stats,key in [(self.commands,name),(self.callSites,callSite)]:
+                if key not in stats:
+                    stats[key] = [0,0.0]
+
+                stats[key][0] += 1
+                stats[key][1] += seconds
+
+    def stop(self):
+        if self.seconds == None:
+            self.seconds = time.perf_counter() - self.startTime
+
+    def report(self,title = ""):
+        self.stop()
+
+        calls = sum([stats[0] for stats in self.commands.values()])
+        cmdsSeconds = sum([stats[1] for stats in self.commands.values()])
+
+        lines = [
+                "cmds profile: {}  calls:{}  cmds:{:.3f}s  total:{:.3f}s".format(title,calls,cmdsSeconds,self.seconds),
+                "    {:<28}{:>8}{:>12}{:>10}".format("command","calls","total(ms)","avg(ms)")
+        ]
+
+        for name in sorted(self.commands,key = lambda name:self.commands[name][1],reverse =True)[:PROFILETOPCOUNT]:
+            count,seconds = self.commands[name]
+            lines.append("    {:<28}{:>8}{:>12.2f}{:>10.3f}".format(name,count,seconds * 1000.0,seconds * 1000.0 / count))
+
+        lines.append("    {:<64}{:>8}{:>12}".format("hottest call sites","calls","total(ms)"))
+
+        for callSite in sorted(self.callSites,key = lambda callSite:self.callSites[callSite][1],reverse =True)[:PROFILETOPCOUNT]:
+            count,seconds = self.callSites[callSite]
+            location = "{}:{} {}() {}".format(callSite[1],callSite[2],callSite[3],callSite[0])
+            lines.append("    {:<64}{:>8}{:>12.2f}".format(location,count,seconds * 1000.0))
+
+        return "\n".join(lines)
+
+def setCmdsProfiling(enabled):
+    global PROFILECMDS
+    PROFILECMDS = bool(enabled)
+
+_profiledModules = [sys.modules[__name__]]
+
+def registerProfiledModule(module):
+    if module not in _profiledModules:
+        _profiledModules.append(module)
+
+def startCmdsProfiler():
+    if isinstance(cmds,CmdsProfiler):
+        return None
+
+    profiler = CmdsProfiler(cmds)
+    for module in _profiledModules:
+        if module.cmds is profiler.module:
+            module.cmds = profiler
+
+    return profiler
+
+def stopCmdsProfiler(profiler):
+    if profiler == None:
+        return
+
+    profiler.stop()
+    for module in _profiledModules:
+        if module.cmds is profiler:
+            module.cmds = profiler.module
+##--------------------------------------------------------
+## MARK: scene info
+##--------------------------------------------------------
+def removeMessageCallbacks(callbackIds):
+    if len(callbackIds) > 0:
+        om2.MMessage.removeCallbacks(callbackIds)
+
+    del callbackIds[:]
+
+def getDagNode(target):
+    try:
+        sellist = om.MGlobal.getSelectionListByName(target)
+        return sellist.getDagPath(0)
+    except:
+        return None
+    
+def getFullPathName(target):
+    if type(getDagNode(target)) != om.MDagPath:
+        return target
+
+    return om.MFnDagNode(getDagNode(target).node()).fullPathName()
+
+def getTransformNode(targets,fullpath = False):
+    transfromNodes = []
+    foundNodes = set()
+
+    selList = om2.MSelectionList()
+    selTargets = []
+    addedTargets = set()
+
+    for target in targets:
+        if target in addedTargets:
+            continue
+
+        addedTargets.add(target)
+        count = selList.length()
+        selList.add(target)
+
+        if selList.length() > count:
+            selTargets.append(target)
+
+    for i in range(0,len(selTargets)):
+        node = selList.getDependNode(i)
+        transfromNode = None
+
+        if node.hasFn(om2.MFn.kTransform):
+            transfromNode = selTargets[i]
+
+        elif node.hasFn(om2.MFn.kShape):
+            dagPath = selList.getDagPath(i)
+            dagPath.pop()
+
+            if fullpath:
+                transfromNode = dagPath.fullPathName()
+            else:
+                transfromNode = dagPath.partialPathName()
+
+        if transfromNode not in foundNodes:
+            foundNodes.add(transfromNode)
+            transfromNodes.append(transfromNode)
+    
+    return transfromNodes
+
+def getIKJointChain(ikHandle,fullpath):
+    ikHandleDag = getDagNode(ikHandle)    
+    ikHandleDnFn = om.MFnDependencyNode(ikHandleDag.node())
+    
+    if fullpath:
+        startJoint = om.MFnDagNode(ikHandleDnFn.findPlug('startJoint', False).source().node()).fullPathName()
+        effector = om.MFnDagNode(ikHandleDnFn.findPlug('endEffector', False).source().node()).fullPathName()
+
+        effectorDag = getDagNode(effector)
+        effectorDnFn = om.MFnDependencyNode(effectorDag.node())
+        endJoint = om.MFnDagNode(effectorDnFn.findPlug('offsetParentMatrix', False).source().node()).fullPathName()
+    
+    else:
+        startJoint = om.MFnDagNode(ikHandleDnFn.findPlug('startJoint', False).source().node()).name()
+        effector = om.MFnDagNode(ikHandleDnFn.findPlug('endEffector', False).source().node()).name()
+
+        effectorDag = getDagNode(effector)
+        effectorDnFn = om.MFnDependencyNode(effectorDag.node())
+        endJoint = om.MFnDagNode(effectorDnFn.findPlug('offsetParentMatrix', False).source().node()).name()
+
+    jointChain = getCurHierarchy(endJoint,startJoint,fullpath)
+
+    return jointChain
+
+def subIgnorTypeNodes(nodes,ignorNodeTypes,topNode,fullpath):
+        for ignorType in ignorNodeTypes:
+            nodes = list(set(nodes) - set(listTypeNodes(ignorType,topNode,fullpath)))
+
+        return nodes
+
+def listTypeNodeIds(index,nodeType,fullpath = False):
+    if nodeType == "noShapeTransform":
+        return index.typeIds("transform") - index.transformIds(index.typeIds("shape"))
+
+    elif nodeType == "IKJoints":
+        nodes = []
+        for ikHandle in index.nodeNames(index.typeIds("ikHandle"),fullpath):
+            jointChain = getIKJointChain(ikHandle,fullpath)
+            nodes.extend(jointChain)
+
+        return index.nodeIds(nodes)
+
+    elif nodeType in ["locator","mesh","nurbsCurve","nurbsSurface","camera","light"]:
+        return index.transformIds(index.typeIds(nodeType))
+
+    return index.typeIds(nodeType)
+
+def listTypeNodes(nodeType,topNode = None, fullpath = False,ignorNodeTypes =[],nameSpace = None):
+    index = getSceneIndex()
+    nodeIds = listTypeNodeIds(index,nodeType,fullpath)
+
+    if topNode != None:
+        hierarchyIds = set()
+        for topNodeId in index.nodeIds([topNode]):
+            hierarchyIds.add(topNodeId)
+            hierarchyIds.update(index.descendantIds(topNodeId))
+
+        nodeIds = nodeIds & hierarchyIds
+
+    for ignorType in ignorNodeTypes:
+        nodeIds = nodeIds - listTypeNodeIds(index,ignorType,fullpath)
+
+    nodeIds = nodeIds - index.defaultIds
+
+    if nameSpace != None:
+        nodeIds = nodeIds & index.nameSpaceIds.get(nameSpace,set())
+
+    return index.nodeNames(nodeIds,fullpath)
+
+##--------------------------------------------------------
+## MARK: scene index
+##--------------------------------------------------------
+def getLeafName(longName):
+    return longName.rsplit("|",1)[-1]
+
+def getShortNames(longNames):
+    parts = [longName.split("|") for longName in longNames]
+    shortNames = [None] * len(parts)
+    depth = 1
+
+    while None in shortNames:
+        suffixCounts = {}
+        for i in range(0,len(parts)):
+            suffix = tuple(parts[i][-depth:])
+            suffixCounts[suffix] = suffixCounts.get(suffix,0) + 1
+
+        for i in range(0,len(parts)):
+            if shortNames[i] != None:
+                continue
+
+            if suffixCounts[tuple(parts[i][-depth:])] == 1 or depth >= len(parts[i]):
+                shortNames[i] = "|".join(parts[i][-depth:])
+
+        depth += 1
+
+    return shortNames
+
+def getNodeLongName(node):
+    if node.hasFn(om2.MFn.kDagNode):
+        return om2.MDagPath.getAPathTo(node).fullPathName()
+
+    return om2.MFnDependencyNode(node).name()
+
+def getNodeObject(nodeName):
+    selList = om2.MSelectionList()
+    try:
+        selList.add(nodeName)
+    except:
+        return None
+
+    return selList.getDependNode(0)
+
+class SceneNodeIndex(object):
+    def __init__(self):
+        self.names = {False:[],True:[]}
+        self.nameToId = {False:{},True:{}}
+        self.nodeTypes = []
+        self.inheritedTypes = {}
+        self.typeBuckets = {}
+        self.nameSpaceIds = {}
+        self.parentIds = {}
+        self.childIds = {}
+        self.defaultIds = set()
+        self.leafIds = {}
+
+        self.build()
+
+    def build(self):
+        nodeInfo = cmds.ls(long = True,showType = True) or []
+        defaultNodes = set(cmds.ls(defaultNodes = True,long = True) or [])
+
+        for i in range(0,len(nodeInfo),2):
+            self.addEntry(nodeInfo[i],nodeInfo[i +1],nodeInfo[i] in defaultNodes)
+
+        for nodeId in range(0,len(self.nodeTypes)):
+            self.linkParent(nodeId)
+
+        for leafName in self.leafIds:
+            if len(self.leafIds[leafName]) > 1:
+                self.updateShortNames(leafName)
+
+    ##--------------------------------------------------------
+    def addEntry(self,longName,nodeType,isDefault):
+        nodeId = len(self.nodeTypes)
+        leafName = getLeafName(longName)
+
+        self.names[False].append(leafName)
+        self.names[True].append(longName)
+        self.nameToId[False][leafName] = nodeId
+        self.nameToId[True][longName] = nodeId
+        self.nodeTypes.append(nodeType)
+
+        for inheritedType in self.getInheritedTypes(nodeType):
+            self.typeBuckets.setdefault(inheritedType,set()).add(nodeId)
+
+        self.addNameSpace(nodeId)
+
+        if longName.startswith("|"):
+            self.leafIds.setdefault(leafName,set()).add(nodeId)
+
+        if isDefault:
+            self.defaultIds.add(nodeId)
+
+        return nodeId
+
+    def removeEntry(self,nodeId):
+        longName = self.names[True][nodeId]
+        leafName = getLeafName(longName)
+
+        self.unlinkParent(nodeId)
+        for childId in self.childIds.pop(nodeId,[]):
+            self.parentIds.pop(childId,None)
+
+        for inheritedType in self.getInheritedTypes(self.nodeTypes[nodeId]):
+            self.typeBuckets[inheritedType].discard(nodeId)
+
+        self.removeNameSpace(nodeId)
+        self.defaultIds.discard(nodeId)
+        self.nameToId[True].pop(longName,None)
+        if self.nameToId[False].get(self.names[False][nodeId]) == nodeId:
+            del self.nameToId[False][self.names[False][nodeId]]
+
+        self.names[False][nodeId] = None
+        self.names[True][nodeId] = None
+
+        if nodeId in self.leafIds.get(leafName,set()):
+            self.leafIds[leafName].discard(nodeId)
+            self.updateShortNames(leafName)
+
+    def renameEntry(self,nodeId,longName):
+        oldLeafName = getLeafName(self.names[True][nodeId])
+        leafNames = set([oldLeafName,getLeafName(longName)])
+
+        self.removeNameSpace(nodeId)
+        self.unlinkParent(nodeId)
+        if self.nameToId[False].get(self.names[False][nodeId]) == nodeId:
+            del self.nameToId[False][self.names[False][nodeId]]
+
+        if nodeId in self.leafIds.get(oldLeafName,set()):
+            self.leafIds[oldLeafName].discard(nodeId)
+
+        stack = [(nodeId,longName)]
+        while stack:
+            entryId,entryName = stack.pop()
+            del self.nameToId[True][self.names[True][entryId]]
+            self.names[True][entryId] = entryName
+            self.nameToId[True][entryName] = entryId
+            leafNames.add(getLeafName(entryName))
+
+            for childId in self.childIds.get(entryId,[]):
+                stack.append((childId,entryName + "|" + getLeafName(self.names[True][childId])))
+
+        self.names[False][nodeId] = getLeafName(longName)
+        self.nameToId[False][self.names[False][nodeId]] = nodeId
+        if longName.startswith("|"):
+            self.leafIds.setdefault(getLeafName(longName),set()).add(nodeId)
+
+        self.addNameSpace(nodeId)
+        self.linkParent(nodeId)
+
+        for leafName in leafNames:
+            self.updateShortNames(leafName)
+
+    def linkParent(self,nodeId):
+        parentName = self.names[True][nodeId].rsplit("|",1)[0]
+        parentId = self.nameToId[True].get(parentName)
+        if parentName == "" or parentId == None:
+            return
+
+        self.parentIds[nodeId] = parentId
+        self.childIds.setdefault(parentId,[]).append(nodeId)
+
+    def unlinkParent(self,nodeId):
+        parentId = self.parentIds.pop(nodeId,None)
+        if parentId != None and nodeId in self.childIds.get(parentId,[]):
+            self.childIds[parentId].remove(nodeId)
+
+    def addNameSpace(self,nodeId):
+        nameSpaces = getLeafName(self.names[True][nodeId]).split(":")[:-1]
+        for i in range(1,len(nameSpaces) +1):
+            self.nameSpaceIds.setdefault(":".join(nameSpaces[:i]),set()).add(nodeId)
+
+    def removeNameSpace(self,nodeId):
+        nameSpaces = getLeafName(self.names[True][nodeId]).split(":")[:-1]
+        for i in range(1,len(nameSpaces) +1):
+            self.nameSpaceIds.get(":".join(nameSpaces[:i]),set()).discard(nodeId)
+
+    def updateShortNames(self,leafName):
+        nodeIds = sorted(self.leafIds.get(leafName,set()))
+        shortNames = getShortNames([self.names[True][nodeId] for nodeId in nodeIds])
+
+        for i in range(0,len(nodeIds)):
+            oldShortName = self.names[False][nodeIds[i]]
+            if self.nameToId[False].get(oldShortName) == nodeIds[i]:
+                del self.nameToId[False][oldShortName]
+
+            self.names[False][nodeIds[i]] = shortNames[i]
+
+        for i in range(0,len(nodeIds)):
+            self.nameToId[False][shortNames[i]] = nodeIds[i]
+
+    ##--------------------------------------------------------
+    def findNodeId(self,node,longName):
+        nodeId = self.nameToId[True].get(longName)
+        if nodeId != None:
+            return nodeId
+
+        staleIds = []
+        for candidateId in self.leafIds.get(getLeafName(longName),set()):
+            candidate = getNodeObject(self.names[True][candidateId])
+            if candidate == None or candidate == node:
+                staleIds.append(candidateId)
+
+        if len(staleIds) == 1:
+            return staleIds[0]
+
+        return None
+
+    def nodeAdded(self,node):
+        longName = getNodeLongName(node)
+        if longName == "" or longName in self.nameToId[True]:
+            return True
+
+        dnFn = om2.MFnDependencyNode(node)
+        nodeId = self.addEntry(longName,dnFn.typeName,dnFn.isDefaultNode)
+        self.linkParent(nodeId)
+        self.updateShortNames(getLeafName(longName))
+        return True
+
+    def nodeRemoved(self,node):
+        nodeId = self.findNodeId(node,getNodeLongName(node))
+        if nodeId == None:
+            return False
+
+        self.removeEntry(nodeId)
+        return True
+
+    def nodeRenamed(self,node,prevName):
+        longName = getNodeLongName(node)
+        if longName in self.nameToId[True]:
+            return True
+
+        oldLongName = prevName
+        if longName.startswith("|"):
+            oldLongName = longName.rsplit("|",1)[0] + "|" + prevName
+
+        nodeId = self.nameToId[True].get(oldLongName)
+        if nodeId == None:
+            return False
+
+        self.renameEntry(nodeId,longName)
+        return True
+
+    def nodeMoved(self,node):
+        longName = getNodeLongName(node)
+        if longName == "" or longName in self.nameToId[True]:
+            return True
+
+        nodeId = self.findNodeId(node,longName)
+        if nodeId == None:
+            return False
+
+        self.renameEntry(nodeId,longName)
+        return True
+
+    ##--------------------------------------------------------
+    def getInheritedTypes(self,nodeType):
+        if nodeType not in self.inheritedTypes:
+            self.inheritedTypes[nodeType] = set(cmds.nodeType(nodeType,inherited = True,isTypeName = True) or [nodeType])
+
+        return self.inheritedTypes[nodeType]
+
+    def typeIds(self,nodeType):
+        return set(self.typeBuckets.get(nodeType,set()))
+
+    def isType(self,nodeId,nodeType):
+        return nodeType in self.inheritedTypes[self.nodeTypes[nodeId]]
+
+    def transformIds(self,nodeIds):
+        transformIds = set()
+
+        for nodeId in nodeIds:
+            if self.isType(nodeId,"transform"):
+                transformIds.add(nodeId)
+
+            elif self.isType(nodeId,"shape") and nodeId in self.parentIds:
+                transformIds.add(self.parentIds[nodeId])
+
+        return transformIds
+
+    def descendantIds(self,nodeId):
+        descendantIds = set()
+        stack = list(self.childIds.get(nodeId,[]))
+
+        while stack:
+            childId = stack.pop()
+            if childId in descendantIds:
+                continue
+
+            descendantIds.add(childId)
+            stack.extend(self.childIds.get(childId,[]))
+
+        return descendantIds
+
+    def nodeIds(self,nodes):
+        nodeIds = set()
+
+        for node in nodes:
+            if node in self.nameToId[True]:
+                nodeIds.add(self.nameToId[True][node])
+
+            elif node in self.nameToId[False]:
+                nodeIds.add(self.nameToId[False][node])
+
+        return nodeIds
+
+    def nodeNames(self,nodeIds,fullpath = False):
+        names = self.names[fullpath]
+        return [names[nodeId] for nodeId in nodeIds]
+
+_sceneIndex = None
+_sceneIndexSuspendCount = 0
+
+if "_sceneIndexCallbackIds" in globals():
+    removeMessageCallbacks(_sceneIndexCallbackIds)
+_sceneIndexCallbackIds = []
+
+SCENEINDEXSUSPENDMESSAGES = [
+                                ["kBeforeOpen","kAfterOpen"],
+                                ["kBeforeNew","kAfterNew"],
+                                ["kBeforeImport","kAfterImport"],
+                                ["kBeforeCreateReference","kAfterCreateReference"],
+                                ["kBeforeLoadReference","kAfterLoadReference"],
+                                ["kBeforeUnloadReference","kAfterUnloadReference"],
+                                ["kBeforeRemoveReference","kAfterRemoveReference"]
+]
+
+def invalidateSceneIndex(*args):
+    global _sceneIndex
+    _sceneIndex = None
+
+## bulk loads drop the index instead of patching it node by node, the next query rebuilds it
+def suspendSceneIndex(*args):
+    global _sceneIndexSuspendCount
+    _sceneIndexSuspendCount += 1
+    invalidateSceneIndex()
+
+    if _sceneIndexSuspendCount == 1 and isBatchMode() == False:
+        maya.utils.executeDeferred(resetSceneIndexSuspend)
+
+def resumeSceneIndex(*args):
+    global _sceneIndexSuspendCount
+    _sceneIndexSuspendCount = max(0,_sceneIndexSuspendCount -1)
+    invalidateSceneIndex()
+
+## an open cancelled after its before callback never sends the after callback
+def resetSceneIndexSuspend():
+    global _sceneIndexSuspendCount
+    _sceneIndexSuspendCount = 0
+
+def updateSceneIndex(method,*args):
+    if _sceneIndex == None or _sceneIndexSuspendCount > 0:
+        return
+
+    try:
+        updated = getattr(_sceneIndex,method)(*args)
+    except Exception:
+        updated = False
+
+    if updated == False:
+        invalidateSceneIndex()
+
+def sceneIndexNodeAdded(node,*args):
+    updateSceneIndex("nodeAdded",node)
+
+def sceneIndexNodeRemoved(node,*args):
+    updateSceneIndex("nodeRemoved",node)
+
+def sceneIndexNodeRenamed(node,prevName,*args):
+    updateSceneIndex("nodeRenamed",node,prevName)
+
+def sceneIndexDagChanged(changeType,child,parent,*args):
+    updateSceneIndex("nodeMoved",child.node())
+
+def registerSceneIndexCallbacks():
+    if len(_sceneIndexCallbackIds) > 0:
+        return
+
+    _sceneIndexCallbackIds.append(om2.MDGMessage.addNodeAddedCallback(sceneIndexNodeAdded,"dependNode"))
+    _sceneIndexCallbackIds.append(om2.MDGMessage.addNodeRemovedCallback(sceneIndexNodeRemoved,"dependNode"))
+    _sceneIndexCallbackIds.append(om2.MNodeMessage.addNameChangedCallback(om2.MObject.kNullObj,sceneIndexNodeRenamed))
+    _sceneIndexCallbackIds.append(om2.MDagMessage.addAllDagChangesCallback(sceneIndexDagChanged))
+
+    for beforeMessage,afterMessage in SCENEINDEXSUSPENDMESSAGES:
+        _sceneIndexCallbackIds.append(om2.MSceneMessage.addCallback(getattr(om2.MSceneMessage,beforeMessage),suspendSceneIndex))
+        _sceneIndexCallbackIds.append(om2.MSceneMessage.addCallback(getattr(om2.MSceneMessage,afterMessage),resumeSceneIndex))
+
+def removeSceneIndexCallbacks():
+    removeMessageCallbacks(_sceneIndexCallbackIds)
+    invalidateSceneIndex()
+
+def getSceneIndex():
+    global _sceneIndex
+
+    registerSceneIndexCallbacks()
+
+    if _sceneIndexSuspendCount > 0:
+        return SceneNodeIndex()
+
+    if _sceneIndex == None:
+        _sceneIndex = SceneNodeIndex()
+
+    return _sceneIndex
+
+##--------------------------------------------------------
+## MARK: frame range / camera info
+##--------------------------------------------------------
+def getFrameRange(rangeFrom):
+    if rangeFrom == "animation":
+        start = cmds.playbackOptions(q =True, animationStartTime=True)
+        end = cmds.playbackOptions(q =True, animationEndTime=True)
+
+    elif rangeFrom == "timeSlider":
+        start = cmds.playbackOptions(q =True, minTime=True)
+        end = cmds.playbackOptions(q =True, maxTime=True)
+
+    elif rangeFrom == "renderSetting":
+        start = cmds.getAttr("defaultRenderGlobals.startFrame")
+        end = cmds.getAttr("defaultRenderGlobals.endFrame")
+
+    elif rangeFrom == "selection":
+        aPlayBackSliderPython = mel.eval('$tmpVar=$gPlayBackSlider')
+        s_e = cmds.timeControl(aPlayBackSliderPython, q=True, rangeArray=True)
+        start = s_e[0]
+        end = s_e[1]
+
+    return start,end
+
+CAMATTRS = [
+    {"attrName":"startFrame","type":"double","rangeDefault":0, "min":-10000,"max":10000},
+    {"attrName":"endFrame","type":"double","rangeDefault":1, "min":-10000,"max":10000},
+    # {"attrName":"resolutionW","type":"long","default":cmds.getAttr("defaultResolution.width"), "min":1,"max":100000},
+    # {"attrName":"resolutionH","type":"long","default":cmds.getAttr("defaultResolution.height"), "min":1,"max":100000},
+    {"attrName":"playblast","type":"bool","default":False},
+]
+
+class CameraAttrSchema(object):
+    def __init__(self):
+        self.attrs = CAMATTRS
+        self.attrDict = {}
+        self.defaultRange = None
+        self.callbackIds = []
+
+        for attrDict in self.attrs:
+            self.attrDict[attrDict["attrName"]] = attrDict
+
+    def registerCallbacks(self):
+        for eventName in ["playbackRangeChanged","playbackRangeSliderChanged","SceneOpened","NewSceneOpened"]:
+            self.callbackIds.append(om2.MEventMessage.addEventCallback(eventName,self.invalidate))
+
+    def removeCallbacks(self):
+        removeMessageCallbacks(self.callbackIds)
+
+    def invalidate(self,*args):
+        self.defaultRange = None
+
+    def default(self,attrName):
+        attrDict = self.attrDict[attrName]
+
+        if "rangeDefault" not in attrDict:
+            return attrDict["default"]
+
+        if self.defaultRange == None:
+            self.defaultRange = getFrameRange("animation")
+
+        return self.defaultRange[attrDict["rangeDefault"]]
+
+    def resolve(self,attrName):
+        attrDict = dict(self.attrDict[attrName])
+        attrDict["default"] = self.default(attrName)
+        return attrDict
+
+_camAttrSchema = None
+
+def getCamAttrSchema():
+    global _camAttrSchema
+
+    if _camAttrSchema == None:
+        _camAttrSchema = CameraAttrSchema()
+        _camAttrSchema.registerCallbacks()
+
+    return _camAttrSchema
+
+def getCamAttrDict():
+    schema = getCamAttrSchema()
+    return [schema.resolve(attrDict["attrName"]) for attrDict in schema.attrs]
+
+def setCameraInfo(node,valueDict):
+    schema = getCamAttrSchema()
+
+    for attrDict in schema.attrs:
+        attrName = attrDict["attrName"]
+        attrType = attrDict["type"]
+        
+
+        if valueDict == None:
+            value = schema.default(attrName)
+
+        elif attrName not in list(valueDict.keys()):
+            continue
+        
+        if valueDict != None and attrName in list(valueDict.keys()):
+            value = valueDict[attrName]
+
+
+        if cmds.objExists(node+ "."+ attrName) == False:
+            if attrDict["type"] == "double":
+                value = float(value)
+
+            elif attrDict["type"] == "long":
+                value = int(value)
+
+            elif attrDict["type"] == "bool":
+                value = bool(value)
+
+            cmds.addAttr(node, at = attrType, ln = attrName,dv = value)
+
+        cmds.setAttr(node + "." + attrName,value)
+
+def createCameraInfoNode(rootsetName,cameraname):
+
+    if cmds.objExists(rootsetName) == False:
+        cmds.sets(name = rootsetName,empty =True)
+
+    if cmds.objExists(cameraname + "_infoSet",) == False:
+        cmds.sets(name = cameraname + "_infoSet",empty=True)
+        cmds.sets(cameraname + "_infoSet",forceElement = rootsetName)
+        setCameraInfo(cameraname + "_infoSet",None)
+
+    return cameraname + "_infoSet"
+
+def findAttrInfo(attrName):
+    schema = getCamAttrSchema()
+    if attrName in schema.attrDict:
+        return schema.resolve(attrName)
+    
+    return {}
+
+def getCameraInfo(rootsetName,cameraname):
+    node = createCameraInfoNode(rootsetName,cameraname)
+    schema = getCamAttrSchema()
+    valueDict = {}
+
+    for attrDict in schema.attrs:
+        attrName = attrDict["attrName"]
+
+        if cmds.objExists(node+ "."+ attrName) == False:
+            value = schema.default(attrName)
+        else:
+            value = cmds.getAttr(node + "." +attrName)
+
+        valueDict[attrName] = value
+    
+    return valueDict
+
+def getDefaultCameraInfo():
+    schema = getCamAttrSchema()
+    return dict([(attrDict["attrName"],schema.default(attrDict["attrName"])) for attrDict in schema.attrs])
+
+def readCameraInfoTable(rootsetName):
+    cameraInfoTable = {}
+
+    selList = om2.MSelectionList()
+    try:
+        selList.add(rootsetName)
+    except:
+        return cameraInfoTable
+
+    rootSet = selList.getDependNode(0)
+    if rootSet.hasFn(om2.MFn.kSet) == False:
+        return cameraInfoTable
+
+    schema = getCamAttrSchema()
+    members = om2.MFnSet(rootSet).getMembers(False)
+
+    for i in range(0,members.length()):
+        try:
+            dnFn = om2.MFnDependencyNode(members.getDependNode(i))
+        except:
+            continue
+
+        setName = dnFn.name()
+        if setName.endswith("_infoSet") == False:
+            continue
+
+        valueDict = {}
+        for attrDict in schema.attrs:
+            attrName = attrDict["attrName"]
+
+            if dnFn.hasAttribute(attrName) == False:
+                valueDict[attrName] = schema.default(attrName)
+                continue
+
+            plug = dnFn.findPlug(attrName,False)
+            if attrDict["type"] == "bool":
+                valueDict[attrName] = plug.asBool()
+
+            elif attrDict["type"] == "long":
+                valueDict[attrName] = plug.asInt()
+
+            else:
+                valueDict[attrName] = plug.asDouble()
+
+        cameraInfoTable[setName[:-len("_infoSet")]] = valueDict
+
+    return cameraInfoTable
+
+def getCameraShapeHandles():
+    cameraShapes = {}
+
+    nodeIt = om2.MItDependencyNodes(om2.MFn.kCamera)
+    while not nodeIt.isDone():
+        handle = om2.MObjectHandle(nodeIt.thisNode())
+        cameraShapes[handle.hashCode()] = handle
+        nodeIt.next()
+
+    return cameraShapes
+
+def listCameraTransforms(cameraShapes,skipOrthographic = False):
+    cameras = set()
+
+    for key in list(cameraShapes.keys()):
+        handle = cameraShapes[key]
+
+        if handle.isValid() == False:
+            del cameraShapes[key]
+            continue
+
+        dagFn = om2.MFnDagNode(handle.object())
+        if dagFn.parentCount() == 0:
+            continue
+
+        if skipOrthographic and dagFn.findPlug("orthographic",False).asBool():
+            continue
+
+        transform = dagFn.parent(0)
+        if om2.MFnDependencyNode(transform).isDefaultNode:
+            continue
+
+        cameras.add(om2.MDagPath.getAPathTo(transform).partialPathName())
+
+    return sorted(cameras)
+
+def getPlayblastCam(rootsetName,cameraInfoTable = None):
+    if cameraInfoTable == None:
+        cameraInfoTable = readCameraInfoTable(rootsetName)
+
+    enabledCameras = []
+
+    for camera in cameraInfoTable:
+        if cameraInfoTable[camera]["playblast"]:
+            enabledCameras.append(camera)
+
+    return enabledCameras
+
+
+def getCurSceneName():
+    fullPath = cmds.file(q=True, sn=True)
+    fileName = os.path.basename(fullPath)
+    filePath = os.path.dirname(fullPath)
+
+    if filePath != "":
+        filePath += "/"
+        
+    fileNameBody, extension = os.path.splitext(fileName)
+    
+    return filePath,fileNameBody,extension
+
+def generateOutputName(camera,fileNameFormat):
+    filePath,fileNameBody,extension = getCurSceneName()
+
+    fileNameParts = {
+                        "scene":fileNameBody,
+                        "camera":camera
+                        # "version":str(version).zfill(4)
+    }
+    fileName = fileNameFormat.format(**fileNameParts)
+    return fileName
+
+def checkNeedSave():
+    fileCheckState = cmds.file(q=True, modified=True)
+    curOpen = cmds.file(q=True, sn=True)
+
+    if curOpen == "":
+        curOpen = "untitled"
+
+    if fileCheckState:
+        mel.eval("checkForUnknownNodes();")
+        saved = mel.eval("saveChanges(\"\");")
+
+        if saved == 0:
+            return False
+
+    return True
+
+##----------------------------------------------------------------------------------
+##MARK:report
+##----------------------------------------------------------------------------------
+PLAYBLASTREPORTDIR = "playblastReports"
+PLAYBLASTREPORTVERSION = 1
+
+class PlayblastRunReport(object):
+    def __init__(self,action,batchMode = ""):
+        self.action = action
+        self.batchMode = batchMode
+        self.startTime = time.time()
+        self.perfStart = time.perf_counter()
+        self.seconds = None
+        self.phases = {}
+        self.cameras = {}
+        self.cameraOrder = []
+
+    def getCamera(self,camera):
+        if camera not in self.cameras:
+            self.cameras[camera] = {
+                                    "camera":   camera,
+                                    "frames":   0,
+                                    "phases":   {}
+            }
+            self.cameraOrder.append(camera)
+
+        return self.cameras[camera]
+
+    def addFrames(self,camera,frames):
+        self.getCamera(camera)["frames"] += int(frames)
+
+    def addPhase(self,name,seconds,camera = None):
+        if camera == None:
+            phases = self.phases
+        else:
+            phases = self.getCamera(camera)["phases"]
+
+        phases[name] = phases.get(name,0.0) + seconds
+
+    def addCameraResult(self,camera,frames,status,phases):
+        self.addFrames(camera,frames)
+        self.getCamera(camera)["status"] = status
+
+        for name in phases:
+            self.addPhase(name,phases[name],camera)
+
+    def stop(self):
+        if self.seconds == None:
+            self.seconds = time.perf_counter() - self.perfStart
+
+    def build(self):
+        seconds = self.seconds
+        if seconds == None:
+            seconds = time.perf_counter() - self.perfStart
+
+        phases = dict(self.phases)
+        cameras = []
+        frames = 0
+
+        for camera in self.cameraOrder:
+            cameraReport = dict(self.cameras[camera])
+            cameraPhases = cameraReport["phases"]
+            blastSeconds = cameraPhases.get("playblast",0.0)
+
+            cameraReport["seconds"] = sum(cameraPhases.values())
+            cameraReport["framesPerSecond"] = cameraReport["frames"] / blastSeconds if blastSeconds > 0 else None
+            cameras.append(cameraReport)
+            frames += cameraReport["frames"]
+
+            for name in cameraPhases:
+                phases[name] = phases.get(name,0.0) + cameraPhases[name]
+
+        return {
+                "version":          PLAYBLASTREPORTVERSION,
+                "action":           self.action,
+                "batchMode":        self.batchMode,
+                "scene":            cmds.file(q=True, sn=True),
+                "mayaVersion":      cmds.about(version = True),
+                "startTime":        time.strftime("%Y-%m-%dT%H:%M:%S",time.localtime(self.startTime)),
+                "seconds":          seconds,
+                "frames":           frames,
+                "framesPerSecond":  frames / seconds if seconds > 0 else None,
+                "phases":           phases,
+                "cameras":          cameras
+        }
+
+    def write(self,outputDir):
+        if outputDir == "":
+            outputDir = cmds.internalVar(userTmpDir =True)
+
+        reportDir = os.path.join(outputDir,PLAYBLASTREPORTDIR)
+        if os.path.isdir(reportDir) == False:
+            os.makedirs(reportDir)
+
+        sceneName = getCurSceneName()[1] or "untitled"
+        reportPath = os.path.join(reportDir,"{}_{}_{}.json".format(sceneName,self.action,time.strftime("%Y%m%d_%H%M%S",time.localtime(self.startTime)))).replace("\\","/")
+
+        with open(reportPath,"w") as f:
+            json.dump(self.build(),f,indent = 4)
+
+        return reportPath
+
+_playblastReport = None
+
+def startPlayblastReport(action,batchMode = ""):
+    global _playblastReport
+    _playblastReport = PlayblastRunReport(action,batchMode)
+    return _playblastReport
+
+def stopPlayblastReport():
+    global _playblastReport
+    report = _playblastReport
+    _playblastReport = None
+
+    if report != None:
+        report.stop()
+
+    return report
+
+def addReportFrames(camera,frames):
+    if _playblastReport != None:
+        _playblastReport.addFrames(camera,frames)
+
+@contextlib.contextmanager
+def timedPhase(name,camera = None):
+    startTime = time.perf_counter()
+    try:
+        yield
+    finally:
+        if _playblastReport != None:
+            _playblastReport.addPhase(name,time.perf_counter() - startTime,camera)
+
+##----------------------------------------------------------------------------------
+##MARK:history
+##----------------------------------------------------------------------------------
+PLAYBLASTHISTORYFILE = "SSCameraSwitcher_playblastHistory.jsonl"
+HISTORYIGNOREPHASES = ["openScene"]
+
+def getPlayblastHistory():
+    return SSCameraSwitcherWorker.PlayblastHistory(os.path.join(cmds.internalVar(userAppDir =True),PLAYBLASTHISTORYFILE))
+
+def getSceneNodeCount():
+    return len(cmds.ls() or [])
+
+def recordPlayblastHistory(report,resolution,outputFormat,history = None):
+    sceneName = getCurSceneName()[1] or "untitled"
+    nodeCount = getSceneNodeCount()
+    records = []
+
+    for cameraReport in report.build()["cameras"]:
+        phases = cameraReport["phases"]
+        seconds = sum([phases[name] for name in phases if name not in HISTORYIGNOREPHASES])
+
+        if cameraReport["frames"] == 0 or seconds <= 0 or cameraReport.get("status","done") != "done":
+            continue
+
+        records.append(SSCameraSwitcherWorker.buildHistoryRecord(sceneName,cameraReport["camera"],cameraReport["frames"],seconds,resolution,nodeCount,outputFormat))
+
+    (history or getPlayblastHistory()).append(records)
+    return records
+
+def estimatePlayblastJobs(jobs,resolution,outputFormat,history = None):
+    estimator = SSCameraSwitcherWorker.PlayblastEstimator((history or getPlayblastHistory()).read())
+    sceneName = getCurSceneName()[1] or "untitled"
+    nodeCount = getSceneNodeCount()
+
+    return [estimator.estimate(sceneName,job["camera"],SSCameraSwitcherWorker.getTaskFrames(job),resolution,nodeCount,outputFormat) for job in jobs]
+
+##----------------------------------------------------------------------------------
+##MARK:journal
+##----------------------------------------------------------------------------------
+PLAYBLASTJOURNALDIR = "playblastJournal"
+
+def getPlayblastJournalPath(outputDir):
+    if outputDir == "":
+        outputDir = cmds.internalVar(userTmpDir =True)
+
+    sceneName = getCurSceneName()[1] or "untitled"
+    return os.path.join(outputDir,PLAYBLASTJOURNALDIR,sceneName + ".jsonl").replace("\\","/")
+
+_playblastJournal = None
+
+def startPlayblastJournal(outputDir,viewItemOption,showHUDs,outputFormat,resolution,frameNumberOffset,resume = False):
+    global _playblastJournal
+    _playblastJournal = SSCameraSwitcherWorker.JsonLinesJournal(getPlayblastJournalPath(outputDir))
+    _playblastJournal.append({
+                                "event":            "start",
+                                "scene":            cmds.file(q=True, sn=True),
+                                "resume":           resume,
+                                "viewItemOption":   viewItemOption,
+                                "showHUDs":         showHUDs,
+                                "outputFormat":     outputFormat,
+                                "resolution":       resolution,
+                                "frameNumberOffset":frameNumberOffset
+    })
+    return _playblastJournal
+
+def stopPlayblastJournal():
+    global _playblastJournal
+    journal = _playblastJournal
+    _playblastJournal = None
+
+    if journal != None:
+        journal.append({"event":"stop"})
+
+    return journal
+
+def journalPlan(jobs):
+    if _playblastJournal == None:
+        return
+
+    for i in range(0,len(jobs)):
+        _playblastJournal.append({
+                                    "event":        "plan",
+                                    "camera":       jobs[i]["camera"],
+                                    "outputPath":   jobs[i]["outputPath"],
+                                    "timeRange":    list(jobs[i]["timeRange"])
+        },sync = i == len(jobs) - 1)
+
+## frames are journaled in scene time, timeOffset maps the shot's sequence time back onto the planned range
+def journalFrame(journal,camera,timeOffset,mTime,clientData):
+    journal.append({"event":"frame","camera":camera,"frame":mTime.value + timeOffset},sync = False)
+
+def readResumeState(journalPath):
+    events = SSCameraSwitcherWorker.JsonLinesJournal(journalPath).read()
+
+    startIndex = None
+    for i in range(0,len(events)):
+        if events[i]["event"] == "start" and events[i]["resume"] == False:
+            startIndex = i
+
+    if startIndex == None:
+        return None,[]
+
+    settings = events[startIndex]
+    plans = []
+    planIndex = {}
+    results = {}
+    lastFrames = {}
+
+    for event in events[startIndex:]:
+        if event["event"] == "plan" and event["outputPath"] not in planIndex:
+            planIndex[event["outputPath"]] = len(plans)
+            plans.append(event)
+
+        elif event["event"] == "frame":
+            lastFrames[event["camera"]] = event["frame"]
+
+        elif event["event"] == "result":
+            results[event["outputPath"]] = event["status"]
+            lastFrames.pop(event["camera"],None)
+
+    jobs = []
+    for plan in plans:
+        timeRange = plan["timeRange"]
+        files = getPlayblastOutputFiles(plan["outputPath"],settings["outputFormat"],timeRange,settings["frameNumberOffset"])
+
+        if COMPRESSIONDICT[settings["outputFormat"]][1] == "movie":
+            frameRanges = []
+            if results.get(plan["outputPath"]) != "done" or os.path.isfile(files[0]) == False:
+                frameRanges = [[int(timeRange[0]),int(timeRange[1])]]
+
+        else:
+            frames = getFrames(timeRange[0],timeRange[1],1)
+            missingFrames = [frames[i] for i in range(0,len(frames)) if os.path.isfile(files[i]) == False]
+
+            if results.get(plan["outputPath"]) != "done" and lastFrames.get(plan["camera"]) in frames:
+                missingFrames.append(int(lastFrames[plan["camera"]]))
+
+            frameRanges = groupFrameRanges(missingFrames)
+
+        if len(frameRanges) > 0:
+            jobs.append({
+                            "camera":       plan["camera"],
+                            "outputPath":   plan["outputPath"],
+                            "timeRange":    timeRange,
+                            "frameRanges":  frameRanges
+            })
+
+    return settings,jobs
+
+def resumePlayblastJobs(outputDir,onJobDone = None):
+    settings,jobs = readResumeState(getPlayblastJournalPath(outputDir))
+    if settings == None:
+        return None
+
+    viewItemOption = settings["viewItemOption"]
+    playblastPanel = PlayblastPanel(viewItemOption)
+    viewState = PlayblastViewState()
+    viewState.snapshot()
+
+    startPlayblastJournal(outputDir,viewItemOption,settings["showHUDs"],settings["outputFormat"],settings["resolution"],settings["frameNumberOffset"],resume = True)
+    try:
+        for job in jobs:
+            for frameRange in job["frameRanges"]:
+                print("resume playblast {} frames {}-{}".format(job["camera"],frameRange[0],frameRange[1]))
+                playBlastProcess(
+                                job["camera"],
+                                viewItemOption,
+                                settings["showHUDs"],
+                                job["outputPath"],
+                                settings["outputFormat"],
+                                list(frameRange),
+                                settings["resolution"],
+                                settings["frameNumberOffset"],
+                                playblastPanel = playblastPanel,
+                                viewState = viewState,
+                                sequenceStart = int(frameRange[0]) - int(job["timeRange"][0]) + 1
+                            )
+
+            if onJobDone != None:
+                onJobDone(job)
+
+    finally:
+        stopPlayblastJournal()
+        playblastPanel.close()
+        viewState.restore()
+
+    return jobs
+
+##----------------------------------------------------------------------------------
+##MARK:playblast
+##----------------------------------------------------------------------------------
+VIEWITEMSETTING = {
+                "cameras":          False,
+                "grid":             False,
+                "handles":          False,
+                "hairSystems":      False,
+                "headsUpDisplay":   True,
+                "ikHandles":        False,
+                "jointXray":        False,    
+                "manipulators":     False,
+                "motionTrails":     False,
+                "nCloths":          False,
+                "pivots":           False,
+                "activeComponentsXray": False,
+                "activeOnly":           False,
+                "dimensions":           False,
+                "displayAppearance":    "smoothShaded",
+                "displayTextures":      True,
+                "locators":             False,
+                "imagePlane":           False,
+                "joints":               False,
+                "nParticles":           True,
+                "polymeshes":           True,
+                "nurbsCurves":          False,
+                "nurbsSurfaces":        True,
+                "lights":               False,
+                "controlVertices":      False,
+                "selectionHiliteDisplay":   False
+}
+
+VIEWITEMSETTING_KEY = [
+                            "grid",
+                            "handles",
+                            "headsUpDisplay",
+                            "ikHandles",
+                            "manipulators",
+                            "motionTrails",
+                            "nCloths",
+                            "pivots",
+                            "activeOnly",
+                            "dimensions",
+                            "displayTextures",
+                            "locators",
+                            "imagePlane",
+                            "joints",
+                            "nParticles",
+                            "polymeshes",
+                            "nurbsCurves",
+                            "nurbsSurfaces",
+                            "lights",
+                            "controlVertices",
+                            "selectionHiliteDisplay"
+]
+
+HUDSETTING = {
+                "resolutionGate":   False,
+                "cameranames":      True,
+                "focalLength":      True,
+                "sceneTimecode":    False,
+                "frameRate":        False,
+                "viewAxis":         True,
+                "currentFrame":     True
+}
+
+OUTPUTOPTIONDEFAULTS = {
+                "outputOpt":"project",
+                "outputDir":"",
+                "fileNameFormat":"{scene}/{camera}/{scene}_{camera}",
+                "outputFormat":"png",
+                "frameNumberOffset":False,
+                "batchMode":"sequential",
+                "workerCount":2,
+                "chunkSize":0,
+                "skipUnchanged":False,
+                "incremental":False,
+                "postMovie":False,
+                "postThumbnail":False,
+                "reviewDir":"",
+                "stageLocal":False
+}
+
+def readSavedPlayblastOptions(toolName = "SSCameraSwitcher"):
+    optionStore = OptionStore(toolName)
+    savedViewItems = optionStore.read("playblastItem",VIEWITEMSETTING)
+
+    viewItemOption = dict([(settingKey,savedViewItems[settingKey]) for settingKey in VIEWITEMSETTING_KEY])
+    showHUDs = optionStore.read("playblastHUD",HUDSETTING)
+    outputOption = optionStore.read("playblastOutput",OUTPUTOPTIONDEFAULTS)
+
+    return viewItemOption,showHUDs,outputOption
+
+def createShotNode(cameraname,cutName,timeRange,sequenceStart = 1):    
+    shotNode = cmds.shot(cutName, startTime=timeRange[0], endTime = timeRange[1],sequenceStartTime = sequenceStart,currentCamera = cameraname)
+
+    if cmds.objExists(cameraname + ".startFrame"):
+        cmds.connectAttr(cameraname + ".startFrame",shotNode + ".startFrame")
+        cmds.connectAttr(cameraname + ".endFrame",shotNode + ".endFrame")
+
+    return shotNode
+
+COMPRESSIONDICT = {
+                    "png":["png","image"],
+                    "jpg":["jpg","image"],
+                    "avi":["none","movie"]
+                }
+
+def getFrames(startFrame,endFrame,byFrame):
+    frames = []
+    for i in range(int(startFrame),int(endFrame) +1,int(byFrame)):
+        frames.append(i)
+
+    return frames
+
+def groupFrameRanges(frames):
+    frameRanges = []
+
+    for frame in sorted(set(frames)):
+        if len(frameRanges) > 0 and frameRanges[-1][1] == frame - 1:
+            frameRanges[-1][1] = frame
+        else:
+            frameRanges.append([frame,frame])
+
+    return frameRanges
+
+def getOutputFramePath(outputPath,outputFormat,frame):
+    return "{}.{}.{}".format(outputPath.replace("//","/"),str(int(frame)).zfill(4),outputFormat)
+
+def buildPlayblastJob(camera,cameraInfo,outputDir,fileNameFormat):
+    return {
+                "camera":       camera,
+                "outputPath":   outputDir + generateOutputName(camera,fileNameFormat),
+                "timeRange":    [cameraInfo["startFrame"],cameraInfo["endFrame"]]
+            }
+
+def stagePlayblastJob(job,outputDir,scratchDir):
+    job["finalOutputPath"] = job["outputPath"]
+    job["outputPath"] = scratchDir + job["outputPath"][len(outputDir):]
+    return job
+
+def buildPlayblastJobs(cameraInfoTable,cameras,outputDir,fileNameFormat):
+    return [buildPlayblastJob(camera,cameraInfoTable[camera],outputDir,fileNameFormat) for camera in cameras]
+
+def runPlayblastJobs(jobs,viewItemOption,showHUDs,outputFormat,resolution,frameNumberOffset,onJobDone = None,journalDir = None):
+    playblastPanel = PlayblastPanel(viewItemOption)
+    viewState = PlayblastViewState()
+    viewState.snapshot()
+
+    if journalDir != None:
+        startPlayblastJournal(journalDir,viewItemOption,showHUDs,outputFormat,resolution,frameNumberOffset)
+        journalPlan(jobs)
+
+    try:
+        for job in jobs:
+            playBlastProcess(job["camera"],viewItemOption,showHUDs,job["outputPath"],outputFormat,list(job["timeRange"]),resolution,frameNumberOffset,playblastPanel = playblastPanel,viewState = viewState)
+
+            if onJobDone != None:
+                onJobDone(job)
+
+    finally:
+        if journalDir != None:
+            stopPlayblastJournal()
+
+        playblastPanel.close()
+        viewState.restore()
+
+def multiCameraPlayBlast(jobs,viewItemOption,showHUDs,outputFormat,resolution,frameNumberOffset,viewState = None):
+    startJobs = {}
+    endJobs = {}
+    frames = set()
+
+    for job in jobs:
+        jobFrames = getFrames(job["timeRange"][0],job["timeRange"][1],1)
+        if len(jobFrames) == 0:
+            continue
+
+        startJobs.setdefault(jobFrames[0],[]).append(job)
+        endJobs.setdefault(jobFrames[-1],[]).append(job)
+        frames.update(jobFrames)
+
+    restoreView = viewState == None
+    if viewState == None:
+        viewState = PlayblastViewState()
+        viewState.snapshot()
+
+    cmds.select(cl = True)
+    curTime = cmds.currentTime(q = True)
+    activePanels = {}
+    freePanels = []
+    allPanels = []
+
+    try:
+        for frame in sorted(frames):
+            for job in startJobs.get(frame,[]):
+                if len(freePanels) > 0:
+                    playblastPanel = freePanels.pop()
+                else:
+                    playblastPanel = PlayblastPanel(viewItemOption)
+                    allPanels.append(playblastPanel)
+
+                playblastPanel.setCamera(job["camera"])
+                activePanels[job["camera"]] = (job,playblastPanel)
+
+            cmds.currentTime(frame, update = True)
+
+            for camera in activePanels:
+                job,playblastPanel = activePanels[camera]
+                viewState.prepare(camera,showHUDs,viewItemOption["headsUpDisplay"])
+
+                if playblastPanel.panel == None:
+                    playblastPanel.setCamera(camera)
+
+                blastPath = job["outputPath"]
+                if frameNumberOffset:
+                    blastPath = job["outputPath"] + "_tmpFrame"
+
+                with timedPhase("playblast",camera):
+                    cmds.playblast(
+                                filename =          blastPath.replace("//","/"),
+                                forceOverwrite =    True,
+                                format =            COMPRESSIONDICT[outputFormat][1],
+                                compression =       COMPRESSIONDICT[outputFormat][0],
+                                frame =             [frame],
+                                viewer =            False,
+                                showOrnaments =     True,
+                                offScreen =         True,
+                                fp = 4, 
+                                percent = 100,
+                                quality = 100,
+                                widthHeight =       resolution,
+                                **getPanelOption(playblastPanel.panel)
+                            )
+                addReportFrames(camera,1)
+
+                if frameNumberOffset:
+                    framePath = getOutputFramePath(blastPath,outputFormat,frame)
+                    sequencePath = getOutputFramePath(job["outputPath"],outputFormat,frame - int(job["timeRange"][0]) + 1)
+
+                    if os.path.isfile(framePath):
+                        if os.path.isfile(sequencePath):
+                            os.remove(sequencePath)
+                        os.rename(framePath,sequencePath)
+
+            for job in endJobs.get(frame,[]):
+                freePanels.append(activePanels.pop(job["camera"])[1])
+
+    finally:
+        for playblastPanel in allPanels:
+            playblastPanel.close()
+
+        cmds.currentTime(curTime, update = True)
+
+        if restoreView:
+            viewState.restore()
+
+def excutePlayBlast(viewItemOption,camera,outputPath,outputFormat,timeRange,resolution,frameNumberOffset,nodes =None,panel = None,playblastPanel = None):
+    cmds.select(cl = True)
+    window = None
+    
+    if playblastPanel != None:
+        panel = playblastPanel.setCamera(camera,nodes)
+
+    elif isBatchMode():
+        cmds.lookThru(camera)
+
+    else:
+        if panel == None:
+            with timedPhase("createPanel",camera):
+                window,panel = createTmpView()
+                cmds.modelEditor(panel, edit=True, **viewItemOption)
+
+        cmds.modelEditor(panel, edit=True, camera=camera)
+
+        if nodes != None:
+            setIsolateView(panel,nodes)
+
+    compressionDict = COMPRESSIONDICT
+    
+    outputPath = outputPath.replace("//","/")
+
+    with timedPhase("playblast",camera):
+        if frameNumberOffset:
+            cmds.playblast(
+                        filename =          outputPath,
+                        forceOverwrite =    True,
+                        format =            compressionDict[outputFormat][1],
+                        compression =       compressionDict[outputFormat][0],
+                        sequenceTime =      True,
+                        clearCache =        1,
+                        viewer =            False,
+                        showOrnaments =     True,
+                        offScreen =         True,
+                        fp = 4, 
+                        percent = 100,
+                        quality = 100,
+                        startTime =         timeRange[0],
+                        endTime =           timeRange[1],
+                        widthHeight =       resolution,
+                        **getPanelOption(panel)
+                    )
+        else:
+            cmds.playblast(
+                        filename =          outputPath,
+                        forceOverwrite =    True,
+                        format =            compressionDict[outputFormat][1],
+                        compression =       compressionDict[outputFormat][0],
+                        sequenceTime =      0,
+                        clearCache =        1,
+                        viewer =            False,
+                        showOrnaments =     True,
+                        offScreen =         True,
+                        fp = 4, 
+                        percent = 100,
+                        quality = 100,
+                        startTime =         timeRange[0],
+                        endTime =           timeRange[1],
+                        widthHeight =       resolution,
+                        **getPanelOption(panel)
+                    )
+
+    if playblastPanel == None and panel != None:
+        cmds.isolateSelect(panel,state = False)
+
+    if window != None:
+        cmds.deleteUI(window)
+
+def playBlastProcess(camera,viewItemOption,showHUDs,outputPath,outputFormat,timeRange,resolution,frameNumberOffset,playblastPanel = None,viewState = None,sequenceStart = 1):
+    restoreView = viewState == None
+    if viewState == None:
+        viewState = PlayblastViewState()
+        viewState.snapshot()
+
+    viewState.prepare(camera,showHUDs,viewItemOption["headsUpDisplay"])
+    addReportFrames(camera,int(timeRange[1]) - int(timeRange[0]) + 1)
+
+    journal = _playblastJournal
+    plannedRange = list(timeRange)
+    timeOffset = 0
+
+    if frameNumberOffset:        
+        with timedPhase("shotNode",camera):
+            if cmds.objExists("playblastTmpSeq"):
+                cmds.delete("playblastTmpSeq")
+
+            shotNode = createShotNode(camera,"playblastTmpSeq",timeRange,sequenceStart)
+            timeRange[0] = cmds.getAttr(shotNode + ".sequenceStartFrame")
+            timeRange[1] = cmds.getAttr(shotNode + ".sequenceEndFrame")
+            timeOffset = plannedRange[0] - timeRange[0]
+
+    callbackIds = []
+    if journal != None:
+        callbackIds.append(om2.MDGMessage.addTimeChangeCallback(partial(journalFrame,journal,camera,timeOffset)))
+
+    result = {
+                "event":        "result",
+                "camera":       camera,
+                "outputPath":   outputPath,
+                "timeRange":    plannedRange,
+                "status":       "done"
+    }
+
+    try:
+        excutePlayBlast(viewItemOption,camera,outputPath,outputFormat,timeRange,resolution,frameNumberOffset,nodes =None,panel = None,playblastPanel = playblastPanel)
+    except Exception:
+        result["status"] = "failed"
+        result["error"] = traceback.format_exc()
+        cmds.warning("playblast failed: " + camera + "\n" + result["error"])
+    finally:
+        removeMessageCallbacks(callbackIds)
+
+    if journal != None:
+        journal.append(result)
+
+    with timedPhase("shotNode",camera):
+        if cmds.objExists("playblastTmpSeq"):
+            cmds.delete("playblastTmpSeq")
+
+    if restoreView:
+        viewState.restore()
+
+    return result["status"] == "done"
+
+##----------------------------------------------------------------------------------
+##MARK:worker
+##----------------------------------------------------------------------------------
+def getWorkerJobDir(scenePath):
+    sceneName = os.path.splitext(os.path.basename(scenePath))[0]
+    return os.path.join(cmds.internalVar(userTmpDir =True),"SSCameraSwitcher",sceneName + "_" + time.strftime("%Y%m%d_%H%M%S"))
+
+def buildJobManifest(scenePath,jobs,viewItemOption,showHUDs,outputFormat,resolution,frameNumberOffset,fileNameFormat = ""):
+    return {
+                "scene":            scenePath,
+                "viewItemOption":   viewItemOption,
+                "showHUDs":         showHUDs,
+                "outputFormat":     outputFormat,
+                "resolution":       resolution,
+                "frameNumberOffset":frameNumberOffset,
+                "fileNameFormat":   fileNameFormat,
+                "tasks":            jobs
+    }
+
+def runWorkerTask(manifestPath,taskIndex):
+    manifest = SSCameraSwitcherWorker.readJobManifest(manifestPath)
+    task = manifest["tasks"][taskIndex]
+
+    result = {
+                "camera":       task["camera"],
+                "outputPath":   task["outputPath"],
+                "status":       "failed"
+    }
+    startTime = time.time()
+    startPlayblastReport("worker")
+
+    try:
+        with timedPhase("openScene"):
+            if cmds.file(q=True, sn=True) != manifest["scene"]:
+                cmds.file(manifest["scene"],open =True,force =True)
+
+        blasted = playBlastProcess(
+                        task["camera"],
+                        manifest["viewItemOption"],
+                        manifest["showHUDs"],
+                        task["outputPath"],
+                        manifest["outputFormat"],
+                        list(task["timeRange"]),
+                        manifest["resolution"],
+                        manifest["frameNumberOffset"],
+                        sequenceStart = task.get("sequenceStart",1)
+                    )
+
+        if blasted:
+            result["status"] = "done"
+        else:
+            result["error"] = "playblast failed"
+
+    except Exception:
+        result["error"] = traceback.format_exc()
+
+    result["seconds"] = time.time() - startTime
+    result["phases"] = stopPlayblastReport().build()["phases"]
+    SSCameraSwitcherWorker.writeTaskResult(manifestPath,taskIndex,result)
+
+##----------------------------------------------------------------------------------
+##MARK:cache
+##----------------------------------------------------------------------------------
+PLAYBLASTCACHEFILE = ".playblastCache.json"
+
+CAMERADIGESTATTRS = [
+                        "focalLength",
+                        "horizontalFilmAperture",
+                        "verticalFilmAperture",
+                        "horizontalFilmOffset",
+                        "verticalFilmOffset",
+                        "filmFit",
+                        "lensSqueezeRatio",
+                        "cameraScale",
+                        "nearClipPlane",
+                        "farClipPlane",
+                        "orthographic",
+                        "orthographicWidth"
+]
+
+CAMERATRANSFORMDIGESTATTRS = [attrName + axis for attrName in ["translate","rotate","scale","rotatePivot","scalePivot","rotateAxis"] for axis in ["X","Y","Z"]] + ["rotateOrder"]
+
+def getDigest(data):
+    return hashlib.sha1(json.dumps(data,sort_keys =True).encode("utf-8")).hexdigest()
+
+def readAnimCurveKeys():
+    curveKeys = {}
+    nodeIt = om2.MItDependencyNodes(om2.MFn.kAnimCurve)
+
+    while not nodeIt.isDone():
+        curveFn = om2.MFnAnimCurve(nodeIt.thisNode())
+        nodeIt.next()
+
+        timeInput = curveFn.isUnitlessInput == False
+        keys = []
+
+        for i in range(0,curveFn.numKeys):
+            if timeInput:
+                keyInput = curveFn.input(i).value
+            else:
+                keyInput = curveFn.unitlessInput(i)
+
+            inAngle,inWeight = curveFn.getTangentAngleWeight(i,True)
+            outAngle,outWeight = curveFn.getTangentAngleWeight(i,False)
+
+            keyData = [
+                        curveFn.value(i),
+                        curveFn.inTangentType(i),
+                        curveFn.outTangentType(i),
+                        round(inAngle.value,9),
+                        round(inWeight,9),
+                        round(outAngle.value,9),
+                        round(outWeight,9)
+            ]
+            keys.append([keyInput,getDigest(keyData)[:16]])
+
+        curveKeys[curveFn.name()] = {
+                                        "timeInput":    timeInput,
+                                        "infinity":     [curveFn.preInfinityType,curveFn.postInfinityType],
+                                        "keys":         keys
+        }
+
+    return curveKeys
+
+def getReferenceVersions():
+    versions = []
+
+    for referencePath in cmds.file(q=True, reference=True) or []:
+        filePath = referencePath.split("{")[0]
+        if os.path.isfile(filePath):
+            versions.append([referencePath,os.path.getsize(filePath),os.path.getmtime(filePath)])
+        else:
+            versions.append([referencePath,None,None])
+
+    return versions
+
+def getSceneFileVersion():
+    scenePath = cmds.file(q=True, sn=True)
+    if scenePath == "" or os.path.isfile(scenePath) == False:
+        return [scenePath,None,None]
+
+    return [scenePath,os.path.getsize(scenePath),os.path.getmtime(scenePath)]
+
+def getSceneDigest(curveKeys = None):
+    if curveKeys == None:
+        curveKeys = readAnimCurveKeys()
+
+    return getDigest({
+                        "animCurves":   curveKeys,
+                        "references":   getReferenceVersions(),
+                        "sceneFile":    getSceneFileVersion()
+    })
+
+## keyed plugs are covered by the animCurve keys, so only the connection is recorded and the digest does not follow the current time
+def getPlugDigest(plug):
+    if plug.isChild and plug.parent().isDestination:
+        plug = plug.parent()
+
+    if plug.isDestination:
+        return plug.source().name()
+
+    return round(plug.asDouble(),9)
+
+def getNodeDigest(node,attrNames):
+    dnFn = om2.MFnDependencyNode(node)
+    nodeData = {}
+
+    for attrName in attrNames:
+        if dnFn.hasAttribute(attrName):
+            nodeData[attrName] = getPlugDigest(dnFn.findPlug(attrName,False))
+
+    return nodeData
+
+def getCameraDigest(camera):
+    selList = om2.MSelectionList()
+    selList.add(camera)
+    dagPath = selList.getDagPath(0)
+
+    shapePath = om2.MDagPath(dagPath)
+    shapePath.extendToShape()
+    cameraData = {
+                    "shape":        getNodeDigest(shapePath.node(),CAMERADIGESTATTRS),
+                    "transforms":   []
+    }
+
+    while dagPath.length() > 0:
+        cameraData["transforms"].append(getNodeDigest(dagPath.node(),CAMERATRANSFORMDIGESTATTRS))
+        dagPath.pop()
+
+    return getDigest(cameraData)
+
+def getPlayblastCacheKey(job,viewItemOption,showHUDs,outputFormat,resolution,frameNumberOffset,sceneDigest):
+    return getDigest({
+                        "camera":           job["camera"],
+                        "timeRange":        [float(job["timeRange"][0]),float(job["timeRange"][1])],
+                        "viewItemOption":   viewItemOption,
+                        "showHUDs":         showHUDs,
+                        "outputFormat":     outputFormat,
+                        "resolution":       resolution,
+                        "frameNumberOffset":frameNumberOffset,
+                        "scene":            sceneDigest,
+                        "cameraState":      getCameraDigest(job["camera"])
+    })
+
+def getPlayblastSettingsKey(job,viewItemOption,showHUDs,outputFormat,resolution,frameNumberOffset,referenceDigest):
+    return getDigest({
+                        "camera":           job["camera"],
+                        "timeRange":        [float(job["timeRange"][0]),float(job["timeRange"][1])],
+                        "viewItemOption":   viewItemOption,
+                        "showHUDs":         showHUDs,
+                        "outputFormat":     outputFormat,
+                        "resolution":       resolution,
+                        "frameNumberOffset":frameNumberOffset,
+                        "references":       referenceDigest
+    })
+
+def getPlayblastOutputFiles(outputPath,outputFormat,timeRange,frameNumberOffset):
+    if COMPRESSIONDICT[outputFormat][1] == "movie":
+        return [outputPath.replace("//","/") + "." + outputFormat]
+
+    frames = getFrames(timeRange[0],timeRange[1],1)
+    if frameNumberOffset:
+        frames = [frame - frames[0] + 1 for frame in frames]
+
+    return [getOutputFramePath(outputPath,outputFormat,frame) for frame in frames]
+
+def getCurveDirtyIntervals(oldCurve,newCurve):
+    if oldCurve == None or newCurve == None:
+        return None
+
+    if oldCurve["timeInput"] == False or newCurve["timeInput"] == False:
+        if oldCurve == newCurve:
+            return []
+        return None
+
+    if oldCurve["infinity"] != newCurve["infinity"]:
+        return None
+
+    oldKeys = dict([(key[0],key[1]) for key in oldCurve["keys"]])
+    newKeys = dict([(key[0],key[1]) for key in newCurve["keys"]])
+
+    changedTimes = []
+    for keyTime in set(oldKeys.keys()) | set(newKeys.keys()):
+        if oldKeys.get(keyTime) != newKeys.get(keyTime):
+            changedTimes.append(keyTime)
+
+    if len(changedTimes) == 0:
+        return []
+
+    if oldCurve["infinity"] != [0,0]:
+        return None
+
+    keyTimes = sorted(set(oldKeys.keys()) | set(newKeys.keys()))
+    intervals = []
+
+    for changedTime in changedTimes:
+        index = keyTimes.index(changedTime)
+        start = float("-inf")
+        end = float("inf")
+
+        if index > 0:
+            start = keyTimes[index -1]
+
+        if index < len(keyTimes) -1:
+            end = keyTimes[index +1]
+
+        intervals.append([start,end])
+
+    return intervals
+
+def getDirtyFrames(oldCurveKeys,newCurveKeys,timeRange):
+    frames = getFrames(timeRange[0],timeRange[1],1)
+    dirtyFrames = set()
+
+    for curveName in set(oldCurveKeys.keys()) | set(newCurveKeys.keys()):
+        intervals = getCurveDirtyIntervals(oldCurveKeys.get(curveName),newCurveKeys.get(curveName))
+
+        if intervals == None:
+            return set(frames)
+
+        for start,end in intervals:
+            for frame in frames:
+                if start < frame < end:
+                    dirtyFrames.add(frame)
+
+        if len(dirtyFrames) == len(frames):
+            break
+
+    return dirtyFrames
+
+def readAnimSnapshot(snapshotPath):
+    if os.path.isfile(snapshotPath) == False:
+        return None
+
+    try:
+        with open(snapshotPath,"r") as f:
+            return json.load(f)
+    except ValueError:
+        return None
+
+def saveAnimSnapshot(snapshotPath,settingsKey,curveKeys):
+    with open(snapshotPath,"w") as f:
+        json.dump({"key":settingsKey,"curves":curveKeys},f)
+
+def filterCachedJobs(playblastCache,jobs,viewItemOption,showHUDs,outputFormat,resolution,frameNumberOffset):
+    playblastCache.evictMissing()
+    sceneDigest = getSceneDigest()
+    dirtyJobs = []
+
+    for job in jobs:
+        job["cacheKey"] = getPlayblastCacheKey(job,viewItemOption,showHUDs,outputFormat,resolution,frameNumberOffset,sceneDigest)
+
+        if playblastCache.isValid(job["outputPath"],job["cacheKey"]):
+            print("playblast skipped (unchanged): " + job["camera"])
+            continue
+
+        dirtyJobs.append(job)
+
+    playblastCache.save()
+    return dirtyJobs
+
+class PlayblastCache(object):
+    def __init__(self,cachePath):
+        self.cachePath = cachePath
+        self.entries = {}
+        self.load()
+
+    def load(self):
+        self.entries = {}
+        if os.path.isfile(self.cachePath) == False:
+            return
+
+        try:
+            with open(self.cachePath,"r") as f:
+                self.entries = json.load(f).get("entries",{})
+        except ValueError:
+            self.entries = {}
+
+    def save(self):
+        cacheDir = os.path.dirname(self.cachePath)
+        if cacheDir != "" and os.path.isdir(cacheDir) == False:
+            os.makedirs(cacheDir)
+
+        with open(self.cachePath,"w") as f:
+            json.dump({"entries":self.entries},f,indent = 4)
+
+    def evictMissing(self):
+        for outputPath in list(self.entries.keys()):
+            for filePath in self.entries[outputPath]["files"]:
+                if os.path.isfile(filePath) == False:
+                    del self.entries[outputPath]
+                    break
+
+    def isValid(self,outputPath,cacheKey):
+        entry = self.entries.get(outputPath)
+        if entry == None or entry["key"] != cacheKey:
+            return False
+
+        for filePath in entry["files"]:
+            if os.path.isfile(filePath) == False:
+                return False
+
+        return True
+
+    def update(self,outputPath,camera,cacheKey,files):
+        for filePath in files:
+            if os.path.isfile(filePath) == False:
+                self.entries.pop(outputPath,None)
+                return False
+
+        self.entries[outputPath] = {
+                                        "camera":   camera,
+                                        "key":      cacheKey,
+                                        "files":    files
+        }
+        return True
+
+##----------------------------------------------------------------------------------
+##MARK:viewPort
+##----------------------------------------------------------------------------------
+
+def isBatchMode():
+    return cmds.about(batch =True)
+
+def getPanelOption(panel):
+    if panel == None:
+        return {}
+
+    return {"editorPanelName":panel}
+
+def getCurViewPanel():
+    return OpenMayaUI.MQtUtil.fullName(int(omui.M3dView.active3dView().widget())).split("|")[-2]
+
+def changeView(cameraName,viewPort):
+    if cmds.objExists(cameraName) == False:
+        return
+
+    if viewPort == None:
+        viewPort = getCurViewPanel()
+
+    cmds.modelEditor(viewPort, edit=True, camera=cameraName)
+    cmds.refresh()
+
+def getView(panelName):    
+    if cmds.modelPanel(panelName, exists =True) == False:
+        return None
+
+    if panelName not in cmds.getPanel(visiblePanels=True) or []:
+        return None
+    
+    return omui.M3dView.getM3dViewFromModelPanel(panelName)
+                
+def setIsolateView(panelName,nodes):
+    cmds.isolateSelect(panelName,state = False)        
+    cmds.isolateSelect(panelName,state = True)
+    
+    for node in nodes:
+        cmds.isolateSelect(panelName,addDagObject = node)
+
+def getTmpViewName():
+    index = 1
+    while cmds.window("playblastTmp_" + str(index),q=True, ex =True):
+        index += 1
+
+    return "playblastTmp_" + str(index)
+
+def createTmpView(windowName = "playblastTmp"):
+    if cmds.window(windowName,q=True, ex =True):
+        cmds.deleteUI(windowName)
+
+    window = cmds.window(windowName)
+    mainLayout = cmds.formLayout(window)
+    panel = cmds.modelEditor()
+    cmds.formLayout(mainLayout, e=True,
+                                attachForm=[(panel, "top", 0),(panel, "left", 0), 
+                                    (panel, "bottom", 0), (panel, "right", 0)]) 
+    cmds.showWindow(window)
+    return window,panel
+
+class PlayblastPanel(object):
+    def __init__(self,viewItemOption):
+        self.viewItemOption = viewItemOption
+        self.window = None
+        self.panel = None
+        self.camera = None
+        self.isolated = False
+
+    def open(self):
+        if isBatchMode():
+            return None
+
+        if self.panel == None:
+            with timedPhase("createPanel"):
+                self.window,self.panel = createTmpView(getTmpViewName())
+                cmds.modelEditor(self.panel, edit=True, **self.viewItemOption)
+
+        return self.panel
+
+    def setCamera(self,camera,nodes = None):
+        self.open()
+
+        if self.panel == None:
+            cmds.lookThru(camera)
+            self.camera = camera
+            return None
+
+        if camera != self.camera:
+            cmds.modelEditor(self.panel, edit=True, camera=camera)
+            self.camera = camera
+
+        if nodes != None:
+            setIsolateView(self.panel,nodes)
+            self.isolated = True
+
+        elif self.isolated:
+            cmds.isolateSelect(self.panel,state = False)
+            self.isolated = False
+
+        return self.panel
+
+    def close(self):
+        if self.window != None and cmds.window(self.window,q=True, ex =True):
+            cmds.deleteUI(self.window)
+
+        self.window = None
+        self.panel = None
+        self.camera = None
+        self.isolated = False
+
+def getCurHUDItems():
+    showItems = []
+    items = cmds.headsUpDisplay(listHeadsUpDisplays =True)
+    for item in items:
+        if cmds.headsUpDisplay(item, q = True, vis = True):
+            showItems.append(item)
+
+    return showItems
+
+def hideAllHUDTtems():
+    items = cmds.headsUpDisplay(listHeadsUpDisplays =True)
+
+    for item in items:
+        cmds.headsUpDisplay(item, e = True, vis = False) 
+
+HUDITEMDICT = {
+    "objectDetails":            ["HUDObjDetBackfaces","HUDObjDetSmoothness","HUDObjDetInstance","HUDObjDetDispLayer","HUDObjDetDistFromCm","HUDObjDetNumSelObjs"],
+    "polyCount":                ["HUDPolyCountVerts","HUDPolyCountEdges","HUDPolyCountFaces","HUDPolyCountTriangles","HUDPolyCountUVs"],
+    "particleCount":            ["HUDParticleCount"],
+    "subdDetails":              ["HUDSubdLevel","HUDSubdMode"],
+    "viewportRenderer":         ["HUDViewportRenderer"],
+    "symmetry":                 ["HUDSymmetry"],
+    "capsLock":                 ["HUDCapsLock"],
+    "cameraNames":              ["HUDCameraNames"],
+    "focalLength":              ["HUDFocalLength"],
+    "frameRate":                ["HUDFrameRate"],
+    "materialLoadingDetails":   ["HUDLoadingTextures","HUDLoadingMaterials"],
+    "currentFrame":             ["HUDCurrentFrame"],
+    "sceneTimecode":            ["HUDSceneTimecode"],
+    "currentContainer":         ["HUDCurrentContainer"],
+    "viewAxis":                 ["HUDViewAxis"],
+    "HikDetails":               ["HUDHikKeyingMode"],
+    "selectDetails":            ["HUDSoftSelectState"],
+    "animationDetails":         ["HUDIKSolverState","HUDCurrentCharacter","HUDPlaybackSpeed","HUDSoftSelectState"],
+    "toolMessage":              ["HUDSoftSelectState"],
+    "XGenHUD":                  ["HUDSoftSelectState","HUDXGenSplinesCount","HUDXGenGPUMemory"],
+    "evaluationManagerHUD":     ["HUDGPUOverride","HUDEMState","HUDEvaluation","HUDSoftSelectState"]
+}
+
+def setHUDItems(setNames):
+    for key in setNames:
+        if key not in list(HUDITEMDICT.keys()):
+            continue
+
+        for item in HUDITEMDICT[key]:
+            if cmds.headsUpDisplay(item, exists = True) == False: 
+                continue
+
+            cmds.headsUpDisplay(item, e = True, vis = True) 
+
+def getCurViewSetting(camera):
+    displayResolution = cmds.getAttr(camera + ".displayResolution")
+    overscan = cmds.getAttr(camera + ".overscan")
+    curHUDs = getCurHUDItems()
+    return displayResolution,overscan,curHUDs
+
+def prepareViewSetting(camera,resolutionGate,showHUDs,headsUpDisplay):
+    displayResolution,overscan,curHUDs = getCurViewSetting(camera)
+
+    hideAllHUDTtems()
+
+    showHUDItems = []
+
+    for HUDItem in list(showHUDs.keys()):
+        if showHUDs[HUDItem]:
+            showHUDItems.append(HUDItem)
+
+    if headsUpDisplay ==False:
+        cmds.setAttr(camera + ".displayResolution",False)
+        cmds.setAttr(camera + ".overscan",1.0)
+
+    elif headsUpDisplay == True and resolutionGate == False:
+        cmds.setAttr(camera + ".displayResolution",False)
+        cmds.setAttr(camera + ".overscan",1.0)
+
+    if resolutionGate == True and displayResolution == False:        
+        cmds.setAttr(camera + ".displayResolution",True)
+        cmds.setAttr(camera + ".overscan",1.3)
+
+    setHUDItems(showHUDItems)
+
+def restoreViewSetting(camera,displayResolution,overscan,curHUDs):
+    cmds.setAttr(camera + ".displayResolution",displayResolution)
+    cmds.setAttr(camera + ".overscan",overscan)
+    hideAllHUDTtems()
+    setHUDItems(curHUDs)
+
+def getHUDItemNames(setNames):
+    itemNames = []
+
+    for key in setNames:
+        for item in HUDITEMDICT.get(key,[]):
+            if item not in itemNames:
+                itemNames.append(item)
+
+    return itemNames
+
+def getCameraGateState(displayResolution,overscan,resolutionGate,headsUpDisplay):
+    if resolutionGate == False:
+        return False,1.0
+
+    if displayResolution == False:
+        return True,1.3
+
+    if headsUpDisplay == False:
+        return False,1.0
+
+    return displayResolution,overscan
+
+class PlayblastViewState(object):
+    def __init__(self):
+        self.HUDStates = {}
+        self.origHUDStates = {}
+        self.cameraStates = {}
+        self.origCameraStates = {}
+
+    def snapshot(self):
+        self.HUDStates = {}
+        with timedPhase("prepareView"):
+            if isBatchMode() == False:
+                for item in cmds.headsUpDisplay(listHeadsUpDisplays =True) or []:
+                    self.HUDStates[item] = cmds.headsUpDisplay(item, q = True, vis = True)
+
+        self.origHUDStates = dict(self.HUDStates)
+        self.cameraStates = {}
+        self.origCameraStates = {}
+
+    def setHUDItems(self,showItems):
+        showItems = set(showItems)
+
+        for item in self.HUDStates:
+            visible = item in showItems
+            if self.HUDStates[item] != visible:
+                cmds.headsUpDisplay(item, e = True, vis = visible)
+                self.HUDStates[item] = visible
+
+    def captureCamera(self,camera):
+        if camera not in self.origCameraStates:
+            self.origCameraStates[camera] = (cmds.getAttr(camera + ".displayResolution"),cmds.getAttr(camera + ".overscan"))
+            self.cameraStates[camera] = self.origCameraStates[camera]
+
+        return self.origCameraStates[camera]
+
+    def setCameraState(self,camera,state):
+        self.captureCamera(camera)
+
+        curState = self.cameraStates[camera]
+        if curState[0] != state[0]:
+            cmds.setAttr(camera + ".displayResolution",state[0])
+
+        if curState[1] != state[1]:
+            cmds.setAttr(camera + ".overscan",state[1])
+
+        self.cameraStates[camera] = (state[0],state[1])
+
+    def prepare(self,camera,showHUDs,headsUpDisplay):
+        with timedPhase("prepareView",camera):
+            showHUDItems = []
+            for HUDItem in list(showHUDs.keys()):
+                if showHUDs[HUDItem]:
+                    showHUDItems.append(HUDItem)
+
+            self.setHUDItems(getHUDItemNames(showHUDItems))
+
+            displayResolution,overscan = self.captureCamera(camera)
+            self.setCameraState(camera,getCameraGateState(displayResolution,overscan,showHUDs["resolutionGate"],headsUpDisplay))
+
+    def restore(self):
+        with timedPhase("restore"):
+            for camera in self.origCameraStates:
+                if cmds.objExists(camera):
+                    self.setCameraState(camera,self.origCameraStates[camera])
+
+            self.setHUDItems([item for item in self.origHUDStates if self.origHUDStates[item]])
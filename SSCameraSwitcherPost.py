@@ -0,0 +1,262 @@
+import os
+import time
+import shutil
+import tempfile
+import threading
+import collections
+import traceback
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import SSCameraSwitcherWorker
+
+##--------------------------------------------------------
+## MARK: steps
+##--------------------------------------------------------
+REVIEWMOVIEARGS = ["-c:v","libx264","-pix_fmt","yuv420p","-crf","18"]
+
+class CopyToDirectoryStep(object):
+    def __init__(self,targetDir,sourceRoot):
+        self.targetDir = targetDir
+        self.sourceRoot = sourceRoot
+
+    def __call__(self,result):
+        copied = []
+
+        for filePath in result["files"] + result.get("extraFiles",[]):
+            relativePath = os.path.relpath(filePath,self.sourceRoot)
+            if relativePath.startswith(".."):
+                relativePath = os.path.basename(filePath)
+
+            targetPath = os.path.join(self.targetDir,relativePath)
+            if os.path.isdir(os.path.dirname(targetPath)) == False:
+                os.makedirs(os.path.dirname(targetPath))
+
+            shutil.copy2(filePath,targetPath)
+            copied.append(targetPath)
+
+        result["copied"] = copied
+
+class MovieStep(object):
+    def __init__(self,frameRate,extension = "mp4",codecArgs = None):
+        self.frameRate = frameRate
+        self.extension = extension
+        self.codecArgs = codecArgs or REVIEWMOVIEARGS
+
+    def __call__(self,result):
+        if result["movie"] or len(result["files"]) == 0:
+            return
+
+        firstFrame = os.path.basename(result["files"][0]).split(".")[-2]
+        framePattern = result["outputPath"] + ".%0" + str(len(firstFrame)) + "d." + result["outputFormat"]
+        moviePath = result["outputPath"] + "." + self.extension
+
+        if SSCameraSwitcherWorker.encodeMovieFromSequence(framePattern,int(firstFrame),moviePath,self.frameRate,codecArgs = self.codecArgs) == False:
+            raise RuntimeError("failed to build movie: " + moviePath)
+
+        result.setdefault("extraFiles",[]).append(moviePath)
+
+class ThumbnailStep(object):
+    def __init__(self,width = 320):
+        self.width = width
+
+    def __call__(self,result):
+        if len(result["files"]) == 0:
+            return
+
+        ffmpeg = SSCameraSwitcherWorker.getFfmpegPath()
+        if ffmpeg == None:
+            raise RuntimeError("ffmpeg not found")
+
+        sourcePath = result["files"][len(result["files"]) // 2]
+        thumbnailPath = result["outputPath"] + "_thumb.jpg"
+
+        returnCode = subprocess.call([
+                                    ffmpeg,"-y","-loglevel","error",
+                                    "-i",sourcePath,
+                                    "-vf","scale=" + str(self.width) + ":-1",
+                                    "-frames:v","1",
+                                    thumbnailPath
+                                ])
+        if returnCode != 0:
+            raise RuntimeError("failed to build thumbnail: " + thumbnailPath)
+
+        result.setdefault("extraFiles",[]).append(thumbnailPath)
+
+class TransferStep(object):
+    def __init__(self,fileMover,scratchDir,outputDir):
+        self.fileMover = fileMover
+        self.scratchDir = scratchDir
+        self.outputDir = outputDir
+
+    def getTargetPath(self,filePath):
+        return os.path.join(self.outputDir,os.path.relpath(filePath,self.scratchDir)).replace("\\","/")
+
+    def __call__(self,result):
+        futures = []
+
+        for key in ["files","extraFiles"]:
+            targetPaths = []
+            for filePath in result.get(key,[]):
+                targetPath = self.getTargetPath(filePath)
+                futures.append(self.fileMover.submit(filePath,targetPath))
+                targetPaths.append(targetPath)
+
+            result[key] = targetPaths
+
+        for future in futures:
+            future.result()
+
+        result["outputPath"] = self.getTargetPath(result["outputPath"])
+
+    ## files that failed to transfer keep their scratch directory
+    def close(self):
+        for dirPath,dirNames,fileNames in os.walk(self.scratchDir,topdown = False):
+            try:
+                os.rmdir(dirPath)
+            except OSError:
+                pass
+
+##--------------------------------------------------------
+## MARK: transfer
+##--------------------------------------------------------
+def getScratchDir(name):
+    return os.path.join(tempfile.gettempdir(),"SSCameraSwitcher","scratch",name + "_" + time.strftime("%Y%m%d_%H%M%S")).replace("\\","/") + "/"
+
+class FileMover(object):
+    def __init__(self,maxWorkers = 4,retries = 3,retryDelay = 1.0):
+        self.executor = ThreadPoolExecutor(max_workers = max(1,maxWorkers))
+        self.retries = retries
+        self.retryDelay = retryDelay
+
+    def submit(self,sourcePath,targetPath):
+        return self.executor.submit(self.move,sourcePath,targetPath)
+
+    def move(self,sourcePath,targetPath):
+        sourceSize = os.path.getsize(sourcePath)
+        partPath = targetPath + ".part"
+
+        for attempt in range(0,self.retries +1):
+            try:
+                if os.path.isdir(os.path.dirname(targetPath)) == False:
+                    os.makedirs(os.path.dirname(targetPath))
+
+                shutil.copyfile(sourcePath,partPath)
+                if os.path.getsize(partPath) != sourceSize:
+                    raise IOError("size mismatch: " + partPath)
+
+                if os.path.isfile(targetPath):
+                    os.remove(targetPath)
+                os.rename(partPath,targetPath)
+
+                if os.path.getsize(targetPath) != sourceSize:
+                    raise IOError("size mismatch: " + targetPath)
+
+                break
+
+            except (IOError,OSError):
+                if attempt == self.retries:
+                    raise
+
+                time.sleep(self.retryDelay * (2 ** attempt))
+
+        os.remove(sourcePath)
+        return targetPath
+
+    def shutdown(self,wait = True):
+        self.executor.shutdown(wait = wait)
+
+##--------------------------------------------------------
+## MARK: pipeline
+##--------------------------------------------------------
+class PostProcessPipeline(object):
+    def __init__(self,steps,maxWorkers = 2,maxQueue = 4,onComplete = None):
+        self.steps = steps
+        self.onComplete = onComplete
+        self.executor = ThreadPoolExecutor(max_workers = max(1,maxWorkers))
+        self.maxActive = max(1,maxWorkers) + max(0,maxQueue)
+        self.pending = collections.deque()
+        self.active = 0
+        self.closing = False
+        self.closed = False
+        self.lock = threading.Condition()
+        self.submitted = 0
+        self.completed = 0
+
+    ## runs on maya's main thread, queue the result instead of waiting for a free slot
+    def submit(self,result):
+        with self.lock:
+            self.submitted += 1
+            self.pending.append(result)
+
+        self.pump()
+
+    def pump(self):
+        while True:
+            with self.lock:
+                if len(self.pending) == 0 or self.active >= self.maxActive:
+                    drained = self.closing and self.closed == False and len(self.pending) == 0 and self.active == 0
+                    if drained:
+                        self.closed = True
+                    break
+
+                result = self.pending.popleft()
+                self.active += 1
+
+            future = self.executor.submit(self.process,result)
+            future.add_done_callback(self.done)
+
+        if drained:
+            self.close()
+
+    def close(self):
+        self.executor.shutdown(wait = False)
+
+        for step in self.steps:
+            if hasattr(step,"close") == False:
+                continue
+
+            try:
+                step.close()
+            except Exception:
+                traceback.print_exc()
+
+    def process(self,result):
+        result["postStatus"] = "done"
+
+        try:
+            for step in self.steps:
+                step(result)
+
+        except Exception:
+            result["postStatus"] = "failed"
+            result["postError"] = traceback.format_exc()
+
+        return result
+
+    def done(self,future):
+        with self.lock:
+            self.active -= 1
+            self.completed += 1
+            self.lock.notify_all()
+
+        if self.onComplete != None:
+            self.onComplete(future.result())
+
+        self.pump()
+
+    def progress(self):
+        with self.lock:
+            return self.completed,self.submitted
+
+    def shutdown(self,wait = True):
+        with self.lock:
+            self.closing = True
+
+            while wait and (len(self.pending) > 0 or self.active > 0):
+                self.lock.wait()
+
+        self.pump()
+
+        if wait:
+            self.executor.shutdown(wait = True)
@@ -0,0 +1,436 @@
+## mayapy SSCameraSwitcherServer.py [--host 127.0.0.1] [--port 0] [--fake]
+## keeps a maya session warm and takes playblast requests over a local socket
+## one JSON object per line, requests are handled in order on the main thread
+##
+## request:  {"id":1,"cmd":"openScene","scene":"/path/shot.ma"}
+## progress: {"id":1,"event":"progress","camera":"cam1","frame":12,"done":3,"total":48}
+## result:   {"id":1,"event":"result","result":{...}}
+## error:    {"id":1,"event":"error","error":"..."}
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import traceback
+
+try:
+    import socketserver
+except ImportError:
+    import SocketServer as socketserver
+
+PROTOCOLVERSION = 1
+DEFAULTHOST = "127.0.0.1"
+
+##--------------------------------------------------------
+## MARK: protocol
+##--------------------------------------------------------
+class PlayblastServerError(Exception):
+    pass
+
+def encodeMessage(message):
+    return (json.dumps(message) + "\n").encode("utf-8")
+
+def decodeMessage(line):
+    return json.loads(line.decode("utf-8"))
+
+##--------------------------------------------------------
+## MARK: backend
+##--------------------------------------------------------
+class MayaServerBackend(object):
+    def __init__(self):
+        import SSCameraSwitcherCore
+        self.core = SSCameraSwitcherCore
+
+    def openScene(self,request,onProgress):
+        cmds = self.core.cmds
+        scenePath = request["scene"].replace("\\","/")
+        startTime = time.time()
+
+        reused = cmds.file(q=True, sn=True) == scenePath and request.get("force",False) == False
+        if reused == False:
+            if request.get("project") != None:
+                cmds.workspace(request["project"],openWorkspace =True)
+
+            cmds.file(scenePath,open =True,force =True)
+
+        return {
+                    "scene":    cmds.file(q=True, sn=True),
+                    "reused":   reused,
+                    "seconds":  time.time() - startTime
+        }
+
+    def listCameras(self,request,onProgress):
+        core = self.core
+        cameraInfoTable = core.readCameraInfoTable("cameraInfoSets")
+        outputOption = self.getBlastSettings(request)[2]
+
+        resolution = request.get("resolution")
+        if resolution == None:
+            resolution = [core.cmds.getAttr("defaultResolution.width"),core.cmds.getAttr("defaultResolution.height")]
+
+        jobs = core.buildPlayblastJobs(cameraInfoTable,sorted(cameraInfoTable.keys()),"",outputOption["fileNameFormat"])
+        estimates = core.estimatePlayblastJobs(jobs,resolution,outputOption["outputFormat"])
+        cameras = []
+
+        for i in range(0,len(jobs)):
+            camera = jobs[i]["camera"]
+            cameras.append({
+                            "camera":       camera,
+                            "playblast":    cameraInfoTable[camera]["playblast"],
+                            "timeRange":    jobs[i]["timeRange"],
+                            "estimate":     estimates[i]
+            })
+
+        return {"scene":self.core.cmds.file(q=True, sn=True),"cameras":cameras}
+
+    def getBlastSettings(self,request):
+        core = self.core
+
+        if request.get("savedOptions",False):
+            viewItemOption,showHUDs,outputOption = core.readSavedPlayblastOptions()
+        else:
+            viewItemOption = dict([(settingKey,core.VIEWITEMSETTING[settingKey]) for settingKey in core.VIEWITEMSETTING_KEY])
+            showHUDs = dict(core.HUDSETTING)
+            outputOption = dict(core.OUTPUTOPTIONDEFAULTS)
+
+        viewItemOption.update(request.get("viewItemOption",{}))
+        showHUDs.update(request.get("showHUDs",{}))
+
+        for key in ["outputFormat","fileNameFormat","frameNumberOffset"]:
+            if request.get(key) != None:
+                outputOption[key] = request[key]
+
+        return viewItemOption,showHUDs,outputOption
+
+    def getOutputDir(self,request,outputOption):
+        cmds = self.core.cmds
+        outputDir = request.get("outputDir")
+
+        if outputDir == None and outputOption["outputOpt"] == "custom":
+            outputDir = outputOption["outputDir"]
+
+        if outputDir == None or outputDir == "":
+            outputDir = cmds.workspace(q=True,rootDirectory = True) + cmds.workspace(fileRuleEntry = "images")
+
+        outputDir = outputDir.replace("\\","/")
+        if outputDir.endswith("/") == False:
+            outputDir += "/"
+
+        return outputDir
+
+    def blast(self,request,onProgress):
+        core = self.core
+        cmds = core.cmds
+
+        viewItemOption,showHUDs,outputOption = self.getBlastSettings(request)
+        outputDir = self.getOutputDir(request,outputOption)
+
+        cameraInfoTable = core.readCameraInfoTable("cameraInfoSets")
+        cameras = request.get("cameras") or core.getPlayblastCam("cameraInfoSets",cameraInfoTable)
+
+        missingCameras = [camera for camera in cameras if camera not in cameraInfoTable]
+        if len(missingCameras) > 0:
+            raise PlayblastServerError("no camera info: " + ",".join(missingCameras))
+
+        resolution = request.get("resolution")
+        if resolution == None:
+            resolution = [cmds.getAttr("defaultResolution.width"),cmds.getAttr("defaultResolution.height")]
+
+        jobs = core.buildPlayblastJobs(cameraInfoTable,cameras,outputDir,outputOption["fileNameFormat"])
+        progress = {"camera":"","done":0,"total":0}
+
+        def onTimeChange(mTime,clientData):
+            if progress["camera"] == "":
+                return
+
+            progress["done"] += 1
+            onProgress({
+                        "camera":   progress["camera"],
+                        "frame":    mTime.value,
+                        "done":     min(progress["done"],progress["total"]),
+                        "total":    progress["total"]
+            })
+
+        callbackIds = [core.om2.MDGMessage.addTimeChangeCallback(onTimeChange)]
+        playblastPanel = core.PlayblastPanel(viewItemOption)
+        viewState = core.PlayblastViewState()
+        viewState.snapshot()
+
+        results = []
+        startTime = time.time()
+        report = core.startPlayblastReport("server","sequential")
+        core.startPlayblastJournal(outputDir,viewItemOption,showHUDs,outputOption["outputFormat"],resolution,outputOption["frameNumberOffset"])
+        core.journalPlan(jobs)
+
+        try:
+            for job in jobs:
+                progress["camera"] = job["camera"]
+                progress["done"] = 0
+                progress["total"] = int(job["timeRange"][1]) - int(job["timeRange"][0]) + 1
+                jobStartTime = time.time()
+
+                core.playBlastProcess(job["camera"],viewItemOption,showHUDs,job["outputPath"],outputOption["outputFormat"],list(job["timeRange"]),resolution,outputOption["frameNumberOffset"],playblastPanel = playblastPanel,viewState = viewState)
+                progress["camera"] = ""
+
+                files = core.getPlayblastOutputFiles(job["outputPath"],outputOption["outputFormat"],job["timeRange"],outputOption["frameNumberOffset"])
+                status = "done"
+                if any(os.path.isfile(filePath) == False for filePath in files):
+                    status = "missing"
+
+                results.append({
+                                "camera":       job["camera"],
+                                "outputPath":   job["outputPath"],
+                                "timeRange":    job["timeRange"],
+                                "status":       status,
+                                "seconds":      time.time() - jobStartTime
+                })
+
+        finally:
+            core.removeMessageCallbacks(callbackIds)
+            playblastPanel.close()
+            viewState.restore()
+            core.stopPlayblastReport()
+            core.stopPlayblastJournal()
+
+        try:
+            core.recordPlayblastHistory(report,resolution,outputOption["outputFormat"])
+        except (IOError,OSError):
+            traceback.print_exc()
+
+        return {
+                    "outputDir":    outputDir,
+                    "cameras":      results,
+                    "seconds":      time.time() - startTime,
+                    "phases":       report.build()["phases"]
+        }
+
+FAKECAMERAS = {
+                "camA":[1,24],
+                "camB":[1,48],
+                "camC":[101,130]
+}
+
+class FakeServerBackend(object):
+    def __init__(self,cameras = None,secondsPerFrame = 0.0,failCameras = None):
+        self.cameras = cameras or FAKECAMERAS
+        self.secondsPerFrame = secondsPerFrame
+        self.failCameras = failCameras or []
+        self.scene = ""
+
+    def openScene(self,request,onProgress):
+        scenePath = request["scene"].replace("\\","/")
+        reused = self.scene == scenePath and request.get("force",False) == False
+        self.scene = scenePath
+
+        return {"scene":self.scene,"reused":reused,"seconds":0.0}
+
+    def listCameras(self,request,onProgress):
+        cameras = []
+        for camera in sorted(self.cameras.keys()):
+            timeRange = self.cameras[camera]
+            cameras.append({
+                            "camera":       camera,
+                            "playblast":    True,
+                            "timeRange":    list(timeRange),
+                            "estimate":     (int(timeRange[1]) - int(timeRange[0]) + 1) * self.secondsPerFrame
+            })
+
+        return {"scene":self.scene,"cameras":cameras}
+
+    def blast(self,request,onProgress):
+        if self.scene == "":
+            raise PlayblastServerError("no scene opened")
+
+        cameras = request.get("cameras") or sorted(self.cameras.keys())
+        missingCameras = [camera for camera in cameras if camera not in self.cameras]
+        if len(missingCameras) > 0:
+            raise PlayblastServerError("no camera info: " + ",".join(missingCameras))
+
+        results = []
+        startTime = time.time()
+
+        for camera in cameras:
+            timeRange = self.cameras[camera]
+            total = int(timeRange[1]) - int(timeRange[0]) + 1
+            jobStartTime = time.time()
+
+            for i in range(0,total):
+                time.sleep(self.secondsPerFrame)
+                onProgress({"camera":camera,"frame":int(timeRange[0]) + i,"done":i +1,"total":total})
+
+            status = "done"
+            if camera in self.failCameras:
+                status = "failed"
+
+            results.append({
+                            "camera":       camera,
+                            "outputPath":   "",
+                            "timeRange":    list(timeRange),
+                            "status":       status,
+                            "seconds":      time.time() - jobStartTime
+            })
+
+        return {"outputDir":"","cameras":results,"seconds":time.time() - startTime,"phases":{}}
+
+##--------------------------------------------------------
+## MARK: server
+##--------------------------------------------------------
+class PlayblastRequestHandler(socketserver.StreamRequestHandler):
+    def send(self,message):
+        self.wfile.write(encodeMessage(message))
+        self.wfile.flush()
+
+    def handleRequest(self,request):
+        requestId = request.get("id")
+        cmd = request.get("cmd","")
+
+        if cmd == "ping":
+            return {"version":PROTOCOLVERSION,"backend":type(self.server.backend).__name__}
+
+        if cmd == "shutdown":
+            self.server.stopRequested = True
+            return {}
+
+        if cmd not in ["openScene","listCameras","blast"]:
+            raise PlayblastServerError("unknown cmd: " + str(cmd))
+
+        def onProgress(progress):
+            message = dict(progress)
+            message["id"] = requestId
+            message["event"] = "progress"
+            self.send(message)
+
+        return getattr(self.server.backend,cmd)(request,onProgress)
+
+    def handle(self):
+        for line in self.rfile:
+            if line.strip() == b"":
+                continue
+
+            requestId = None
+            try:
+                request = decodeMessage(line)
+                requestId = request.get("id")
+                self.send({"id":requestId,"event":"result","result":self.handleRequest(request)})
+
+            except PlayblastServerError as e:
+                self.send({"id":requestId,"event":"error","error":str(e)})
+
+            except (socket.error,IOError):
+                return
+
+            except Exception:
+                self.send({"id":requestId,"event":"error","error":traceback.format_exc()})
+
+            if self.server.stopRequested:
+                return
+
+class PlayblastServer(socketserver.TCPServer):
+    allow_reuse_address = True
+
+    def __init__(self,backend,host = DEFAULTHOST,port = 0):
+        socketserver.TCPServer.__init__(self,(host,port),PlayblastRequestHandler)
+        self.backend = backend
+        self.stopRequested = False
+
+    def getAddress(self):
+        return self.server_address[0],self.server_address[1]
+
+    def run(self):
+        while self.stopRequested == False:
+            self.handle_request()
+
+        self.server_close()
+
+##--------------------------------------------------------
+## MARK: client
+##--------------------------------------------------------
+class PlayblastServerClient(object):
+    def __init__(self,host = DEFAULTHOST,port = 0,timeout = None):
+        self.sock = socket.create_connection((host,port),timeout)
+        self.rfile = self.sock.makefile("rb")
+        self.lastId = 0
+
+    def request(self,cmd,onProgress = None,**kwargs):
+        self.lastId += 1
+        request = dict(kwargs)
+        request["id"] = self.lastId
+        request["cmd"] = cmd
+        self.sock.sendall(encodeMessage(request))
+
+        while True:
+            line = self.rfile.readline()
+            if line == b"":
+                raise PlayblastServerError("connection closed")
+
+            message = decodeMessage(line)
+            if message.get("id") != self.lastId:
+                continue
+
+            if message["event"] == "progress":
+                if onProgress != None:
+                    onProgress(message)
+                continue
+
+            if message["event"] == "error":
+                raise PlayblastServerError(message["error"])
+
+            return message["result"]
+
+    def ping(self):
+        return self.request("ping")
+
+    def openScene(self,scenePath,force = False,project = None):
+        return self.request("openScene",scene = scenePath,force = force,project = project)
+
+    def listCameras(self,**options):
+        return self.request("listCameras",**options)["cameras"]
+
+    def blast(self,cameras = None,onProgress = None,**options):
+        return self.request("blast",onProgress = onProgress,cameras = cameras,**options)
+
+    def shutdown(self):
+        self.request("shutdown")
+        self.close()
+
+    def close(self):
+        self.rfile.close()
+        self.sock.close()
+
+##--------------------------------------------------------
+## MARK: main
+##--------------------------------------------------------
+def main(argv):
+    parser = argparse.ArgumentParser(description = "warm playblast server")
+    parser.add_argument("--host",default = DEFAULTHOST)
+    parser.add_argument("--port",type = int,default = 0,help = "0 picks a free port")
+    parser.add_argument("--fake",action = "store_true",help = "pure python backend for protocol tests, no maya")
+    parser.add_argument("--fakeSecondsPerFrame",type = float,default = 0.0)
+    parser.add_argument("--fakeFailCameras",nargs = "+",default = [])
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0,os.path.dirname(os.path.abspath(__file__)))
+
+    if args.fake:
+        server = PlayblastServer(FakeServerBackend(secondsPerFrame = args.fakeSecondsPerFrame,failCameras = args.fakeFailCameras),args.host,args.port)
+        print("listening: {}:{}".format(*server.getAddress()))
+        sys.stdout.flush()
+        server.run()
+        return 0
+
+    import maya.standalone
+    maya.standalone.initialize(name = "python")
+
+    try:
+        server = PlayblastServer(MayaServerBackend(),args.host,args.port)
+        print("listening: {}:{}".format(*server.getAddress()))
+        sys.stdout.flush()
+        server.run()
+    finally:
+        maya.standalone.uninitialize()
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,911 @@
+import os
+import sys
+import json
+import errno
+import time
+import shutil
+import argparse
+import threading
+import traceback
+import subprocess
+
+import SSCameraSwitcherServer
+
+##--------------------------------------------------------
+## MARK: manifest
+##--------------------------------------------------------
+MANIFESTVERSION = 1
+
+def saveJobManifest(manifestPath,manifest):
+    manifestDir = os.path.dirname(manifestPath)
+    if manifestDir != "" and os.path.isdir(manifestDir) == False:
+        os.makedirs(manifestDir)
+
+    manifest = dict(manifest)
+    manifest["version"] = MANIFESTVERSION
+
+    with open(manifestPath,"w") as f:
+        json.dump(manifest,f,indent = 4)
+
+    return manifestPath
+
+def readJobManifest(manifestPath):
+    with open(manifestPath,"r") as f:
+        return json.load(f)
+
+def getResultPath(manifestPath,taskIndex):
+    return os.path.join(os.path.dirname(manifestPath),"results","task_" + str(taskIndex).zfill(4) + ".json")
+
+def writeTaskResult(manifestPath,taskIndex,result):
+    resultPath = getResultPath(manifestPath,taskIndex)
+    if os.path.isdir(os.path.dirname(resultPath)) == False:
+        ## several workers can finish at once and race to create the results dir
+        try:
+            os.makedirs(os.path.dirname(resultPath))
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+
+    tmpPath = resultPath + ".tmp"
+    with open(tmpPath,"w") as f:
+        json.dump(result,f,indent = 4)
+
+    if os.path.isfile(resultPath):
+        os.remove(resultPath)
+    os.rename(tmpPath,resultPath)
+
+def readTaskResult(manifestPath,taskIndex):
+    resultPath = getResultPath(manifestPath,taskIndex)
+    if os.path.isfile(resultPath) == False:
+        return None
+
+    with open(resultPath,"r") as f:
+        return json.load(f)
+
+class JsonLinesJournal(object):
+    def __init__(self,journalPath):
+        self.journalPath = journalPath
+        self.lock = threading.Lock()
+
+    def append(self,event,sync = True):
+        event = dict(event)
+        event["time"] = time.time()
+
+        with self.lock:
+            journalDir = os.path.dirname(self.journalPath)
+            if journalDir != "" and os.path.isdir(journalDir) == False:
+                os.makedirs(journalDir)
+
+            with open(self.journalPath,"a") as f:
+                f.write(json.dumps(event) + "\n")
+                f.flush()
+                if sync:
+                    os.fsync(f.fileno())
+
+    def read(self):
+        events = []
+        if os.path.isfile(self.journalPath) == False:
+            return events
+
+        with open(self.journalPath,"r") as f:
+            for line in f:
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    continue
+
+        return events
+
+##--------------------------------------------------------
+## MARK: chunk
+##--------------------------------------------------------
+def splitFrameRange(startFrame,endFrame,chunkSize):
+    startFrame = int(startFrame)
+    endFrame = int(endFrame)
+    chunkSize = int(chunkSize)
+
+    if chunkSize <= 0 or endFrame - startFrame + 1 <= chunkSize:
+        return [[startFrame,endFrame]]
+
+    chunks = []
+    for chunkStart in range(startFrame,endFrame +1,chunkSize):
+        chunks.append([chunkStart,min(chunkStart + chunkSize - 1,endFrame)])
+
+    return chunks
+
+def chunkPlayblastJobs(jobs,chunkSize,movieExtension = None):
+    tasks = []
+
+    for job in jobs:
+        chunks = splitFrameRange(job["timeRange"][0],job["timeRange"][1],chunkSize)
+
+        if len(chunks) == 1:
+            tasks.append(dict(job))
+            continue
+
+        for i in range(0,len(chunks)):
+            task = dict(job)
+            task["timeRange"] = chunks[i]
+            task["sequenceStart"] = chunks[i][0] - int(job["timeRange"][0]) + 1
+            task["chunk"] = {
+                                "index":        i,
+                                "count":        len(chunks),
+                                "outputPath":   job["outputPath"],
+                                "movieExtension":movieExtension
+            }
+
+            if movieExtension != None:
+                task["outputPath"] = job["outputPath"] + "_chunk" + str(i +1).zfill(4)
+
+            tasks.append(task)
+
+    return tasks
+
+def getFfmpegPath():
+    ffmpeg = os.environ.get("SSCAMERASWITCHER_FFMPEG","")
+    if ffmpeg != "":
+        return ffmpeg
+
+    if hasattr(shutil,"which"):
+        return shutil.which("ffmpeg")
+
+    return None
+
+def assembleMovieChunks(chunkPaths,outputPath,ffmpeg = None):
+    ffmpeg = ffmpeg or getFfmpegPath()
+    if ffmpeg == None:
+        return False
+
+    listPath = outputPath + ".chunks.txt"
+    with open(listPath,"w") as f:
+        for chunkPath in chunkPaths:
+            f.write("file '" + os.path.abspath(chunkPath).replace("\\","/").replace("'","'\\''") + "'\n")
+
+    try:
+        returnCode = subprocess.call([ffmpeg,"-y","-loglevel","error","-f","concat","-safe","0","-i",listPath,"-c","copy",outputPath])
+    finally:
+        os.remove(listPath)
+
+    if returnCode != 0:
+        return False
+
+    for chunkPath in chunkPaths:
+        if os.path.isfile(chunkPath):
+            os.remove(chunkPath)
+
+    return True
+
+RAWVIDEOARGS = ["-c:v","rawvideo","-pix_fmt","bgr24"]
+
+def encodeMovieFromSequence(framePattern,startNumber,outputPath,frameRate,ffmpeg = None,codecArgs = None):
+    ffmpeg = ffmpeg or getFfmpegPath()
+    if ffmpeg == None:
+        return False
+
+    if codecArgs == None:
+        codecArgs = RAWVIDEOARGS
+
+    returnCode = subprocess.call([
+                                ffmpeg,"-y","-loglevel","error",
+                                "-framerate",str(frameRate),
+                                "-start_number",str(int(startNumber)),
+                                "-i",framePattern
+                            ] + codecArgs + [outputPath])
+
+    return returnCode == 0
+
+def groupChunkedTasks(tasks):
+    movies = {}
+
+    for taskIndex in range(0,len(tasks)):
+        chunk = tasks[taskIndex].get("chunk")
+        if chunk == None or chunk["movieExtension"] == None:
+            continue
+
+        movies.setdefault(chunk["outputPath"],[]).append(taskIndex)
+
+    return movies
+
+def assembleChunkedTasks(tasks,results):
+    movies = groupChunkedTasks(tasks)
+
+    assembled = {}
+    for outputPath in movies:
+        taskIndices = sorted(movies[outputPath],key = lambda taskIndex:tasks[taskIndex]["chunk"]["index"])
+        extension = tasks[taskIndices[0]]["chunk"]["movieExtension"]
+
+        if any(results.get(taskIndex,{}).get("status") != "done" for taskIndex in taskIndices):
+            assembled[outputPath] = False
+            continue
+
+        chunkPaths = [tasks[taskIndex]["outputPath"] + "." + extension for taskIndex in taskIndices]
+        assembled[outputPath] = assembleMovieChunks(chunkPaths,outputPath + "." + extension)
+
+    return assembled
+
+##--------------------------------------------------------
+## MARK: launcher
+##--------------------------------------------------------
+def getMayapyPath():
+    mayaLocation = os.environ.get("MAYA_LOCATION","")
+
+    if mayaLocation != "":
+        binDir = os.path.join(mayaLocation,"bin")
+    else:
+        binDir = os.path.dirname(sys.executable)
+
+    if os.name == "nt":
+        return os.path.join(binDir,"mayapy.exe")
+
+    return os.path.join(binDir,"mayapy")
+
+WORKERSCRIPT = (
+                "import sys\n"
+                "sys.path.insert(0,{moduleDir!r})\n"
+                "import maya.standalone\n"
+                "maya.standalone.initialize()\n"
+                "try:\n"
+                "    import {moduleName}\n"
+                "    {moduleName}.runWorkerTask({manifestPath!r},{taskIndex})\n"
+                "finally:\n"
+                "    maya.standalone.uninitialize()\n"
+)
+
+class MayapyWorkerLauncher(object):
+    def __init__(self,mayapy = None,moduleName = "SSCameraSwitcherCore",moduleDir = None):
+        self.mayapy = mayapy or getMayapyPath()
+        self.moduleName = moduleName
+        self.moduleDir = moduleDir or os.path.dirname(os.path.abspath(__file__))
+
+    def __call__(self,manifestPath,taskIndex):
+        script = WORKERSCRIPT.format(
+                                    moduleDir = self.moduleDir,
+                                    moduleName = self.moduleName,
+                                    manifestPath = manifestPath,
+                                    taskIndex = taskIndex
+                                )
+
+        return subprocess.Popen([self.mayapy,"-c",script])
+
+class FakeWorkerLauncher(object):
+    def __init__(self,python = None):
+        self.python = python or sys.executable
+
+    def __call__(self,manifestPath,taskIndex):
+        return subprocess.Popen([self.python,os.path.abspath(__file__),"fakeWorker",manifestPath,str(taskIndex)])
+
+def runFakeWorkerTask(manifestPath,taskIndex):
+    manifest = readJobManifest(manifestPath)
+    task = manifest["tasks"][taskIndex]
+    frames = int(task["timeRange"][1]) - int(task["timeRange"][0]) + 1
+
+    startTime = time.time()
+    time.sleep(manifest.get("fakeSecondsPerFrame",0.0) * frames)
+
+    result = {
+                "camera":   task["camera"],
+                "status":   "done",
+                "frames":   frames,
+                "seconds":  0.0
+    }
+
+    if task["camera"] in manifest.get("fakeFailCameras",[]):
+        result["status"] = "failed"
+        result["error"] = "fake failure"
+
+    result["seconds"] = time.time() - startTime
+    writeTaskResult(manifestPath,taskIndex,result)
+
+    if result["status"] != "done":
+        return 1
+
+    return 0
+
+##--------------------------------------------------------
+## MARK: pool
+##--------------------------------------------------------
+class PlayblastWorkerPool(object):
+    def __init__(self,manifestPath,maxWorkers = 2,launcher = None,pollInterval = 0.2,onResult = None,executor = None):
+        self.manifestPath = manifestPath
+        self.maxWorkers = max(1,int(maxWorkers))
+        self.launcher = launcher or MayapyWorkerLauncher()
+        self.pollInterval = pollInterval
+        self.onResult = onResult
+        self.executor = executor
+        self.assembleFuture = None
+
+        self.manifest = readJobManifest(manifestPath)
+        self.pending = list(range(0,len(self.manifest["tasks"])))
+        self.running = {}
+        self.results = {}
+        self.assembled = None
+
+    def isDone(self):
+        return len(self.pending) == 0 and len(self.running) == 0
+
+    def collect(self,taskIndex,returnCode):
+        result = readTaskResult(self.manifestPath,taskIndex)
+
+        if result == None:
+            result = {
+                        "camera":   self.manifest["tasks"][taskIndex]["camera"],
+                        "status":   "failed",
+                        "error":    "worker exited without result"
+            }
+
+        result["returnCode"] = returnCode
+        self.results[taskIndex] = result
+
+        if self.onResult != None:
+            self.onResult(taskIndex,result)
+
+    def step(self):
+        for taskIndex in list(self.running.keys()):
+            returnCode = self.running[taskIndex].poll()
+            if returnCode == None:
+                continue
+
+            del self.running[taskIndex]
+            self.collect(taskIndex,returnCode)
+
+        while len(self.pending) > 0 and len(self.running) < self.maxWorkers:
+            taskIndex = self.pending.pop(0)
+            self.running[taskIndex] = self.launcher(self.manifestPath,taskIndex)
+
+        if self.isDone() and self.assembled == None:
+            self.assemble()
+
+        return self.assembled == None
+
+    def assemble(self):
+        if self.executor == None:
+            self.assembled = assembleChunkedTasks(self.manifest["tasks"],self.results)
+            return
+
+        if self.assembleFuture == None:
+            self.assembleFuture = self.executor.submit(assembleChunkedTasks,self.manifest["tasks"],self.results)
+
+        elif self.assembleFuture.done():
+            try:
+                self.assembled = self.assembleFuture.result()
+            except Exception:
+                traceback.print_exc()
+                self.assembled = dict.fromkeys(groupChunkedTasks(self.manifest["tasks"]),False)
+
+    def run(self):
+        while self.step():
+            time.sleep(self.pollInterval)
+
+        return self.getResults()
+
+    def cancel(self):
+        for taskIndex in list(self.running.keys()):
+            self.running[taskIndex].kill()
+            self.running[taskIndex].wait()
+            del self.running[taskIndex]
+            self.collect(taskIndex,None)
+
+        self.pending = []
+
+    def getResults(self):
+        return [self.results[taskIndex] for taskIndex in sorted(self.results.keys())]
+
+##--------------------------------------------------------
+## MARK: estimate
+##--------------------------------------------------------
+PLAYBLASTHISTORYLIMIT = 2000
+DEFAULTSECONDSPERFRAME = 0.2
+SAMECAMERASAMPLES = 5
+ETARATIORANGE = [0.25,4.0]
+
+class FileLock(object):
+    def __init__(self,lockPath,timeout = 10.0,staleSeconds = 60.0):
+        self.lockPath = lockPath
+        self.timeout = timeout
+        self.staleSeconds = staleSeconds
+
+    def acquire(self):
+        deadline = time.time() + self.timeout
+
+        while True:
+            try:
+                fd = os.open(self.lockPath,os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd,str(os.getpid()).encode("utf-8"))
+                os.close(fd)
+                return
+
+            except OSError as e:
+                if e.errno != errno.EEXIST:
+                    raise
+
+            try:
+                if time.time() - os.path.getmtime(self.lockPath) > self.staleSeconds:
+                    os.remove(self.lockPath)
+                    continue
+            except OSError:
+                continue
+
+            if time.time() > deadline:
+                raise IOError("timed out waiting for lock: " + self.lockPath)
+
+            time.sleep(0.05)
+
+    def release(self):
+        try:
+            os.remove(self.lockPath)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self,*args):
+        self.release()
+
+class PlayblastHistory(object):
+    def __init__(self,historyPath,limit = PLAYBLASTHISTORYLIMIT):
+        self.historyPath = historyPath
+        self.limit = limit
+        self.lock = threading.Lock()
+
+    def read(self):
+        records = []
+        if os.path.isfile(self.historyPath) == False:
+            return records
+
+        with open(self.historyPath,"r") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+
+        return records[-self.limit:]
+
+    def append(self,records):
+        if len(records) == 0:
+            return
+
+        historyDir = os.path.dirname(self.historyPath)
+        if historyDir != "" and os.path.isdir(historyDir) == False:
+            os.makedirs(historyDir)
+
+        ## workers, the server and the GUI share one history file
+        with self.lock,FileLock(self.historyPath + ".lock"):
+            with open(self.historyPath,"a") as f:
+                for record in records:
+                    f.write(json.dumps(record) + "\n")
+
+            if os.path.getsize(self.historyPath) > self.limit * 1024:
+                self.compact()
+
+    def compact(self):
+        records = self.read()
+        tmpPath = self.historyPath + "." + str(os.getpid()) + ".tmp"
+
+        with open(tmpPath,"w") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+
+        os.replace(tmpPath,self.historyPath)
+
+def buildHistoryRecord(scene,camera,frames,seconds,resolution = None,nodeCount = None,outputFormat = None):
+    return {
+                "time":             time.time(),
+                "scene":            scene,
+                "camera":           camera,
+                "frames":           int(frames),
+                "resolution":       resolution,
+                "nodeCount":        nodeCount,
+                "outputFormat":     outputFormat,
+                "seconds":          seconds,
+                "secondsPerFrame":  seconds / max(int(frames),1)
+    }
+
+def getScaleRatio(value,recordValue):
+    if value == None or recordValue == None or value <= 0 or recordValue <= 0:
+        return 1.0
+
+    return float(value) / float(recordValue)
+
+class PlayblastEstimator(object):
+    def __init__(self,records,defaultSecondsPerFrame = DEFAULTSECONDSPERFRAME):
+        self.records = [record for record in records if record.get("frames",0) > 0]
+        self.defaultSecondsPerFrame = defaultSecondsPerFrame
+
+        self.cameraRecords = {}
+        for record in self.records:
+            self.cameraRecords.setdefault((record["scene"],record["camera"]),[]).append(record)
+
+    def secondsPerFrame(self,scene,camera,resolution = None,nodeCount = None,outputFormat = None):
+        pixels = None
+        if resolution != None:
+            pixels = resolution[0] * resolution[1]
+
+        cameraRecords = self.cameraRecords.get((scene,camera),[])[-SAMECAMERASAMPLES:]
+        if len(cameraRecords) > 0:
+            samples = sorted([record["secondsPerFrame"] * getScaleRatio(pixels,self.getPixels(record)) ** 0.5 for record in cameraRecords])
+            return samples[len(samples) // 2]
+
+        totalWeight = 0.0
+        total = 0.0
+
+        for record in self.records:
+            pixelRatio = getScaleRatio(pixels,self.getPixels(record))
+            nodeRatio = getScaleRatio(nodeCount,record.get("nodeCount"))
+
+            weight = 1.0 / (1.0 + abs(pixelRatio - 1.0) + abs(nodeRatio - 1.0))
+            if outputFormat != None and record.get("outputFormat") != outputFormat:
+                weight *= 0.5
+
+            total += weight * record["secondsPerFrame"] * (pixelRatio * nodeRatio) ** 0.5
+            totalWeight += weight
+
+        if totalWeight == 0.0:
+            return self.defaultSecondsPerFrame
+
+        return total / totalWeight
+
+    def getPixels(self,record):
+        if record.get("resolution") == None:
+            return None
+
+        return record["resolution"][0] * record["resolution"][1]
+
+    def estimate(self,scene,camera,frames,resolution = None,nodeCount = None,outputFormat = None):
+        return self.secondsPerFrame(scene,camera,resolution,nodeCount,outputFormat) * int(frames)
+
+def getTaskFrames(task):
+    return int(task["timeRange"][1]) - int(task["timeRange"][0]) + 1
+
+def orderLongestFirst(tasks,estimates):
+    order = sorted(range(0,len(tasks)),key = lambda taskIndex:-estimates[taskIndex])
+    return [tasks[taskIndex] for taskIndex in order],[estimates[taskIndex] for taskIndex in order]
+
+def formatDuration(seconds):
+    seconds = int(round(max(seconds,0)))
+    if seconds >= 3600:
+        return "{}:{:02d}:{:02d}".format(seconds // 3600,seconds % 3600 // 60,seconds % 60)
+
+    return "{}:{:02d}".format(seconds // 60,seconds % 60)
+
+class PlayblastEta(object):
+    def __init__(self,estimates,workers = 1):
+        self.estimates = dict(estimates)
+        self.workers = max(1,int(workers))
+        self.done = set()
+        self.startTime = time.time()
+
+    def setDone(self,key):
+        self.done.add(key)
+
+    def remaining(self):
+        estimatedDone = sum(self.estimates[key] for key in self.done if key in self.estimates)
+        estimatedLeft = sum(self.estimates[key] for key in self.estimates if key not in self.done)
+
+        ratio = 1.0
+        if estimatedDone > 0:
+            ratio = min(max((time.time() - self.startTime) * self.workers / estimatedDone,ETARATIORANGE[0]),ETARATIORANGE[1])
+
+        return estimatedLeft * ratio / self.workers
+
+    def getStatus(self,label):
+        return "{}: {}/{}  ETA {}".format(label,len(self.done),len(self.estimates),formatDuration(self.remaining()))
+
+##--------------------------------------------------------
+## MARK: shot list
+##--------------------------------------------------------
+SHOTLISTJOURNALFILE = "journal.jsonl"
+
+def readShotList(shotListPath):
+    scenes = []
+
+    with open(shotListPath,"r") as f:
+        for line in f:
+            line = line.strip()
+            if line == "" or line.startswith("#"):
+                continue
+
+            scenes.append(line.replace("\\","/"))
+
+    return scenes
+
+class ShotListJournal(JsonLinesJournal):
+    def getState(self):
+        planned = {}
+        done = set()
+
+        for event in self.read():
+            if event["event"] == "plan":
+                planned[event["scene"]] = event.get("estimates") or dict([(camera,0.0) for camera in event["cameras"]])
+
+            elif event["event"] == "done":
+                done.add((event["scene"],event["camera"]))
+
+        return planned,done
+
+def readServerAddress(process):
+    for line in iter(process.stdout.readline,b""):
+        line = line.decode("utf-8","replace").strip()
+        if line.startswith("listening: ") == False:
+            continue
+
+        host,port = line[len("listening: "):].rsplit(":",1)
+        drainThread = threading.Thread(target = process.stdout.read)
+        drainThread.daemon = True
+        drainThread.start()
+        return host,int(port)
+
+    process.wait()
+    raise SSCameraSwitcherServer.PlayblastServerError("server exited before listening: " + str(process.returncode))
+
+class MayapyServerLauncher(object):
+    def __init__(self,mayapy = None,moduleDir = None):
+        self.mayapy = mayapy or getMayapyPath()
+        self.moduleDir = moduleDir or os.path.dirname(os.path.abspath(__file__))
+
+    def getCommand(self):
+        return [self.mayapy,os.path.join(self.moduleDir,"SSCameraSwitcherServer.py"),"--port","0"]
+
+    def __call__(self):
+        process = subprocess.Popen(self.getCommand(),stdout = subprocess.PIPE)
+        host,port = readServerAddress(process)
+        return process,SSCameraSwitcherServer.PlayblastServerClient(host,port)
+
+class FakeServerLauncher(MayapyServerLauncher):
+    def __init__(self,python = None,secondsPerFrame = 0.0,failCameras = None):
+        super(FakeServerLauncher,self).__init__(mayapy = python or sys.executable)
+        self.secondsPerFrame = secondsPerFrame
+        self.failCameras = failCameras or []
+
+    def getCommand(self):
+        command = super(FakeServerLauncher,self).getCommand() + ["--fake","--fakeSecondsPerFrame",str(self.secondsPerFrame)]
+        if len(self.failCameras) > 0:
+            command += ["--fakeFailCameras"] + self.failCameras
+
+        return command
+
+class ShotListWorker(object):
+    def __init__(self,launcher):
+        self.launcher = launcher
+        self.process = None
+        self.client = None
+        self.scene = None
+
+    def isAlive(self):
+        return self.process != None and self.process.poll() == None
+
+    def start(self):
+        self.stop()
+        self.process,self.client = self.launcher()
+
+    def openScene(self,scenePath):
+        if self.isAlive() == False:
+            self.start()
+
+        if self.scene != scenePath:
+            self.scene = None
+            self.client.openScene(scenePath)
+            self.scene = scenePath
+
+    def stop(self):
+        if self.client != None:
+            try:
+                self.client.shutdown()
+            except (SSCameraSwitcherServer.PlayblastServerError,IOError,OSError):
+                pass
+
+        if self.process != None:
+            try:
+                self.process.wait(timeout = 10)
+            except TypeError:
+                self.process.wait()
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+
+        self.process = None
+        self.client = None
+        self.scene = None
+
+class ShotListScheduler(object):
+    def __init__(self,scenes,runDir,maxWorkers = 2,launcher = None,maxRetries = 2,blastOptions = None,resume = False,onEvent = None):
+        self.scenes = scenes
+        self.runDir = runDir
+        self.maxWorkers = max(1,int(maxWorkers))
+        self.launcher = launcher or MayapyServerLauncher()
+        self.maxRetries = max(0,int(maxRetries))
+        self.blastOptions = blastOptions or {}
+        self.onEvent = onEvent
+
+        self.journal = ShotListJournal(os.path.join(runDir,SHOTLISTJOURNALFILE))
+        self.condition = threading.Condition()
+        self.pending = []
+        self.running = 0
+        self.openScenes = {}
+        self.results = {}
+
+        planned = {}
+        done = set()
+        if resume:
+            planned,done = self.journal.getState()
+
+        self.journal.append({"event":"start","scenes":scenes,"resume":resume})
+
+        for scenePath in scenes:
+            if scenePath not in planned:
+                self.pending.append({"scene":scenePath,"camera":None,"attempt":0})
+                continue
+
+            for camera in planned[scenePath]:
+                if (scenePath,camera) in done:
+                    self.results[(scenePath,camera)] = "done"
+                else:
+                    self.pending.append({"scene":scenePath,"camera":camera,"attempt":0,"estimate":planned[scenePath][camera]})
+
+        self.sortPending()
+
+    def sortPending(self):
+        self.pending.sort(key = lambda task:(task["camera"] != None,-task.get("estimate",0.0)))
+
+    def log(self,event):
+        self.journal.append(event)
+        if self.onEvent != None:
+            self.onEvent(event)
+
+    def takeTask(self,workerIndex,scenePath):
+        with self.condition:
+            while len(self.pending) == 0:
+                if self.running == 0:
+                    return None
+                self.condition.wait()
+
+            busyScenes = [self.openScenes[index] for index in self.openScenes if index != workerIndex]
+            taskIndex = 0
+
+            for i in range(0,len(self.pending)):
+                if self.pending[i]["scene"] == scenePath:
+                    taskIndex = i
+                    break
+
+                if self.pending[taskIndex]["scene"] in busyScenes and self.pending[i]["scene"] not in busyScenes:
+                    taskIndex = i
+
+            self.running += 1
+            task = self.pending.pop(taskIndex)
+            self.openScenes[workerIndex] = task["scene"]
+            return task
+
+    def finishTask(self,tasks = None):
+        with self.condition:
+            self.pending.extend(tasks or [])
+            self.sortPending()
+            self.running -= 1
+            self.condition.notify_all()
+
+    def runTask(self,worker,task):
+        worker.openScene(task["scene"])
+
+        if task["camera"] == None:
+            cameraInfos = [cameraInfo for cameraInfo in worker.client.listCameras(**self.blastOptions) if cameraInfo["playblast"]]
+            estimates = dict([(cameraInfo["camera"],cameraInfo.get("estimate",0.0)) for cameraInfo in cameraInfos])
+
+            self.log({"event":"plan","scene":task["scene"],"cameras":sorted(estimates.keys()),"estimates":estimates})
+            return [{"scene":task["scene"],"camera":camera,"attempt":0,"estimate":estimates[camera]} for camera in estimates]
+
+        options = dict(self.blastOptions)
+        options["cameras"] = [task["camera"]]
+        result = worker.client.blast(**options)["cameras"][0]
+
+        if result["status"] != "done":
+            raise SSCameraSwitcherServer.PlayblastServerError("playblast " + result["status"] + ": " + task["camera"])
+
+        self.log({"event":"done","scene":task["scene"],"camera":task["camera"],"seconds":result["seconds"],"attempt":task["attempt"]})
+        self.results[(task["scene"],task["camera"])] = "done"
+        return []
+
+    def runWorker(self,workerIndex):
+        worker = ShotListWorker(self.launcher)
+
+        try:
+            while True:
+                task = self.takeTask(workerIndex,worker.scene)
+                if task == None:
+                    return
+
+                newTasks = []
+                try:
+                    newTasks = self.runTask(worker,task)
+
+                except Exception as e:
+                    retry = task["attempt"] < self.maxRetries
+                    self.log({
+                                "event":    "failed",
+                                "scene":    task["scene"],
+                                "camera":   task["camera"],
+                                "attempt":  task["attempt"],
+                                "retry":    retry,
+                                "error":    str(e) or traceback.format_exc()
+                    })
+
+                    if worker.isAlive() == False or isinstance(e,SSCameraSwitcherServer.PlayblastServerError) == False:
+                        worker.stop()
+
+                    if retry:
+                        task = dict(task)
+                        task["attempt"] += 1
+                        newTasks = [task]
+                    else:
+                        self.results[(task["scene"],task["camera"])] = "failed"
+
+                self.finishTask(newTasks)
+
+        finally:
+            with self.condition:
+                self.openScenes.pop(workerIndex,None)
+            worker.stop()
+
+    def run(self):
+        threads = []
+        for workerIndex in range(0,self.maxWorkers):
+            thread = threading.Thread(target = self.runWorker,args = (workerIndex,))
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+
+        for thread in threads:
+            thread.join()
+
+        results = self.getResults()
+        self.log({"event":"finish","failed":len([result for result in results if result["status"] != "done"])})
+        return results
+
+    def getResults(self):
+        return [{"scene":key[0],"camera":key[1],"status":self.results[key]} for key in sorted(self.results.keys(),key = lambda key:(key[0],str(key[1])))]
+
+def runShotList(argv):
+    parser = argparse.ArgumentParser(description = "playblast the enabled cameras of every scene in a shot list")
+    parser.add_argument("shotList",help = "text file with one scene path per line")
+    parser.add_argument("--runDir",required = True,help = "journal directory, reuse it with --resume")
+    parser.add_argument("--workers",type = int,default = 2)
+    parser.add_argument("--retries",type = int,default = 2)
+    parser.add_argument("--resume",action = "store_true")
+    parser.add_argument("--mayapy",default = None)
+    parser.add_argument("--outputDir",default = None)
+    parser.add_argument("--format",dest = "outputFormat",choices = ["png","jpg","avi"],default = None)
+    parser.add_argument("--savedOptions",action = "store_true")
+    parser.add_argument("--fake",action = "store_true",help = "use the fake server backend")
+    args = parser.parse_args(argv)
+
+    blastOptions = {"savedOptions":args.savedOptions}
+    for key in ["outputDir","outputFormat"]:
+        if getattr(args,key) != None:
+            blastOptions[key] = getattr(args,key)
+
+    if args.fake:
+        launcher = FakeServerLauncher()
+    else:
+        launcher = MayapyServerLauncher(mayapy = args.mayapy)
+
+    def printEvent(event):
+        if event["event"] in ["plan","done","failed"]:
+            print(json.dumps(event))
+            sys.stdout.flush()
+
+    scheduler = ShotListScheduler(readShotList(args.shotList),args.runDir,args.workers,launcher,args.retries,blastOptions,args.resume,printEvent)
+    results = scheduler.run()
+    failed = [result for result in results if result["status"] != "done"]
+
+    print("shot list: {} jobs, {} failed".format(len(results),len(failed)))
+    if len(failed) > 0:
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "fakeWorker":
+        sys.exit(runFakeWorkerTask(sys.argv[2],int(sys.argv[3])))
+
+    if len(sys.argv) > 1 and sys.argv[1] == "shotList":
+        sys.exit(runShotList(sys.argv[2:]))
@@ -0,0 +1,62 @@
+## mayapy benchmarks/benchGetTransformNode.py [count ...]
+import os
+import sys
+import time
+
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import maya.standalone
+maya.standalone.initialize()
+
+import maya.cmds as cmds
+import SSCameraSwitcherCore
+
+def legacyGetTransformNode(targets,fullpath = False):
+    transfromNodes = []
+    
+    for target in targets:
+        nodeTypes = cmds.nodeType(target,inherited = True)
+        transfromNode = None
+        if "transform" in nodeTypes:
+            transfromNode = target
+        
+        elif "shape" in nodeTypes:
+            parent = cmds.listRelatives(target, p =True,f=fullpath)[0]
+            transfromNode = parent
+
+        if transfromNode not in transfromNodes:
+            transfromNodes.append(transfromNode)
+    
+    return transfromNodes
+
+def createShapes(count):
+    cmds.file(new =True,force =True)
+
+    for i in range(0,count):
+        cmds.createNode("locator",skipSelect =True)
+
+    return cmds.ls(shapes =True)
+
+def timeFunc(func,*args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start,result
+
+def main(counts):
+    for count in counts:
+        shapes = createShapes(count)
+
+        for fullpath in [False,True]:
+            newTime,newResult = timeFunc(SSCameraSwitcherCore.getTransformNode,shapes,fullpath)
+            oldTime,oldResult = timeFunc(legacyGetTransformNode,shapes,fullpath)
+
+            if newResult != oldResult:
+                print("mismatch count:{} fullpath:{}".format(count,fullpath))
+
+            print("shapes:{:>7} fullpath:{:<5} legacy:{:9.3f}s batched:{:9.3f}s x{:.1f}".format(
+                                                                                count,str(fullpath),oldTime,newTime,oldTime / max(newTime,1e-9)))
+
+if __name__ == "__main__":
+    counts = [int(arg) for arg in sys.argv[1:]] or [10000,100000]
+    main(counts)
+    maya.standalone.uninitialize()
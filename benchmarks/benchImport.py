@@ -0,0 +1,71 @@
+## python benchmarks/benchImport.py [--repeat 5] [--mayapy path]
+## cold-start time and memory of importing the GUI module against the GUI-free core
+## without --mayapy the fake maya backend is used, with it maya.standalone is initialized first
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+BENCHDIR = os.path.dirname(os.path.abspath(__file__))
+ROOTDIR = os.path.dirname(BENCHDIR)
+
+MODULES = ["SSCameraSwitcher","SSCameraSwitcherCore"]
+
+IMPORTSCRIPT = (
+                "import sys,time,json,tracemalloc;"
+                "sys.path.insert(0,{rootDir!r});"
+                "sys.path.insert(0,{benchDir!r});"
+                "{setup}"
+                "modulesBefore = set(sys.modules);"
+                "tracemalloc.start();"
+                "start = time.perf_counter();"
+                "import {moduleName};"
+                "seconds = time.perf_counter() - start;"
+                "peak = tracemalloc.get_traced_memory()[1];"
+                "loaded = set(sys.modules) - modulesBefore;"
+                "print(json.dumps({{"
+                "'seconds':seconds,"
+                "'peakBytes':peak,"
+                "'modules':len(loaded),"
+                "'qt':any(name.split('.')[0] in ['PySide2','PySide6','shiboken2','shiboken6'] for name in sys.modules)"
+                "}}))"
+)
+
+FAKESETUP = "import fakeMaya;fakeMaya.install(qt = {qt});"
+MAYASETUP = "import maya.standalone;maya.standalone.initialize(name = 'python');"
+
+def measureImport(python,moduleName,useMaya):
+    if useMaya:
+        setup = MAYASETUP
+    else:
+        setup = FAKESETUP.format(qt = moduleName == "SSCameraSwitcher")
+
+    script = IMPORTSCRIPT.format(rootDir = ROOTDIR,benchDir = BENCHDIR,setup = setup,moduleName = moduleName)
+    output = subprocess.check_output([python,"-c",script])
+
+    return json.loads(output.decode("utf-8").strip().splitlines()[-1])
+
+def main(argv):
+    parser = argparse.ArgumentParser(description = "SSCameraSwitcher import benchmark")
+    parser.add_argument("--repeat",type = int,default = 5)
+    parser.add_argument("--mayapy",default = None)
+    args = parser.parse_args(argv)
+
+    python = args.mayapy or sys.executable
+    print("{:<24}{:>12}{:>14}{:>10}{:>6}".format("module","import(ms)","peak(KiB)","modules","qt"))
+
+    for moduleName in MODULES:
+        samples = sorted([measureImport(python,moduleName,args.mayapy != None) for i in range(0,args.repeat)],key = lambda sample:sample["seconds"])
+        sample = samples[len(samples) // 2]
+
+        print("{:<24}{:>12.2f}{:>14.1f}{:>10}{:>6}".format(
+                                                        moduleName,
+                                                        sample["seconds"] * 1000.0,
+                                                        sample["peakBytes"] / 1024.0,
+                                                        sample["modules"],
+                                                        str(sample["qt"])
+                                                    ))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,181 @@
+## mayapy benchmarks/benchSceneIndex.py [count ...]
+## python benchmarks/benchSceneIndex.py --fake [count ...]
+import os
+import sys
+import time
+
+BENCHDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0,os.path.dirname(BENCHDIR))
+sys.path.insert(0,BENCHDIR)
+
+FAKE = "--fake" in sys.argv
+
+if FAKE:
+    import fakeMaya
+    fakeMaya.install(qt = False)
+else:
+    import maya.standalone
+    maya.standalone.initialize()
+
+import maya.cmds as cmds
+import SSCameraSwitcherCore
+
+QUERIES = [
+            ["camera",False,None],
+            ["locator",True,None],
+            ["transform",False,"char1"],
+            ["noShapeTransform",True,None]
+]
+EDITCOUNT = 50
+
+##--------------------------------------------------------
+## MARK: legacy
+##--------------------------------------------------------
+def legacyGetTransformNode(targets,fullpath = False):
+    transfromNodes = []
+
+    for target in targets:
+        nodeTypes = cmds.nodeType(target,inherited = True)
+        transfromNode = None
+        if "transform" in nodeTypes:
+            transfromNode = target
+
+        elif "shape" in nodeTypes:
+            parent = cmds.listRelatives(target, p =True,f=fullpath)[0]
+            transfromNode = parent
+
+        if transfromNode not in transfromNodes:
+            transfromNodes.append(transfromNode)
+
+    return transfromNodes
+
+def legacyListTypeNodes(nodeType,fullpath = False,nameSpace = None):
+    defaultNodes = cmds.ls(defaultNodes =True, l= fullpath)
+
+    if nodeType == "noShapeTransform":
+        nodes = legacyListTypeNodes("transform",fullpath)
+        shapes = cmds.ls(shapes =True, l = fullpath)
+        nodes = list(set(nodes) - set(legacyGetTransformNode(shapes,fullpath)))
+
+    elif nodeType in ["locator","camera"]:
+        nodes = cmds.ls(type = nodeType, l= fullpath) or []
+        nodes = legacyGetTransformNode(nodes,fullpath)
+
+    else:
+        nodes = cmds.ls(type = nodeType, l= fullpath) or []
+
+    nodes = list(set(nodes) - set(defaultNodes))
+
+    if nameSpace != None:
+        nodes = [node for node in nodes if node.startswith(nameSpace +":")]
+
+    return nodes
+
+##--------------------------------------------------------
+## MARK: scene
+##--------------------------------------------------------
+def createScene(count):
+    if FAKE:
+        scene = fakeMaya.buildScene(count,20)
+        fakeMaya.setScene(scene)
+        return [node for node in scene.nodes if node.nodeType == "transform" and node.isDefault == False][-EDITCOUNT:]
+
+    cmds.file(new =True,force =True)
+    if cmds.namespace(exists = "char1") == False:
+        cmds.namespace(add = "char1")
+
+    for i in range(0,20):
+        cmds.camera(name = "shot_cam" + str(i +1).zfill(3))
+
+    group = None
+    for i in range(0,count // 2):
+        if i % 100 == 0:
+            group = cmds.createNode("transform",name = "grp" + str(i // 100 +1),skipSelect =True)
+
+        name = "loc" + str(i +1)
+        if (i // 100) % 4 == 3:
+            name = "char1:" + name
+
+        transform = cmds.createNode("transform",name = name,parent = group,skipSelect =True)
+        cmds.createNode("locator",name = name + "Shape",parent = transform,skipSelect =True)
+
+    return cmds.ls(type = "transform",long =True)[-EDITCOUNT:]
+
+def renameNode(node,i):
+    if FAKE:
+        fakeMaya.getScene().renameNode(node,"edit" + str(i))
+        return
+
+    cmds.rename(node,"edit" + str(i))
+
+def renameTargets(targets):
+    if FAKE:
+        return targets
+
+    return [cmds.ls(target,uuid =True)[0] for target in targets]
+
+def resolveTarget(target):
+    if FAKE:
+        return target
+
+    return cmds.ls(target,long =True)[0]
+
+##--------------------------------------------------------
+## MARK: run
+##--------------------------------------------------------
+def runQueries(func):
+    results = []
+    for nodeType,fullpath,nameSpace in QUERIES:
+        results.append(sorted(func(nodeType,fullpath = fullpath,nameSpace = nameSpace)))
+
+    return results
+
+def timeFunc(func,*args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start,result
+
+def timeEdits(targets,func,offset):
+    start = time.perf_counter()
+    for i in range(0,len(targets)):
+        renameNode(resolveTarget(targets[i]),offset + i)
+        func()
+
+    return time.perf_counter() - start
+
+def main(counts):
+    for count in counts:
+        targets = renameTargets(createScene(count))
+
+        SSCameraSwitcherCore.removeSceneIndexCallbacks()
+        legacyTime,legacyResult = timeFunc(runQueries,legacyListTypeNodes)
+        coldTime,coldResult = timeFunc(runQueries,SSCameraSwitcherCore.listTypeNodes)
+        warmTime,warmResult = timeFunc(runQueries,SSCameraSwitcherCore.listTypeNodes)
+
+        if coldResult != legacyResult or warmResult != legacyResult:
+            print("mismatch count:{}".format(count))
+
+        print("nodes:{:>7} legacy:{:9.3f}s index cold:{:9.3f}s warm:{:9.3f}s cold x{:.1f}".format(
+                                                                            count,legacyTime,coldTime,warmTime,legacyTime / max(coldTime,1e-9)))
+
+        editTargets = targets[:EDITCOUNT // 2]
+        legacyEditTime = timeEdits(editTargets,lambda:runQueries(legacyListTypeNodes),0)
+
+        SSCameraSwitcherCore.getSceneIndex()
+        editTargets = targets[EDITCOUNT // 2:]
+        indexEditTime = timeEdits(editTargets,lambda:runQueries(SSCameraSwitcherCore.listTypeNodes),EDITCOUNT)
+
+        if runQueries(SSCameraSwitcherCore.listTypeNodes) != runQueries(legacyListTypeNodes):
+            print("mismatch after edits count:{}".format(count))
+
+        print("nodes:{:>7} rename+query x{} legacy:{:9.3f}s index:{:9.3f}s x{:.1f}".format(
+                                                                            count,len(editTargets),legacyEditTime,indexEditTime,legacyEditTime / max(indexEditTime,1e-9)))
+
+        SSCameraSwitcherCore.removeSceneIndexCallbacks()
+
+if __name__ == "__main__":
+    counts = [int(arg) for arg in sys.argv[1:] if arg != "--fake"] or [10000,100000]
+    main(counts)
+
+    if FAKE == False:
+        maya.standalone.uninitialize()
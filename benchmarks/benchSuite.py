@@ -0,0 +1,223 @@
+## python benchmarks/benchSuite.py [--sizes 10 1000 100000] [--cameras 20] [--repeat 5] [--label name] [--baseline name]
+## runs against the in-memory fake maya backend, no maya session needed
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import argparse
+import platform
+import subprocess
+
+BENCHDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0,os.path.dirname(BENCHDIR))
+sys.path.insert(0,BENCHDIR)
+
+import fakeMaya
+fakeMaya.install(qt = False)
+
+import SSCameraSwitcherCore
+
+RESULTSDIR = os.path.join(BENCHDIR,"results")
+REGRESSIONRATIO = 1.2
+REGRESSIONFLOOR = 0.001
+
+VIEWITEMOPTION = {"headsUpDisplay":True,"polymeshes":True,"displayAppearance":"smoothShaded"}
+SHOWHUDS = {"resolutionGate":False,"cameranames":True,"currentFrame":True}
+
+##--------------------------------------------------------
+## MARK: benchmarks
+##--------------------------------------------------------
+def resetCaches():
+    SSCameraSwitcherCore.invalidateSceneIndex()
+    SSCameraSwitcherCore.getCamAttrSchema().invalidate()
+
+def benchListTypeNodesCold():
+    SSCameraSwitcherCore.invalidateSceneIndex()
+    return SSCameraSwitcherCore.listTypeNodes("camera")
+
+def benchListTypeNodesWarm():
+    SSCameraSwitcherCore.getSceneIndex()
+    return SSCameraSwitcherCore.listTypeNodes("locator",fullpath = True)
+
+def benchGetTransformNode(shapes):
+    return SSCameraSwitcherCore.getTransformNode(shapes)
+
+def benchReloadCameraList():
+    return SSCameraSwitcherCore.listCameraTransforms(SSCameraSwitcherCore.getCameraShapeHandles(),True)
+
+def benchGetCameraInfo(cameras):
+    SSCameraSwitcherCore.getCamAttrSchema().invalidate()
+    return [SSCameraSwitcherCore.getCameraInfo("cameraInfoSets",camera) for camera in cameras]
+
+def benchGetPlayblastCam():
+    SSCameraSwitcherCore.getCamAttrSchema().invalidate()
+    return SSCameraSwitcherCore.getPlayblastCam("cameraInfoSets")
+
+def benchPlanPlayblastAll(outputDir):
+    cameraInfoTable = SSCameraSwitcherCore.readCameraInfoTable("cameraInfoSets")
+    cameras = SSCameraSwitcherCore.getPlayblastCam("cameraInfoSets",cameraInfoTable)
+
+    jobs = []
+    for camera in cameras:
+        jobs.append(SSCameraSwitcherCore.buildPlayblastJob(camera,cameraInfoTable[camera],outputDir,"{scene}/{camera}/{scene}_{camera}"))
+
+    playblastCache = SSCameraSwitcherCore.PlayblastCache(os.path.join(outputDir,SSCameraSwitcherCore.PLAYBLASTCACHEFILE))
+    return SSCameraSwitcherCore.filterCachedJobs(playblastCache,jobs,VIEWITEMOPTION,SHOWHUDS,"png",[1920,1080],True)
+
+def getBenchmarks(scene,outputDir):
+    shapes = [node.name for node in scene.nodes if fakeMaya.MFn.kShape in node.fnTypes]
+    cameras = [node.name for node in scene.nodes if node.nodeType == "objectSet" and node.name.endswith("_infoSet")]
+    cameras = [camera[:-len("_infoSet")] for camera in cameras]
+
+    return [
+            ["listTypeNodes cold",  benchListTypeNodesCold,[]],
+            ["listTypeNodes warm",  benchListTypeNodesWarm,[]],
+            ["getTransformNode",    benchGetTransformNode,[shapes]],
+            ["reloadCameraList",    benchReloadCameraList,[]],
+            ["getCameraInfo",       benchGetCameraInfo,[cameras]],
+            ["getPlayblastCam",     benchGetPlayblastCam,[]],
+            ["planPlayblastAll",    benchPlanPlayblastAll,[outputDir]]
+    ]
+
+def timeFunc(func,args,repeat):
+    samples = []
+
+    for i in range(0,repeat):
+        start = time.perf_counter()
+        func(*args)
+        samples.append(time.perf_counter() - start)
+
+    samples.sort()
+    return {
+            "min":      samples[0],
+            "median":   samples[len(samples) // 2],
+            "repeat":   repeat
+    }
+
+def runSuite(sizes,cameraCount,repeat):
+    results = {}
+    outputDir = tempfile.mkdtemp(prefix = "SSCameraSwitcherBench_").replace("\\","/") + "/"
+
+    try:
+        for size in sizes:
+            scene = fakeMaya.buildScene(size,cameraCount)
+            fakeMaya.setScene(scene)
+            resetCaches()
+
+            sceneKey = "nodes:{} cameras:{}".format(size,cameraCount)
+            results[sceneKey] = {}
+
+            for name,func,args in getBenchmarks(scene,outputDir):
+                results[sceneKey][name] = timeFunc(func,args,repeat)
+    finally:
+        shutil.rmtree(outputDir,ignore_errors = True)
+
+    return results
+
+##--------------------------------------------------------
+## MARK: results
+##--------------------------------------------------------
+def getDefaultLabel():
+    try:
+        label = subprocess.check_output(["git","rev-parse","--short","HEAD"],cwd = BENCHDIR,stderr = subprocess.STDOUT)
+        return label.decode("utf-8").strip()
+    except (OSError,subprocess.CalledProcessError):
+        return time.strftime("%Y%m%d_%H%M%S")
+
+def getResultPath(label):
+    return os.path.join(RESULTSDIR,label + ".json")
+
+def saveResults(label,results):
+    if os.path.isdir(RESULTSDIR) == False:
+        os.makedirs(RESULTSDIR)
+
+    with open(getResultPath(label),"w") as f:
+        json.dump({
+                    "label":    label,
+                    "time":     time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "python":   platform.python_version(),
+                    "platform": platform.platform(),
+                    "results":  results
+        },f,indent = 4)
+
+    return getResultPath(label)
+
+def findBaseline(label):
+    if os.path.isdir(RESULTSDIR) == False:
+        return None
+
+    resultPaths = []
+    for fileName in os.listdir(RESULTSDIR):
+        if fileName.endswith(".json") and fileName != label + ".json":
+            resultPaths.append(os.path.join(RESULTSDIR,fileName))
+
+    if len(resultPaths) == 0:
+        return None
+
+    return os.path.splitext(os.path.basename(max(resultPaths,key = os.path.getmtime)))[0]
+
+def readResults(label):
+    if label == None or os.path.isfile(getResultPath(label)) == False:
+        return None
+
+    with open(getResultPath(label),"r") as f:
+        return json.load(f)["results"]
+
+def printResults(results,baseline = None,baselineLabel = ""):
+    regressions = []
+
+    for sceneKey in results:
+        print(sceneKey)
+
+        for name in results[sceneKey]:
+            median = results[sceneKey][name]["median"]
+            line = "    {:<22}{:>12.6f}s".format(name,median)
+
+            baseMedian = None
+            if baseline != None and name in baseline.get(sceneKey,{}):
+                baseMedian = baseline[sceneKey][name]["median"]
+
+            if baseMedian != None:
+                ratio = median / max(baseMedian,1e-9)
+                line += "  {:>12.6f}s  x{:.2f}".format(baseMedian,ratio)
+
+                if ratio > REGRESSIONRATIO and median - baseMedian > REGRESSIONFLOOR:
+                    line += "  slower"
+                    regressions.append(sceneKey + " " + name)
+
+            print(line)
+
+    if baseline != None:
+        print("baseline: " + baselineLabel)
+
+    return regressions
+
+def main(argv):
+    parser = argparse.ArgumentParser(description = "SSCameraSwitcher benchmark suite (fake maya backend)")
+    parser.add_argument("--sizes",type = int,nargs = "+",default = [10,1000,100000])
+    parser.add_argument("--cameras",type = int,default = 20)
+    parser.add_argument("--repeat",type = int,default = 5)
+    parser.add_argument("--label",default = None)
+    parser.add_argument("--baseline",default = None)
+    parser.add_argument("--noSave",action = "store_true")
+    args = parser.parse_args(argv)
+
+    label = args.label or getDefaultLabel()
+    baselineLabel = args.baseline or findBaseline(label)
+
+    results = runSuite(args.sizes,args.cameras,args.repeat)
+    regressions = printResults(results,readResults(baselineLabel),baselineLabel)
+
+    if args.noSave == False:
+        print("saved: " + saveResults(label,results))
+
+    if len(regressions) > 0:
+        print("slower than baseline: " + ", ".join(regressions))
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,33 @@
+## stand-in for ffmpeg, writes the concat list (or the input pattern) it was given into the output file
+## point SSCAMERASWITCHER_FFMPEG at the wrapper returned by install()
+import os
+import sys
+import stat
+
+def install(binDir):
+    wrapperPath = os.path.join(binDir,"ffmpeg")
+    with open(wrapperPath,"w") as f:
+        f.write("#!/bin/sh\nexec \"{}\" \"{}\" \"$@\"\n".format(sys.executable,os.path.abspath(__file__)))
+
+    os.chmod(wrapperPath,os.stat(wrapperPath).st_mode | stat.S_IXUSR)
+    os.environ["SSCAMERASWITCHER_FFMPEG"] = wrapperPath
+    return wrapperPath
+
+def uninstall():
+    os.environ.pop("SSCAMERASWITCHER_FFMPEG",None)
+
+def main(args):
+    inputPath = args[args.index("-i") +1]
+    outputPath = args[-1]
+
+    with open(outputPath,"w") as f:
+        if "concat" in args:
+            with open(inputPath,"r") as listFile:
+                f.write(listFile.read())
+        else:
+            f.write(inputPath + "\n")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
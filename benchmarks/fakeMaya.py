@@ -0,0 +1,842 @@
+## in-memory stand-in for maya.cmds / maya.api.OpenMaya used by the benchmark suite
+import sys
+import types
+import tempfile
+
+##--------------------------------------------------------
+## MARK: scene
+##--------------------------------------------------------
+TYPEHIERARCHY = {
+                    "transform":    ["containerBase","entity","dagNode","transform"],
+                    "camera":       ["containerBase","entity","dagNode","shape","camera"],
+                    "locator":      ["containerBase","entity","dagNode","shape","locator"],
+                    "mesh":         ["containerBase","entity","dagNode","shape","geometryShape","deformableShape","controlPoint","surfaceShape","mesh"],
+                    "objectSet":    ["entity","objectSet"],
+                    "animCurveTL":  ["animCurve","animCurveTL"],
+                    "animCurveTA":  ["animCurve","animCurveTA"],
+                    "time":         ["time"],
+                    "resolution":   ["resolution"]
+}
+
+class MFn(object):
+    kDagNode = 1
+    kTransform = 2
+    kShape = 3
+    kCamera = 4
+    kSet = 5
+    kAnimCurve = 6
+
+FNTYPES = {
+            "dagNode":      MFn.kDagNode,
+            "transform":    MFn.kTransform,
+            "shape":        MFn.kShape,
+            "camera":       MFn.kCamera,
+            "objectSet":    MFn.kSet,
+            "animCurve":    MFn.kAnimCurve
+}
+
+class FakeNode(object):
+    def __init__(self,nodeId,name,nodeType,parent = None,isDefault = False):
+        self.nodeId = nodeId
+        self.name = name
+        self.nodeType = nodeType
+        self.parent = parent
+        self.children = []
+        self.attrs = {}
+        self.members = []
+        self.keys = []
+        self.isDefault = isDefault
+        self.alive = True
+        self.fnTypes = set([FNTYPES[typeName] for typeName in TYPEHIERARCHY[nodeType] if typeName in FNTYPES])
+
+        if parent != None:
+            parent.children.append(self)
+
+    def isDag(self):
+        return MFn.kDagNode in self.fnTypes
+
+    def fullPathName(self):
+        if self.isDag() == False:
+            return self.name
+
+        names = []
+        node = self
+        while node != None:
+            names.append(node.name)
+            node = node.parent
+
+        return "|" + "|".join(reversed(names))
+
+class FakeScene(object):
+    def __init__(self,scenePath = "/fake/scenes/bench.ma"):
+        self.scenePath = scenePath
+        self.nodes = []
+        self.nameToNode = {}
+        self.playbackRange = [1.0,120.0]
+
+    def createNode(self,nodeType,name,parent = None,isDefault = False,attrs = None):
+        node = FakeNode(len(self.nodes),name,nodeType,parent,isDefault)
+        node.attrs.update(attrs or {})
+        self.nodes.append(node)
+        self.nameToNode[name] = node
+        return node
+
+    def findNode(self,name):
+        if name.startswith("|"):
+            name = name.rsplit("|",1)[-1]
+
+        node = self.nameToNode.get(name)
+        if node == None or node.alive == False:
+            return None
+
+        return node
+
+    def findPlug(self,plugName):
+        nodeName,attrName = plugName.split(".",1)
+        node = self.findNode(nodeName)
+
+        if node == None or attrName not in node.attrs:
+            return None,attrName
+
+        return node,attrName
+
+    def renameNode(self,node,name):
+        prevName = node.name
+        del self.nameToNode[prevName]
+        node.name = name
+        self.nameToNode[name] = node
+        fireCallbacks("nameChanged",MObject(node),prevName)
+
+    def reparentNode(self,node,parent):
+        if node.parent != None:
+            node.parent.children.remove(node)
+
+        node.parent = parent
+        if parent != None:
+            parent.children.append(node)
+
+        fireCallbacks("allDagChanges",0,MDagPath(node),MDagPath(parent))
+
+    def addNode(self,nodeType,name,parent = None):
+        node = self.createNode(nodeType,name,parent)
+        fireCallbacks("nodeAdded",MObject(node))
+        return node
+
+    def deleteNode(self,node):
+        for child in list(node.children):
+            self.deleteNode(child)
+
+        fireCallbacks("nodeRemoved",MObject(node))
+        node.alive = False
+        if node.parent != None:
+            node.parent.children.remove(node)
+
+    def __len__(self):
+        return len(self.nodes)
+
+CAMERASHAPEATTRS = {
+                        "focalLength":              35.0,
+                        "horizontalFilmAperture":   1.417,
+                        "verticalFilmAperture":     0.945,
+                        "horizontalFilmOffset":     0.0,
+                        "verticalFilmOffset":       0.0,
+                        "filmFit":                  1,
+                        "lensSqueezeRatio":         1.0,
+                        "cameraScale":              1.0,
+                        "nearClipPlane":            0.1,
+                        "farClipPlane":             10000.0,
+                        "orthographic":             False,
+                        "orthographicWidth":        30.0,
+                        "displayResolution":        False,
+                        "overscan":                 1.0
+}
+
+def createCamera(scene,name,isDefault = False,orthographic = False,translate = (0.0,0.0,0.0)):
+    transform = scene.createNode("transform",name,isDefault = isDefault,attrs = {"translate":list(translate)})
+    shapeAttrs = dict(CAMERASHAPEATTRS)
+    shapeAttrs["orthographic"] = orthographic
+    scene.createNode("camera",name + "Shape",parent = transform,isDefault = isDefault,attrs = shapeAttrs)
+    return transform
+
+def createAnimCurve(scene,name,keyCount,offset = 0.0):
+    curve = scene.createNode("animCurveTL",name)
+    for i in range(0,keyCount):
+        curve.keys.append({
+                            "time":     float(1 + i * 5),
+                            "value":    float(i) + offset,
+                            "inTangent":2,
+                            "outTangent":2
+        })
+    return curve
+
+def buildScene(nodeCount,cameraCount,keysPerCurve = 24,enableRatio = 0.75):
+    scene = FakeScene()
+
+    scene.createNode("time","time1",isDefault = True)
+    scene.createNode("resolution","defaultResolution",isDefault = True,attrs = {"width":1920,"height":1080})
+
+    for name,orthographic in [("persp",False),("top",True),("front",True),("side",True)]:
+        createCamera(scene,name,isDefault = True,orthographic = orthographic)
+
+    rootSet = scene.createNode("objectSet","cameraInfoSets")
+
+    for i in range(0,cameraCount):
+        cameraName = "shot_cam" + str(i +1).zfill(3)
+        createCamera(scene,cameraName,translate = (float(i),0.0,10.0))
+
+        infoSet = scene.createNode("objectSet",cameraName + "_infoSet",attrs = {
+                                                                                "startFrame":   float(1 + i * 24),
+                                                                                "endFrame":     float(24 + i * 24),
+                                                                                "playblast":    i < int(cameraCount * enableRatio) or cameraCount == 1
+        })
+        rootSet.members.append(infoSet)
+
+        for axis in ["X","Y","Z"]:
+            createAnimCurve(scene,cameraName + "_translate" + axis,keysPerCurve,offset = float(i))
+
+    locatorCount = 0
+    group = None
+    while len(scene) < nodeCount:
+        if locatorCount % 100 == 0:
+            group = scene.createNode("transform","grp" + str(locatorCount // 100 +1))
+
+        locatorCount += 1
+        name = "loc" + str(locatorCount)
+        if (locatorCount // 100) % 4 == 3:
+            name = "char" + str(locatorCount // 100) + ":" + name
+
+        transform = scene.createNode("transform",name,parent = group)
+        if len(scene) < nodeCount:
+            scene.createNode("locator",name + "Shape",parent = transform)
+
+    return scene
+
+_scene = FakeScene()
+
+def setScene(scene):
+    global _scene
+    _scene = scene
+
+def getScene():
+    return _scene
+
+## fires the same messages as cmds.file(open =True), every node of the new scene is announced one by one
+def openScene(scene):
+    fireSceneMessage(MSceneMessage.kBeforeOpen)
+    setScene(scene)
+    for node in scene.nodes:
+        fireCallbacks("nodeAdded",MObject(node))
+
+    fireSceneMessage(MSceneMessage.kAfterOpen)
+
+##--------------------------------------------------------
+## MARK: cmds
+##--------------------------------------------------------
+def nodeType(target,inherited = False,isTypeName = False,**kwargs):
+    if isTypeName:
+        typeNames = TYPEHIERARCHY.get(target,[target])
+    else:
+        node = _scene.findNode(target)
+        if node == None:
+            raise RuntimeError("No object matches name: " + target)
+        typeNames = TYPEHIERARCHY[node.nodeType]
+
+    if inherited:
+        return list(typeNames)
+
+    return typeNames[-1]
+
+def objExists(target):
+    if "." in target:
+        return _scene.findPlug(target)[0] != None
+
+    return _scene.findNode(target) != None
+
+def getAttr(plugName,**kwargs):
+    node,attrName = _scene.findPlug(plugName)
+    if node == None:
+        raise ValueError("No object matches name: " + plugName)
+
+    return node.attrs[attrName]
+
+def setAttr(plugName,value,**kwargs):
+    node,attrName = _scene.findPlug(plugName)
+    if node == None:
+        raise RuntimeError("No object matches name: " + plugName)
+
+    node.attrs[attrName] = value
+
+def addAttr(target,at = None,ln = None,dv = None,**kwargs):
+    _scene.findNode(target).attrs[ln] = dv
+
+def sets(*targets,**kwargs):
+    if "name" in kwargs:
+        _scene.createNode("objectSet",kwargs["name"])
+        return kwargs["name"]
+
+    if "forceElement" in kwargs:
+        objectSet = _scene.findNode(kwargs["forceElement"])
+        for target in targets:
+            member = _scene.findNode(target)
+            if member not in objectSet.members:
+                objectSet.members.append(member)
+
+def listRelatives(target,p = False,f = False,**kwargs):
+    node = _scene.findNode(target)
+    if node == None or p == False or node.parent == None:
+        return None
+
+    if f:
+        return [node.parent.fullPathName()]
+
+    return [node.parent.name]
+
+def ls(*args,**kwargs):
+    nodes = [node for node in _scene.nodes if node.alive]
+
+    if kwargs.get("type") != None:
+        nodes = [node for node in nodes if kwargs["type"] in TYPEHIERARCHY[node.nodeType]]
+
+    if kwargs.get("defaultNodes"):
+        nodes = [node for node in nodes if node.isDefault]
+
+    if kwargs.get("shapes"):
+        nodes = [node for node in nodes if MFn.kShape in node.fnTypes]
+
+    if kwargs.get("long") or kwargs.get("l"):
+        names = [node.fullPathName() for node in nodes]
+    else:
+        names = [node.name for node in nodes]
+
+    if kwargs.get("showType"):
+        nodeInfo = []
+        for i in range(0,len(nodes)):
+            nodeInfo.extend([names[i],nodes[i].nodeType])
+
+        return nodeInfo
+
+    return names
+
+def file(*args,**kwargs):
+    if kwargs.get("sn") or kwargs.get("sceneName"):
+        return _scene.scenePath
+
+    if kwargs.get("reference"):
+        return []
+
+    if kwargs.get("modified"):
+        return False
+
+def playbackOptions(**kwargs):
+    if kwargs.get("animationStartTime") or kwargs.get("minTime"):
+        return _scene.playbackRange[0]
+
+    return _scene.playbackRange[1]
+
+def undoInfo(**kwargs):
+    pass
+
+def about(**kwargs):
+    if kwargs.get("batch"):
+        return _ui.batch
+
+    return "fakeMaya"
+
+def internalVar(**kwargs):
+    return tempfile.gettempdir().replace("\\","/") + "/"
+
+##--------------------------------------------------------
+## MARK: ui
+##--------------------------------------------------------
+class FakeUI(object):
+    def __init__(self):
+        self.windows = {}
+        self.editors = {}
+        self.curWindow = None
+        self.curTime = 1.0
+        self.playblasts = []
+        self.editorCount = 0
+        self.batch = False
+        self.lookThruCamera = None
+
+_ui = FakeUI()
+
+def getUI():
+    return _ui
+
+def resetUI():
+    global _ui
+    _ui = FakeUI()
+    return _ui
+
+def window(name = None,q = False,ex = False,**kwargs):
+    if q:
+        return name in _ui.windows
+
+    if _ui.batch:
+        raise RuntimeError("window is not available in batch mode")
+
+    if name == None or name in _ui.windows:
+        name = "window" + str(len(_ui.windows) +1)
+
+    _ui.windows[name] = []
+    _ui.curWindow = name
+    return name
+
+def formLayout(*args,**kwargs):
+    return "formLayout1"
+
+def showWindow(name):
+    pass
+
+def deleteUI(name):
+    if name not in _ui.windows:
+        raise RuntimeError("Object '" + name + "' not found.")
+
+    for editor in _ui.windows.pop(name):
+        del _ui.editors[editor]
+
+def modelEditor(panel = None,edit = False,camera = None,**kwargs):
+    if edit:
+        if panel not in _ui.editors:
+            raise RuntimeError("editor deleted: " + panel)
+
+        if camera != None:
+            _ui.editors[panel]["camera"] = camera
+
+        return panel
+
+    _ui.editorCount += 1
+    panel = "modelEditor" + str(_ui.editorCount)
+    _ui.editors[panel] = {"window":_ui.curWindow,"camera":None}
+    _ui.windows[_ui.curWindow].append(panel)
+    return panel
+
+def lookThru(camera,**kwargs):
+    if _ui.batch == False:
+        raise RuntimeError("lookThru without a panel")
+
+    _ui.lookThruCamera = camera
+
+def isolateSelect(panel,**kwargs):
+    pass
+
+def select(*args,**kwargs):
+    pass
+
+def currentTime(*args,**kwargs):
+    if kwargs.get("q") or kwargs.get("query"):
+        return _ui.curTime
+
+    _ui.curTime = float(args[0])
+
+def playblast(editorPanelName = None,frame = None,**kwargs):
+    if _ui.batch:
+        if editorPanelName != None or _ui.windows:
+            raise RuntimeError("no editors in batch mode")
+
+        camera = _ui.lookThruCamera
+
+    elif editorPanelName not in _ui.editors:
+        raise RuntimeError("editor deleted: " + str(editorPanelName))
+
+    else:
+        camera = _ui.editors[editorPanelName]["camera"]
+
+    frames = frame or [_ui.curTime]
+    for blastFrame in frames:
+        _ui.playblasts.append((camera,float(blastFrame),kwargs.get("filename")))
+
+##--------------------------------------------------------
+## MARK: om2
+##--------------------------------------------------------
+class MObject(object):
+    kNullObj = None
+
+    def __init__(self,node = None):
+        self.node = node
+
+    def hasFn(self,fnType):
+        return fnType in self.node.fnTypes
+
+    def isNull(self):
+        return self.node == None
+
+    def __eq__(self,other):
+        return isinstance(other,MObject) and self.node is other.node
+
+    def __ne__(self,other):
+        return not self.__eq__(other)
+
+MObject.kNullObj = MObject()
+
+class MObjectHandle(object):
+    def __init__(self,obj):
+        self.obj = obj
+
+    def isValid(self):
+        return self.obj.node != None and self.obj.node.alive
+
+    def hashCode(self):
+        return self.obj.node.nodeId
+
+    def object(self):
+        return self.obj
+
+class MValue(object):
+    def __init__(self,value):
+        self.value = value
+
+class MMatrix(object):
+    def __init__(self,translate):
+        self.translate = translate
+
+    def getElement(self,row,column):
+        if row == 3 and column < 3:
+            return self.translate[column]
+
+        if row == column:
+            return 1.0
+
+        return 0.0
+
+class MDagPath(object):
+    def __init__(self,node = None):
+        if isinstance(node,MDagPath):
+            node = node.dagNode
+
+        self.dagNode = node
+
+    @staticmethod
+    def getAPathTo(obj):
+        return MDagPath(obj.node)
+
+    def fullPathName(self):
+        return self.dagNode.fullPathName()
+
+    def partialPathName(self):
+        return self.dagNode.name
+
+    def pop(self):
+        self.dagNode = self.dagNode.parent
+
+    def length(self):
+        length = 0
+        node = self.dagNode
+        while node != None:
+            length += 1
+            node = node.parent
+
+        return length
+
+    def extendToShape(self):
+        for child in self.dagNode.children:
+            if MFn.kShape in child.fnTypes:
+                self.dagNode = child
+                return
+
+        raise RuntimeError("no shape below: " + self.dagNode.name)
+
+    def node(self):
+        return MObject(self.dagNode)
+
+    def inclusiveMatrix(self):
+        translate = [0.0,0.0,0.0]
+        node = self.dagNode
+        while node != None:
+            for i in range(0,3):
+                translate[i] += node.attrs.get("translate",[0.0,0.0,0.0])[i]
+            node = node.parent
+
+        return MMatrix(translate)
+
+class MSelectionList(object):
+    def __init__(self):
+        self.items = []
+        self.itemIds = set()
+
+    def add(self,target):
+        node = target if isinstance(target,FakeNode) else _scene.findNode(target)
+        if node == None:
+            raise RuntimeError("(kInvalidParameter): Object does not exist")
+
+        if node.nodeId not in self.itemIds:
+            self.itemIds.add(node.nodeId)
+            self.items.append(node)
+
+        return self
+
+    def length(self):
+        return len(self.items)
+
+    def getDependNode(self,index):
+        return MObject(self.items[index])
+
+    def getDagPath(self,index):
+        if self.items[index].isDag() == False:
+            raise TypeError("item is not a DAG path")
+
+        return MDagPath(self.items[index])
+
+class MPlug(object):
+    isChild = False
+    isDestination = False
+
+    def __init__(self,node,attrName):
+        self.node = node
+        self.attrName = attrName
+
+    def asBool(self):
+        return bool(self.node.attrs[self.attrName])
+
+    def asInt(self):
+        return int(self.node.attrs[self.attrName])
+
+    def asDouble(self):
+        return float(self.node.attrs[self.attrName])
+
+class MFnDependencyNode(object):
+    def __init__(self,obj):
+        self.fnNode = obj.node
+
+    def name(self):
+        return self.fnNode.name
+
+    @property
+    def typeName(self):
+        return self.fnNode.nodeType
+
+    @property
+    def isDefaultNode(self):
+        return self.fnNode.isDefault
+
+    def hasAttribute(self,attrName):
+        return attrName in self.fnNode.attrs
+
+    def findPlug(self,attrName,wantNetworkedPlug):
+        if attrName not in self.fnNode.attrs:
+            raise RuntimeError("(kInvalidParameter): No element at given index")
+
+        return MPlug(self.fnNode,attrName)
+
+class MFnDagNode(MFnDependencyNode):
+    def parentCount(self):
+        return 1 if self.fnNode.parent != None else 0
+
+    def parent(self,index):
+        return MObject(self.fnNode.parent)
+
+    def fullPathName(self):
+        return self.fnNode.fullPathName()
+
+class MFnSet(MFnDependencyNode):
+    def getMembers(self,flatten):
+        members = MSelectionList()
+        for member in self.fnNode.members:
+            if member.alive:
+                members.add(member)
+
+        return members
+
+class MFnAnimCurve(MFnDependencyNode):
+    isUnitlessInput = False
+    preInfinityType = 0
+    postInfinityType = 0
+
+    @property
+    def numKeys(self):
+        return len(self.fnNode.keys)
+
+    def input(self,index):
+        return MValue(self.fnNode.keys[index]["time"])
+
+    def unitlessInput(self,index):
+        return self.fnNode.keys[index]["time"]
+
+    def value(self,index):
+        return self.fnNode.keys[index]["value"]
+
+    def inTangentType(self,index):
+        return self.fnNode.keys[index]["inTangent"]
+
+    def outTangentType(self,index):
+        return self.fnNode.keys[index]["outTangent"]
+
+    def getTangentAngleWeight(self,index,isInTangent):
+        return MValue(0.0),1.0
+
+class MItDependencyNodes(object):
+    def __init__(self,filterType = None):
+        self.nodes = [node for node in _scene.nodes if node.alive and (filterType == None or filterType in node.fnTypes)]
+        self.index = 0
+
+    def isDone(self):
+        return self.index >= len(self.nodes)
+
+    def thisNode(self):
+        return MObject(self.nodes[self.index])
+
+    def next(self):
+        self.index += 1
+
+class FakeCallbackIds(object):
+    nextId = 0
+    callbacks = {}
+
+    @classmethod
+    def add(cls,*args,**kwargs):
+        cls.nextId += 1
+        return cls.nextId
+
+    @classmethod
+    def register(cls,kind,func,nodeType = None):
+        cls.nextId += 1
+        cls.callbacks[cls.nextId] = (kind,func,nodeType)
+        return cls.nextId
+
+def fireCallbacks(kind,*args):
+    for callbackKind,func,nodeType in list(FakeCallbackIds.callbacks.values()):
+        if callbackKind != kind:
+            continue
+
+        if nodeType not in [None,"dependNode"] and nodeType not in TYPEHIERARCHY[args[0].node.nodeType]:
+            continue
+
+        func(*args)
+
+class MMessage(object):
+    @staticmethod
+    def removeCallbacks(callbackIds):
+        for callbackId in callbackIds:
+            FakeCallbackIds.callbacks.pop(callbackId,None)
+
+class MDGMessage(object):
+    @staticmethod
+    def addNodeAddedCallback(func,nodeType = "dependNode",*args):
+        return FakeCallbackIds.register("nodeAdded",func,nodeType)
+
+    @staticmethod
+    def addNodeRemovedCallback(func,nodeType = "dependNode",*args):
+        return FakeCallbackIds.register("nodeRemoved",func,nodeType)
+
+class MNodeMessage(object):
+    addAttributeChangedCallback = FakeCallbackIds.add
+
+    @staticmethod
+    def addNameChangedCallback(node,func,*args):
+        return FakeCallbackIds.register("nameChanged",func)
+
+class MDagMessage(object):
+    @staticmethod
+    def addAllDagChangesCallback(func,*args):
+        return FakeCallbackIds.register("allDagChanges",func)
+
+class MSceneMessage(object):
+    kAfterOpen = 0
+    kAfterNew = 1
+    kBeforeOpen = 2
+    kBeforeNew = 3
+    kBeforeImport = 4
+    kAfterImport = 5
+    kBeforeCreateReference = 6
+    kAfterCreateReference = 7
+    kBeforeLoadReference = 8
+    kAfterLoadReference = 9
+    kBeforeUnloadReference = 10
+    kAfterUnloadReference = 11
+    kBeforeRemoveReference = 12
+    kAfterRemoveReference = 13
+
+    @staticmethod
+    def addCallback(message,func,*args):
+        return FakeCallbackIds.register("scene" + str(message),func)
+
+def fireSceneMessage(message):
+    fireCallbacks("scene" + str(message))
+
+class MEventMessage(object):
+    addEventCallback = FakeCallbackIds.add
+
+##--------------------------------------------------------
+## MARK: install
+##--------------------------------------------------------
+class PlaceholderType(type):
+    def __getattr__(cls,name):
+        return Placeholder
+
+class Placeholder(PlaceholderType("PlaceholderBase",(object,),{})):
+    def __init__(self,*args,**kwargs):
+        pass
+
+    def __call__(self,*args,**kwargs):
+        return Placeholder()
+
+    def __getattr__(self,name):
+        return Placeholder()
+
+class PlaceholderModule(types.ModuleType):
+    def __getattr__(self,name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        return Placeholder
+
+CMDSFUNCTIONS = [
+                    nodeType,objExists,getAttr,setAttr,addAttr,sets,listRelatives,ls,file,playbackOptions,undoInfo,about,internalVar,
+                    window,formLayout,showWindow,deleteUI,modelEditor,lookThru,isolateSelect,select,currentTime,playblast
+]
+OM2CLASSES = [
+                MFn,MObject,MObjectHandle,MDagPath,MSelectionList,MPlug,
+                MFnDependencyNode,MFnDagNode,MFnSet,MFnAnimCurve,MItDependencyNodes,
+                MMessage,MDGMessage,MNodeMessage,MDagMessage,MSceneMessage,MEventMessage
+]
+
+_deferred = []
+
+def executeDeferred(func,*args):
+    _deferred.append((func,args))
+
+def runDeferred():
+    while len(_deferred) > 0:
+        func,args = _deferred.pop(0)
+        func(*args)
+
+def hasQt():
+    for moduleName in ["PySide2","PySide6"]:
+        try:
+            __import__(moduleName + ".QtWidgets")
+            return True
+        except ImportError:
+            pass
+
+    return False
+
+def install(qt = True):
+    modules = {}
+    for moduleName in ["maya","maya.cmds","maya.api","maya.api.OpenMaya","maya.api.OpenMayaUI","maya.OpenMayaUI","maya.mel","maya.utils"]:
+        modules[moduleName] = PlaceholderModule(moduleName)
+
+    for func in CMDSFUNCTIONS:
+        setattr(modules["maya.cmds"],func.__name__,func)
+
+    for cls in OM2CLASSES:
+        setattr(modules["maya.api.OpenMaya"],cls.__name__,cls)
+
+    modules["maya"].cmds = modules["maya.cmds"]
+    modules["maya"].api = modules["maya.api"]
+    modules["maya"].mel = modules["maya.mel"]
+    modules["maya"].utils = modules["maya.utils"]
+    modules["maya.utils"].executeDeferred = executeDeferred
+    modules["maya"].OpenMayaUI = modules["maya.OpenMayaUI"]
+    modules["maya.api"].OpenMaya = modules["maya.api.OpenMaya"]
+    modules["maya.api"].OpenMayaUI = modules["maya.api.OpenMayaUI"]
+
+    if qt and hasQt() == False:
+        for moduleName in ["PySide2","PySide2.QtWidgets","PySide2.QtGui","PySide2.QtCore"]:
+            modules[moduleName] = PlaceholderModule(moduleName)
+
+        modules["PySide2"].QtWidgets = modules["PySide2.QtWidgets"]
+        modules["PySide2"].QtGui = modules["PySide2.QtGui"]
+        modules["PySide2"].QtCore = modules["PySide2.QtCore"]
+
+    sys.modules.update(modules)
@@ -0,0 +1,86 @@
+## python -m pytest tests
+## chunking and movie assembly, runs against the fake ffmpeg in benchmarks/
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+TESTDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0,os.path.dirname(TESTDIR))
+sys.path.insert(0,os.path.join(os.path.dirname(TESTDIR),"benchmarks"))
+
+import fakeFfmpeg
+import SSCameraSwitcherWorker
+
+class SplitFrameRangeTest(unittest.TestCase):
+    def test_unevenDivision(self):
+        self.assertEqual(SSCameraSwitcherWorker.splitFrameRange(1,10,4),[[1,4],[5,8],[9,10]])
+        self.assertEqual(SSCameraSwitcherWorker.splitFrameRange(101.0,107.0,3),[[101,103],[104,106],[107,107]])
+
+    def test_evenDivision(self):
+        self.assertEqual(SSCameraSwitcherWorker.splitFrameRange(1,8,4),[[1,4],[5,8]])
+
+    def test_singleFrame(self):
+        self.assertEqual(SSCameraSwitcherWorker.splitFrameRange(5,5,4),[[5,5]])
+        self.assertEqual(SSCameraSwitcherWorker.splitFrameRange(5,5,1),[[5,5]])
+
+    def test_chunkLargerThanRange(self):
+        self.assertEqual(SSCameraSwitcherWorker.splitFrameRange(1,3,10),[[1,3]])
+        self.assertEqual(SSCameraSwitcherWorker.splitFrameRange(1,10,10),[[1,10]])
+
+    def test_noChunkSize(self):
+        self.assertEqual(SSCameraSwitcherWorker.splitFrameRange(1,10,0),[[1,10]])
+
+class ChunkPlayblastJobsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpDir = tempfile.mkdtemp()
+        self.jobs = [
+                        {"camera":"camA","outputPath":self.tmpDir + "/camA","timeRange":[1,10]},
+                        {"camera":"camB","outputPath":self.tmpDir + "/camB","timeRange":[20,22]}
+        ]
+
+    def tearDown(self):
+        fakeFfmpeg.uninstall()
+        shutil.rmtree(self.tmpDir)
+
+    def test_shortJobIsNotChunked(self):
+        tasks = SSCameraSwitcherWorker.chunkPlayblastJobs(self.jobs,4,"avi")
+
+        self.assertEqual(len(tasks),4)
+        self.assertEqual(tasks[-1],self.jobs[1])
+
+    def test_movieChunks(self):
+        tasks = SSCameraSwitcherWorker.chunkPlayblastJobs(self.jobs,4,"avi")[:3]
+
+        self.assertEqual([task["timeRange"] for task in tasks],[[1,4],[5,8],[9,10]])
+        self.assertEqual([task["sequenceStart"] for task in tasks],[1,5,9])
+        self.assertEqual([task["chunk"]["index"] for task in tasks],[0,1,2])
+        self.assertEqual([os.path.basename(task["outputPath"]) for task in tasks],["camA_chunk0001","camA_chunk0002","camA_chunk0003"])
+        self.assertEqual(set(task["chunk"]["outputPath"] for task in tasks),set([self.jobs[0]["outputPath"]]))
+
+    def test_imageChunksShareOutput(self):
+        tasks = SSCameraSwitcherWorker.chunkPlayblastJobs(self.jobs,4)[:3]
+
+        self.assertEqual([task["outputPath"] for task in tasks],[self.jobs[0]["outputPath"]] * 3)
+        self.assertEqual(SSCameraSwitcherWorker.groupChunkedTasks(tasks),{})
+
+    @unittest.skipIf(os.name == "nt","fake ffmpeg wrapper is a shell script")
+    def test_concatListOrder(self):
+        fakeFfmpeg.install(self.tmpDir)
+        tasks = SSCameraSwitcherWorker.chunkPlayblastJobs(self.jobs,3,"avi")
+        tasks = [tasks[2],tasks[0],tasks[4],tasks[3],tasks[1]]
+        results = dict([(taskIndex,{"status":"done"}) for taskIndex in range(0,len(tasks))])
+
+        assembled = SSCameraSwitcherWorker.assembleChunkedTasks(tasks,results)
+        self.assertEqual(assembled,{self.jobs[0]["outputPath"]:True})
+
+        with open(self.jobs[0]["outputPath"] + ".avi","r") as f:
+            lines = f.read().splitlines()
+
+        chunkPaths = [os.path.abspath(self.tmpDir + "/camA_chunk" + str(i).zfill(4) + ".avi").replace("\\","/") for i in range(1,5)]
+        self.assertEqual(lines,["file '" + chunkPath + "'" for chunkPath in chunkPaths])
+        self.assertFalse(os.path.isfile(self.jobs[0]["outputPath"] + ".avi.chunks.txt"))
+
+if __name__ == "__main__":
+    unittest.main()
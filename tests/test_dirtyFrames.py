@@ -0,0 +1,92 @@
+## python -m pytest tests
+## runs against the in-memory fake maya backend, no maya session needed
+import os
+import sys
+import unittest
+
+TESTDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0,os.path.dirname(TESTDIR))
+sys.path.insert(0,os.path.join(os.path.dirname(TESTDIR),"benchmarks"))
+
+import fakeMaya
+fakeMaya.install(qt = False)
+
+import SSCameraSwitcherCore
+
+TIMERANGE = [1,30]
+
+class DirtyFramesTest(unittest.TestCase):
+    def setUp(self):
+        self.scene = fakeMaya.FakeScene()
+        fakeMaya.setScene(self.scene)
+
+        ## keys at 1,6,11,16,21,26
+        self.curve = fakeMaya.createAnimCurve(self.scene,"cam_translateX",6)
+        self.oldCurveKeys = SSCameraSwitcherCore.readAnimCurveKeys()
+
+    def getKey(self,keyTime):
+        return [key for key in self.curve.keys if key["time"] == keyTime][0]
+
+    def getDirtyFrames(self,timeRange = TIMERANGE):
+        return SSCameraSwitcherCore.getDirtyFrames(self.oldCurveKeys,SSCameraSwitcherCore.readAnimCurveKeys(),timeRange)
+
+    def test_unchanged(self):
+        self.assertEqual(self.getDirtyFrames(),set())
+
+    def test_movedKey(self):
+        self.getKey(11.0)["time"] = 13.0
+        self.assertEqual(self.getDirtyFrames(),set(range(7,16)))
+
+    def test_changedValue(self):
+        self.getKey(16.0)["value"] = 100.0
+        self.assertEqual(self.getDirtyFrames(),set(range(12,21)))
+
+    def test_addedKey(self):
+        self.curve.keys.insert(4,{"time":18.0,"value":0.0,"inTangent":2,"outTangent":2})
+        self.assertEqual(self.getDirtyFrames(),set(range(17,21)))
+
+    def test_deletedKey(self):
+        self.curve.keys.remove(self.getKey(11.0))
+        self.assertEqual(self.getDirtyFrames(),set(range(7,16)))
+
+    def test_changedTangent(self):
+        self.getKey(21.0)["outTangent"] = 18
+        self.assertEqual(self.getDirtyFrames(),set(range(17,26)))
+
+    def test_firstAndLastKey(self):
+        self.getKey(1.0)["value"] = 100.0
+        self.getKey(26.0)["value"] = 100.0
+        self.assertEqual(self.getDirtyFrames(),set(range(1,6)) | set(range(22,31)))
+
+    def test_curveAdded(self):
+        fakeMaya.createAnimCurve(self.scene,"cam_translateY",6)
+        self.assertEqual(self.getDirtyFrames(),set(range(1,31)))
+
+    def test_curveRemoved(self):
+        self.curve.alive = False
+        self.assertEqual(self.getDirtyFrames(),set(range(1,31)))
+
+    def test_changeOutsideRange(self):
+        self.getKey(21.0)["value"] = 100.0
+        self.assertEqual(self.getDirtyFrames([1,15]),set())
+        self.assertEqual(self.getDirtyFrames([27,40]),set())
+
+    def test_cycledCurve(self):
+        newCurveKeys = SSCameraSwitcherCore.readAnimCurveKeys()
+        for curveKeys in [self.oldCurveKeys,newCurveKeys]:
+            curveKeys["cam_translateX"]["infinity"] = [3,3]
+
+        self.assertEqual(SSCameraSwitcherCore.getDirtyFrames(self.oldCurveKeys,newCurveKeys,TIMERANGE),set())
+
+        newCurveKeys["cam_translateX"]["keys"][2][1] = "0" * 16
+        self.assertEqual(SSCameraSwitcherCore.getDirtyFrames(self.oldCurveKeys,newCurveKeys,TIMERANGE),set(range(1,31)))
+
+    def test_unitlessCurve(self):
+        oldCurve = {"timeInput":False,"infinity":[0,0],"keys":[[0.0,"a"],[1.0,"b"]]}
+        newCurve = {"timeInput":False,"infinity":[0,0],"keys":[[0.0,"a"],[1.0,"c"]]}
+
+        self.assertEqual(SSCameraSwitcherCore.getCurveDirtyIntervals(oldCurve,dict(oldCurve)),[])
+        self.assertEqual(SSCameraSwitcherCore.getCurveDirtyIntervals(oldCurve,newCurve),None)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+## python -m pytest tests
+## runs against the in-memory fake maya backend, no maya session needed
+import os
+import sys
+import unittest
+
+TESTDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0,os.path.dirname(TESTDIR))
+sys.path.insert(0,os.path.join(os.path.dirname(TESTDIR),"benchmarks"))
+
+import fakeMaya
+fakeMaya.install(qt = False)
+
+import SSCameraSwitcherCore
+
+VIEWITEMOPTION = {"headsUpDisplay":False,"polymeshes":True}
+
+class FakeViewState(object):
+    def prepare(self,camera,showHUDs,headsUpDisplay):
+        pass
+
+    def restore(self):
+        pass
+
+class MultiCameraPlayBlastTest(unittest.TestCase):
+    def setUp(self):
+        self.ui = fakeMaya.resetUI()
+
+    def runJobs(self,timeRanges):
+        jobs = []
+        for camera in sorted(timeRanges):
+            jobs.append({"camera":camera,"outputPath":"/tmp/" + camera,"timeRange":timeRanges[camera]})
+
+        SSCameraSwitcherCore.multiCameraPlayBlast(jobs,VIEWITEMOPTION,{},"png",[640,360],False,viewState = FakeViewState())
+
+    def getBlastedFrames(self):
+        blastedFrames = {}
+        for camera,frame,fileName in self.ui.playblasts:
+            blastedFrames.setdefault(camera,[]).append(frame)
+
+        return blastedFrames
+
+    def test_overlappingCameras(self):
+        self.runJobs({"camA":[1,10],"camB":[5,15]})
+
+        blastedFrames = self.getBlastedFrames()
+        self.assertEqual(blastedFrames["camA"],[float(frame) for frame in range(1,11)])
+        self.assertEqual(blastedFrames["camB"],[float(frame) for frame in range(5,16)])
+
+    def test_panelsAreClosed(self):
+        self.runJobs({"camA":[1,10],"camB":[5,15],"camC":[12,20]})
+
+        self.assertEqual(self.ui.windows,{})
+        self.assertEqual(self.ui.editors,{})
+        self.assertEqual(self.ui.curTime,1.0)
+
+    def test_keepsUnownedWindow(self):
+        fakeMaya.window("playblastTmp")
+        self.runJobs({"camA":[1,3],"camB":[2,4]})
+
+        self.assertEqual(list(self.ui.windows),["playblastTmp"])
+
+    def test_batchModeUsesNoWindow(self):
+        self.ui.batch = True
+        self.runJobs({"camA":[1,10],"camB":[5,15]})
+
+        blastedFrames = self.getBlastedFrames()
+        self.assertEqual(blastedFrames["camA"],[float(frame) for frame in range(1,11)])
+        self.assertEqual(blastedFrames["camB"],[float(frame) for frame in range(5,16)])
+        self.assertEqual(self.ui.windows,{})
+
+if __name__ == "__main__":
+    unittest.main()
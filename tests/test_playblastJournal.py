@@ -0,0 +1,109 @@
+## python -m pytest tests
+## runs against the in-memory fake maya backend, no maya session needed
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+TESTDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0,os.path.dirname(TESTDIR))
+sys.path.insert(0,os.path.join(os.path.dirname(TESTDIR),"benchmarks"))
+
+import fakeMaya
+fakeMaya.install(qt = False)
+
+import SSCameraSwitcherCore
+import SSCameraSwitcherWorker
+
+class FakeTime(object):
+    def __init__(self,value):
+        self.value = value
+
+class PlayblastJournalTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpDir = tempfile.mkdtemp()
+        self.journalPath = os.path.join(self.tmpDir,"journal.jsonl")
+        self.journal = SSCameraSwitcherWorker.JsonLinesJournal(self.journalPath)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpDir)
+
+    def getOutputPath(self,camera):
+        return self.tmpDir + "/" + camera
+
+    def start(self,frameNumberOffset = False,resume = False):
+        self.journal.append({"event":"start","resume":resume,"outputFormat":"png","frameNumberOffset":frameNumberOffset})
+
+    def plan(self,camera,timeRange):
+        self.journal.append({"event":"plan","camera":camera,"outputPath":self.getOutputPath(camera),"timeRange":timeRange})
+
+    def frames(self,camera,frames,timeOffset = 0):
+        for frame in frames:
+            SSCameraSwitcherCore.journalFrame(self.journal,camera,timeOffset,FakeTime(frame),None)
+
+    def result(self,camera,status):
+        self.journal.append({"event":"result","camera":camera,"outputPath":self.getOutputPath(camera),"status":status})
+
+    def writeFiles(self,camera,frames):
+        for frame in frames:
+            open(SSCameraSwitcherCore.getOutputFramePath(self.getOutputPath(camera),"png",frame),"w").close()
+
+    def readFrameRanges(self):
+        settings,jobs = SSCameraSwitcherCore.readResumeState(self.journalPath)
+        return dict([(job["camera"],job["frameRanges"]) for job in jobs])
+
+    def test_groupFrameRanges(self):
+        self.assertEqual(SSCameraSwitcherCore.groupFrameRanges([5,1,2,3,7,8,2]),[[1,3],[5,5],[7,8]])
+        self.assertEqual(SSCameraSwitcherCore.groupFrameRanges([]),[])
+
+    def test_noJournal(self):
+        self.assertEqual(SSCameraSwitcherCore.readResumeState(self.journalPath),(None,[]))
+
+    def test_cameraStates(self):
+        self.start()
+        for camera in ["camDone","camFailed","camPartial"]:
+            self.plan(camera,[1,10])
+
+        self.frames("camDone",range(1,11))
+        self.writeFiles("camDone",range(1,11))
+        self.result("camDone","done")
+
+        self.frames("camFailed",range(1,4))
+        self.result("camFailed","failed")
+
+        self.frames("camPartial",range(1,6))
+        self.writeFiles("camPartial",range(1,6))
+
+        self.assertEqual(self.readFrameRanges(),{"camFailed":[[1,10]],"camPartial":[[5,10]]})
+
+    def test_resumedCameras(self):
+        self.start()
+        for camera in ["camA","camB"]:
+            self.plan(camera,[1,10])
+
+        self.frames("camA",range(1,4))
+        self.writeFiles("camA",range(1,4))
+
+        self.start(resume = True)
+        self.frames("camA",range(3,11))
+        self.writeFiles("camA",range(3,11))
+        self.result("camA","done")
+
+        self.frames("camB",range(1,9))
+        self.writeFiles("camB",range(1,9))
+
+        self.assertEqual(self.readFrameRanges(),{"camB":[[8,10]]})
+
+    def test_sequenceTimeFrames(self):
+        self.start(frameNumberOffset = True)
+        self.plan("camA",[101,110])
+
+        self.frames("camA",range(1,5),timeOffset = 100)
+        for frame in range(1,5):
+            open(SSCameraSwitcherCore.getOutputFramePath(self.getOutputPath("camA"),"png",frame),"w").close()
+
+        self.assertEqual(self.readFrameRanges(),{"camA":[[104,110]]})
+
+if __name__ == "__main__":
+    unittest.main()
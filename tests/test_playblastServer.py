@@ -0,0 +1,87 @@
+## python -m pytest tests
+## JSON-lines round trip between PlayblastServerClient and the fake backend, no maya needed
+import os
+import sys
+import threading
+import unittest
+
+TESTDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0,os.path.dirname(TESTDIR))
+
+import SSCameraSwitcherServer
+
+class PlayblastServerTest(unittest.TestCase):
+    def setUp(self):
+        backend = SSCameraSwitcherServer.FakeServerBackend(secondsPerFrame = 0.001,failCameras = ["camC"])
+        self.server = SSCameraSwitcherServer.PlayblastServer(backend,port = 0)
+        self.thread = threading.Thread(target = self.server.run)
+        self.thread.daemon = True
+        self.thread.start()
+
+        host,port = self.server.getAddress()
+        self.client = SSCameraSwitcherServer.PlayblastServerClient(host,port,timeout = 10)
+
+    def tearDown(self):
+        self.client.shutdown()
+        self.thread.join(10)
+        self.assertFalse(self.thread.is_alive())
+
+    def test_ping(self):
+        self.assertEqual(self.client.ping(),{"version":SSCameraSwitcherServer.PROTOCOLVERSION,"backend":"FakeServerBackend"})
+
+    def test_openScene(self):
+        result = self.client.openScene("C:\\shots\\sh010.ma")
+        self.assertEqual(result["scene"],"C:/shots/sh010.ma")
+        self.assertFalse(result["reused"])
+
+        self.assertTrue(self.client.openScene("C:/shots/sh010.ma")["reused"])
+        self.assertFalse(self.client.openScene("C:/shots/sh010.ma",force = True)["reused"])
+
+    def test_listCameras(self):
+        self.client.openScene("/shots/sh010.ma")
+        cameras = self.client.listCameras()
+
+        self.assertEqual([camera["camera"] for camera in cameras],["camA","camB","camC"])
+        self.assertEqual(cameras[2]["timeRange"],[101,130])
+        self.assertAlmostEqual(cameras[0]["estimate"],24 * 0.001)
+        self.assertAlmostEqual(cameras[1]["estimate"],48 * 0.001)
+
+    def test_blastProgress(self):
+        self.client.openScene("/shots/sh010.ma")
+        messages = []
+        result = self.client.blast(cameras = ["camA","camC"],onProgress = messages.append)
+
+        self.assertEqual([camera["status"] for camera in result["cameras"]],["done","failed"])
+        self.assertEqual(len(messages),24 + 30)
+        self.assertEqual(set(message["event"] for message in messages),set(["progress"]))
+        self.assertEqual(set(message["id"] for message in messages),set([self.client.lastId]))
+
+        camCMessages = [message for message in messages if message["camera"] == "camC"]
+        self.assertEqual([message["frame"] for message in camCMessages],list(range(101,131)))
+        self.assertEqual([message["done"] for message in camCMessages],list(range(1,31)))
+        self.assertEqual(set(message["total"] for message in camCMessages),set([30]))
+
+    def test_errors(self):
+        with self.assertRaises(SSCameraSwitcherServer.PlayblastServerError) as context:
+            self.client.request("render")
+        self.assertEqual(str(context.exception),"unknown cmd: render")
+
+        with self.assertRaises(SSCameraSwitcherServer.PlayblastServerError) as context:
+            self.client.blast()
+        self.assertEqual(str(context.exception),"no scene opened")
+
+        self.client.openScene("/shots/sh010.ma")
+        with self.assertRaises(SSCameraSwitcherServer.PlayblastServerError) as context:
+            self.client.blast(cameras = ["camA","camX"])
+        self.assertEqual(str(context.exception),"no camera info: camX")
+
+        self.assertEqual(len(self.client.listCameras()),3)
+
+    def test_errorReply(self):
+        self.client.sock.sendall(SSCameraSwitcherServer.encodeMessage({"id":7,"cmd":"render"}))
+        message = SSCameraSwitcherServer.decodeMessage(self.client.rfile.readline())
+
+        self.assertEqual(message,{"id":7,"event":"error","error":"unknown cmd: render"})
+
+if __name__ == "__main__":
+    unittest.main()
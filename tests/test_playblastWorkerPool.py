@@ -0,0 +1,91 @@
+## python -m pytest tests
+## runs the worker pool against FakeWorkerLauncher, no mayapy needed
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+TESTDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0,os.path.dirname(TESTDIR))
+sys.path.insert(0,os.path.join(os.path.dirname(TESTDIR),"benchmarks"))
+
+import fakeFfmpeg
+import SSCameraSwitcherWorker
+
+class PlayblastWorkerPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpDir = tempfile.mkdtemp()
+        self.manifestPath = os.path.join(self.tmpDir,"jobs","manifest.json")
+        self.resultOrder = []
+
+    def tearDown(self):
+        fakeFfmpeg.uninstall()
+        shutil.rmtree(self.tmpDir)
+
+    def buildJobs(self,timeRanges):
+        return [{"camera":camera,"outputPath":self.tmpDir + "/" + camera,"timeRange":timeRanges[camera]} for camera in sorted(timeRanges)]
+
+    def onResult(self,taskIndex,result):
+        self.resultOrder.append(taskIndex)
+
+    def runPool(self,tasks,failCameras = [],executor = None):
+        SSCameraSwitcherWorker.saveJobManifest(self.manifestPath,{"scene":"fake.ma","tasks":tasks,"fakeFailCameras":failCameras})
+
+        pool = SSCameraSwitcherWorker.PlayblastWorkerPool(
+                                                        self.manifestPath,
+                                                        maxWorkers = 2,
+                                                        launcher = SSCameraSwitcherWorker.FakeWorkerLauncher(),
+                                                        pollInterval = 0.01,
+                                                        onResult = self.onResult,
+                                                        executor = executor
+                                                    )
+        pool.run()
+        return pool
+
+    def test_success(self):
+        pool = self.runPool(self.buildJobs({"camA":[1,5],"camB":[1,3],"camC":[10,10]}))
+
+        results = pool.getResults()
+        self.assertEqual([result["camera"] for result in results],["camA","camB","camC"])
+        self.assertEqual([result["status"] for result in results],["done","done","done"])
+        self.assertEqual([result["frames"] for result in results],[5,3,1])
+        self.assertEqual(sorted(self.resultOrder),[0,1,2])
+        self.assertEqual(pool.assembled,{})
+
+    def test_failingCamera(self):
+        pool = self.runPool(self.buildJobs({"camA":[1,5],"camB":[1,3]}),failCameras = ["camB"])
+
+        results = pool.getResults()
+        self.assertEqual(results[0]["status"],"done")
+        self.assertEqual(results[1]["status"],"failed")
+        self.assertEqual(results[1]["error"],"fake failure")
+        self.assertEqual(results[1]["returnCode"],1)
+
+    @unittest.skipIf(os.name == "nt","fake ffmpeg wrapper is a shell script")
+    def test_assembledMovie(self):
+        fakeFfmpeg.install(self.tmpDir)
+        jobs = self.buildJobs({"camA":[1,10],"camB":[1,3]})
+        tasks = SSCameraSwitcherWorker.chunkPlayblastJobs(jobs,4,"avi")
+
+        pool = self.runPool(list(reversed(tasks)))
+
+        self.assertEqual(pool.assembled,{jobs[0]["outputPath"]:True})
+        with open(jobs[0]["outputPath"] + ".avi","r") as f:
+            chunkNames = [os.path.basename(line.strip().strip("'")) for line in f]
+
+        self.assertEqual(chunkNames,["camA_chunk0001.avi","camA_chunk0002.avi","camA_chunk0003.avi"])
+
+    def test_failedChunkIsNotAssembled(self):
+        jobs = self.buildJobs({"camA":[1,10]})
+        tasks = SSCameraSwitcherWorker.chunkPlayblastJobs(jobs,4,"avi")
+
+        with ThreadPoolExecutor(max_workers = 1) as executor:
+            pool = self.runPool(tasks,failCameras = ["camA"],executor = executor)
+
+        self.assertEqual(pool.assembled,{jobs[0]["outputPath"]:False})
+        self.assertFalse(os.path.isfile(jobs[0]["outputPath"] + ".avi"))
+
+if __name__ == "__main__":
+    unittest.main()
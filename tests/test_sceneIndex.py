@@ -0,0 +1,76 @@
+## python -m pytest tests
+## runs against the in-memory fake maya backend, no maya session needed
+import os
+import sys
+import unittest
+
+TESTDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0,os.path.dirname(TESTDIR))
+sys.path.insert(0,os.path.join(os.path.dirname(TESTDIR),"benchmarks"))
+
+import fakeMaya
+fakeMaya.install(qt = False)
+
+import SSCameraSwitcherCore
+
+class CountingSceneNodeIndex(SSCameraSwitcherCore.SceneNodeIndex):
+    patchCount = 0
+
+    def nodeAdded(self,node):
+        CountingSceneNodeIndex.patchCount += 1
+        return super(CountingSceneNodeIndex,self).nodeAdded(node)
+
+class SceneIndexOpenTest(unittest.TestCase):
+    def setUp(self):
+        fakeMaya.resetUI()
+        fakeMaya.setScene(fakeMaya.buildScene(500,4))
+        self.sceneNodeIndex = SSCameraSwitcherCore.SceneNodeIndex
+        SSCameraSwitcherCore.SceneNodeIndex = CountingSceneNodeIndex
+        CountingSceneNodeIndex.patchCount = 0
+
+    def tearDown(self):
+        SSCameraSwitcherCore.removeSceneIndexCallbacks()
+        SSCameraSwitcherCore.resetSceneIndexSuspend()
+        SSCameraSwitcherCore.SceneNodeIndex = self.sceneNodeIndex
+
+    def test_openSceneSkipsPatching(self):
+        SSCameraSwitcherCore.getSceneIndex()
+        fakeMaya.openScene(fakeMaya.buildScene(800,6))
+
+        self.assertEqual(CountingSceneNodeIndex.patchCount,0)
+        self.assertEqual(SSCameraSwitcherCore._sceneIndex,None)
+
+        cameras = SSCameraSwitcherCore.listTypeNodes("camera")
+        self.assertEqual(sorted(cameras),["shot_cam" + str(i +1).zfill(3) for i in range(0,6)])
+
+    def test_queryDuringOpenIsNotCached(self):
+        SSCameraSwitcherCore.getSceneIndex()
+        SSCameraSwitcherCore.suspendSceneIndex()
+
+        SSCameraSwitcherCore.listTypeNodes("camera")
+        fakeMaya.getScene().addNode("transform","added")
+
+        self.assertEqual(SSCameraSwitcherCore._sceneIndex,None)
+        self.assertEqual(CountingSceneNodeIndex.patchCount,0)
+
+        SSCameraSwitcherCore.resumeSceneIndex()
+        self.assertIn("added",SSCameraSwitcherCore.listTypeNodes("transform"))
+
+    def test_editsAfterOpenArePatched(self):
+        fakeMaya.openScene(fakeMaya.buildScene(300,2))
+        SSCameraSwitcherCore.getSceneIndex()
+        fakeMaya.getScene().addNode("transform","added")
+
+        self.assertEqual(CountingSceneNodeIndex.patchCount,1)
+        self.assertIn("added",SSCameraSwitcherCore.listTypeNodes("transform"))
+
+    def test_cancelledOpenResumes(self):
+        SSCameraSwitcherCore.getSceneIndex()
+        fakeMaya.fireSceneMessage(fakeMaya.MSceneMessage.kBeforeOpen)
+        fakeMaya.runDeferred()
+
+        SSCameraSwitcherCore.getSceneIndex()
+        self.assertNotEqual(SSCameraSwitcherCore._sceneIndex,None)
+
+if __name__ == "__main__":
+    unittest.main()
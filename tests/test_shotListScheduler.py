@@ -0,0 +1,100 @@
+## python -m pytest tests
+## drives ShotListScheduler against fake playblast servers, no mayapy needed
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+TESTDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0,os.path.dirname(TESTDIR))
+
+import SSCameraSwitcherWorker
+
+SCENES = ["/shots/sh010.ma","/shots/sh020.ma"]
+CAMERAS = ["camA","camB","camC"]
+
+class RecordingServerLauncher(SSCameraSwitcherWorker.FakeServerLauncher):
+    def __init__(self,**kwargs):
+        super(RecordingServerLauncher,self).__init__(**kwargs)
+        self.openedScenes = []
+
+    def __call__(self):
+        process,client = super(RecordingServerLauncher,self).__call__()
+        openScene = client.openScene
+
+        def recordOpenScene(scenePath,*args,**kwargs):
+            self.openedScenes.append(scenePath)
+            return openScene(scenePath,*args,**kwargs)
+
+        client.openScene = recordOpenScene
+        return process,client
+
+class ShotListSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.runDir = tempfile.mkdtemp()
+        self.events = []
+
+    def tearDown(self):
+        shutil.rmtree(self.runDir)
+
+    def runScheduler(self,launcher,maxWorkers = 1,maxRetries = 2,resume = False):
+        scheduler = SSCameraSwitcherWorker.ShotListScheduler(
+                                                            SCENES,
+                                                            self.runDir,
+                                                            maxWorkers = maxWorkers,
+                                                            launcher = launcher,
+                                                            maxRetries = maxRetries,
+                                                            resume = resume,
+                                                            onEvent = self.events.append
+                                                        )
+        return scheduler.run()
+
+    def getStatus(self,results):
+        return dict([((result["scene"],result["camera"]),result["status"]) for result in results])
+
+    def getEvents(self,eventName):
+        return [event for event in self.events if event["event"] == eventName]
+
+    def test_sceneAffinity(self):
+        launcher = RecordingServerLauncher(secondsPerFrame = 0.001)
+        results = self.runScheduler(launcher)
+
+        self.assertEqual(set(self.getStatus(results).values()),set(["done"]))
+        self.assertEqual(len(results),len(SCENES) * len(CAMERAS))
+
+        ## every camera of the open scene runs before the worker moves on to plan the next scene
+        self.assertEqual(launcher.openedScenes,SCENES)
+
+        doneScenes = [event["scene"] for event in self.getEvents("done")]
+        self.assertEqual(doneScenes,[SCENES[0]] * len(CAMERAS) + [SCENES[1]] * len(CAMERAS))
+
+    def test_retryExhaustion(self):
+        results = self.runScheduler(SSCameraSwitcherWorker.FakeServerLauncher(failCameras = ["camB"]),maxRetries = 1)
+        status = self.getStatus(results)
+
+        for scenePath in SCENES:
+            self.assertEqual(status[(scenePath,"camA")],"done")
+            self.assertEqual(status[(scenePath,"camB")],"failed")
+            self.assertEqual(status[(scenePath,"camC")],"done")
+
+            failedEvents = [event for event in self.getEvents("failed") if event["scene"] == scenePath]
+            self.assertEqual([event["camera"] for event in failedEvents],["camB","camB"])
+            self.assertEqual([event["attempt"] for event in failedEvents],[0,1])
+            self.assertEqual([event["retry"] for event in failedEvents],[True,False])
+
+        self.assertEqual(self.getEvents("finish")[0]["failed"],len(SCENES))
+
+    def test_resumeSkipsDone(self):
+        self.runScheduler(SSCameraSwitcherWorker.FakeServerLauncher(failCameras = ["camB"]),maxRetries = 0)
+
+        self.events = []
+        results = self.runScheduler(SSCameraSwitcherWorker.FakeServerLauncher(),resume = True)
+
+        self.assertEqual(set(self.getStatus(results).values()),set(["done"]))
+        self.assertEqual(len(results),len(SCENES) * len(CAMERAS))
+        self.assertEqual(self.getEvents("plan"),[])
+        self.assertEqual(sorted((event["scene"],event["camera"]) for event in self.getEvents("done")),[(scenePath,"camB") for scenePath in SCENES])
+
+if __name__ == "__main__":
+    unittest.main()